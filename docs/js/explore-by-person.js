@@ -13,55 +13,6 @@
     window.history.replaceState({}, '', url.toString());
   }
 
-  function normalizeSlugFromPeopleHref(href) {
-    if (!href) return '';
-    var cleaned = href.split('#')[0].split('?')[0];
-    if (cleaned.endsWith('.html')) cleaned = cleaned.slice(0, -5);
-    return cleaned;
-  }
-
-  // Mapping from content person slug -> widget speaker IDs.
-  // Widgets use a few different conventions.
-  var PERSON_WIDGET_MAP = {
-    'abinadi-new': { bubbles: 'abinadi', timeline: 'Abinadi', social: 'Abinadi', connections: 'Abinadi', avatar: 'Abinadi' },
-    'alma-e': { bubbles: 'alma', timeline: 'Alma', social: 'Alma', connections: 'Alma', avatar: 'Alma' },
-    'alma-y-writing': { bubbles: 'alma2', timeline: 'Alma2', social: 'Alma2', connections: 'Alma2', avatar: 'Alma2' },
-    'amaleki': { bubbles: 'amaleki', timeline: 'Amaleki', social: 'Amaleki', connections: 'Amaleki', avatar: 'Amaleki' },
-    'ammon-m': { bubbles: 'ammon1', timeline: 'Ammon', social: 'Ammon', connections: 'Ammon', avatar: 'Ammon' },
-    'ammon-z': { bubbles: 'ammon2', timeline: 'Ammon2', social: 'Ammon2', connections: 'Ammon2', avatar: 'Ammon2' },
-    'ammoron': { bubbles: 'ammoron', timeline: 'Ammoron', social: 'Ammoron', connections: 'Ammoron', avatar: 'Ammoron' },
-    'benjamin-new': { bubbles: 'benjamin', timeline: 'Benjamin', social: 'Benjamin', connections: 'Benjamin', avatar: 'Benjamin' },
-    'brother-jared': { bubbles: 'jared-brother', timeline: 'BrotherJared', social: 'BrotherJared', connections: 'BrotherJared', avatar: 'BrotherJared' },
-    'cap-moroni': { bubbles: 'moroni1', timeline: 'CaptainMoroni', social: 'CaptainMoroni', connections: 'CaptainMoroni', avatar: 'CaptainMoroni' },
-    'christ-america': { bubbles: 'christ', timeline: 'Christ', social: 'Christ', connections: 'ChristAmerica', avatar: 'ChristAmerica' },
-    'enos': { bubbles: 'enos', timeline: 'Enos', social: 'Enos', connections: 'Enos', avatar: 'Enos' },
-    'giddianhi-new': { bubbles: 'giddianhi', timeline: 'Giddianhi', social: 'Giddianhi', connections: 'Giddianhi', avatar: 'Giddianhi' },
-    'gideon': { bubbles: 'gideon', timeline: 'Gideon', social: 'Gideon', connections: 'Gideon', avatar: 'Gideon' },
-    'helaman-a': { bubbles: 'helaman1', timeline: 'Helaman', social: 'Helaman', connections: 'Helaman', avatar: 'Helaman' },
-    'helaman-h': { bubbles: 'helaman2', timeline: 'Helaman2', social: 'Helaman2', connections: 'Helaman2', avatar: 'Helaman2' },
-    'isaiah-bofm': { bubbles: 'isaiah', timeline: 'Isaiah', social: 'Isaiah', connections: 'Isaiah', avatar: 'Isaiah' },
-    'jacob-l': { bubbles: 'jacob', timeline: 'Jacob', social: 'Jacob', connections: 'Jacob', avatar: 'Jacob' },
-    'jarom': { bubbles: 'jarom', timeline: 'Jarom', social: 'Jarom', connections: 'Jarom', avatar: 'Jarom' },
-    'korihor': { bubbles: 'korihor', timeline: 'Korihor', social: 'Korihor', connections: 'Korihor', avatar: 'Korihor' },
-    'lamoni-wife': { avatar: 'WifeLamoni' },
-    'lehi': { bubbles: 'lehi', timeline: 'Lehi', social: 'Lehi', connections: 'Lehi', avatar: 'Lehi' },
-    'limhi': { bubbles: 'limhi', timeline: 'Limhi', social: 'Limhi', connections: 'Limhi', avatar: 'Limhi' },
-    'mormon': { bubbles: 'mormon', timeline: 'Mormon', social: 'Mormon', connections: 'Mormon', avatar: 'Mormon' },
-    'moroni': { bubbles: 'moroni2', timeline: 'Moroni', social: 'Moroni', connections: 'Moroni', avatar: 'Moroni' },
-    'mosiah': { bubbles: 'mosiah', timeline: 'Mosiah', social: 'Mosiah', connections: 'Mosiah', avatar: 'Mosiah' },
-    'nephi-h': { bubbles: 'nephi2', timeline: 'Nephi2', social: 'Nephi2', connections: 'Nephi2', avatar: 'Nephi2' },
-    'nephi-l': { bubbles: 'nephi1', timeline: 'Nephi', social: 'Nephi', connections: 'Nephi', avatar: 'Nephi' },
-    'pahoran': { bubbles: 'pahoran', timeline: 'Pahoran', social: 'Pahoran', connections: 'Pahoran', avatar: 'Pahoran' },
-    'samuel': { bubbles: 'samuel-lamanite', timeline: 'SamuelLamanite', social: 'SamuelLamanite', connections: 'SamuelLamanite', avatar: 'SamuelLamanite' },
-    'sariah': { bubbles: 'sariah', timeline: 'Sariah', social: 'Sariah', connections: 'Sariah', avatar: 'Sariah' },
-    'zeniff': { bubbles: 'zeniff', timeline: 'Zeniff', social: 'Zeniff', connections: 'Zeniff', avatar: 'Zeniff' },
-    'zenos': { bubbles: 'zenos', timeline: 'Zenos', social: 'Zenos', connections: 'Zenos', avatar: 'Zenos' }
-  };
-
-  function getWidgetIdsForSlug(slug) {
-    return PERSON_WIDGET_MAP[slug] || {};
-  }
-
   function escapeText(text) {
     return String(text || '')
       .replace(/&/g, '&amp;')
@@ -78,9 +29,8 @@
     }).join('');
   }
 
-  function buildWidgetList(rootPrefix, slug, tab) {
-    var ids = getWidgetIdsForSlug(slug);
-
+  // `ids` is the person's {widget key: speaker id}, listing only widgets with data for them.
+  function buildWidgetList(rootPrefix, ids, tab) {
     function withSpeaker(url, speaker) {
       if (!speaker) return url;
       var u = new URL(url, window.location.href);
@@ -101,7 +51,7 @@
         title: 'Similar Topic Diagram',
         subtitle: 'Explore how topics cluster together',
         icon: 'fa-diagram-project',
-        src: withSpeaker(rootPrefix + 'widgets/Widgets/SpeakersNetwork/index.html', ids.timeline)
+        src: withSpeaker(rootPrefix + 'widgets/Widgets/SpeakersNetwork/index.html', ids.topic)
       }
     ];
 
@@ -118,7 +68,7 @@
         title: 'Conversation Network',
         subtitle: 'Find who this speaker talked to',
         icon: 'fa-share-nodes',
-        src: withSpeaker(rootPrefix + 'widgets/Widgets/SocialNetwork/index.html', ids.social)
+        src: withSpeaker(rootPrefix + 'widgets/Widgets/SocialNetwork/index.html', ids.conversation)
       },
       {
         key: 'connections',
@@ -129,7 +79,10 @@
       }
     ];
 
-    var list = tab === 'life' ? widgetsLife : widgetsMessage;
+    var list = (tab === 'life' ? widgetsLife : widgetsMessage).filter(function (w) {
+      return Boolean(ids[w.key]);
+    });
+    if (!list.length) return '<p>No visualizations are available for this person.</p>';
 
     return list.map(function (w) {
       return (
@@ -190,28 +143,22 @@
     if (btnLife) btnLife.classList.toggle('is-active', isLife);
   }
 
-  function setAvatar(rootPrefix, slug) {
+  function setAvatar(rootPrefix, avatar) {
     var img = document.getElementById('person-avatar');
     if (!img) return;
 
     img.alt = '';
-
-    var contentImg = rootPrefix + 'content/people/' + slug + '/main.jpg';
-    var ids = getWidgetIdsForSlug(slug);
-    var fallbackKey = ids.avatar || ids.timeline || ids.connections || '';
-    var fallbackImg = fallbackKey ? (rootPrefix + 'widgets/Images/' + fallbackKey + '.jpg') : '';
-
     img.onerror = function () {
-      if (fallbackImg && img.src !== fallbackImg) {
-        img.src = fallbackImg;
-        return;
-      }
       img.removeAttribute('src');
       img.style.display = 'none';
     };
 
+    if (!avatar) {
+      img.onerror();
+      return;
+    }
     img.style.display = '';
-    img.src = contentImg;
+    img.src = /^https?:/.test(avatar) ? avatar : rootPrefix + avatar;
   }
 
   function setSelectedPerson(selectEl, slug) {
@@ -219,45 +166,27 @@
     selectEl.value = slug;
   }
 
+  // data/people/<slug>.json, written by the pages step: {name, avatar, bio, widgets}.
   function loadPerson(rootPrefix, slug, tab) {
     var bioEl = document.getElementById('person-bio');
     var listEl = document.getElementById('widget-list');
     if (!bioEl || !listEl) return;
 
-    setAvatar(rootPrefix, slug);
-
-    var detailsUrl = rootPrefix + 'content/people/' + slug + '/person-details.json';
-    fetch(detailsUrl)
-      .then(function (r) { return r.json(); })
-      .then(function (data) {
-        bioEl.innerHTML = renderBio(data && data.description);
+    fetch(rootPrefix + 'data/people/' + encodeURIComponent(slug) + '.json')
+      .then(function (r) {
+        if (!r.ok) throw new Error('HTTP ' + r.status);
+        return r.json();
+      })
+      .then(function (person) {
+        setAvatar(rootPrefix, person.avatar);
+        bioEl.innerHTML = renderBio(person.bio);
+        listEl.innerHTML = buildWidgetList(rootPrefix, person.widgets || {}, tab);
+        wireAccordions(listEl);
       })
       .catch(function () {
+        setAvatar(rootPrefix, '');
         bioEl.innerHTML = '<p>Biography not available.</p>';
-      })
-      .finally(function () {
-        listEl.innerHTML = buildWidgetList(rootPrefix, slug, tab);
-        wireAccordions(listEl);
-      });
-  }
-
-  function fetchPeopleList(rootPrefix) {
-    // Use the generated People index as a static, runtime-friendly list.
-    var url = rootPrefix + 'people/index.html';
-    return fetch(url)
-      .then(function (r) { return r.text(); })
-      .then(function (html) {
-        var doc = new DOMParser().parseFromString(html, 'text/html');
-        var cards = doc.querySelectorAll('.person-card');
-        var people = [];
-        for (var i = 0; i < cards.length; i++) {
-          var href = cards[i].getAttribute('href');
-          var slug = normalizeSlugFromPeopleHref(href);
-          var nameEl = cards[i].querySelector('.person-name');
-          var name = nameEl ? nameEl.textContent.trim() : slug;
-          if (slug) people.push({ slug: slug, name: name });
-        }
-        return people;
+        listEl.innerHTML = '';
       });
   }
 
@@ -270,7 +199,8 @@
     var tab = getParam('tab') === 'life' ? 'life' : 'message';
     setActiveTab(tab);
 
-    fetchPeopleList(rootPrefix)
+    // The people entries of the prebuilt search index (js/search.js), in People index order.
+    BomexSearch.listItems(rootPrefix, 'people')
       .then(function (people) {
         if (!selectEl) return { people: people, slug: '' };
 
@@ -1,29 +1,7 @@
 (function () {
-  function normalizeSlugFromPeopleHref(href) {
-    if (!href) return '';
-    var cleaned = href.split('#')[0].split('?')[0];
-    if (cleaned.endsWith('.html')) cleaned = cleaned.slice(0, -5);
-    return cleaned;
-  }
-
   function fetchPeopleList() {
-    return fetch('people/index.html')
-      .then(function (r) { return r.text(); })
-      .then(function (html) {
-        var doc = new DOMParser().parseFromString(html, 'text/html');
-        var cards = doc.querySelectorAll('.person-card');
-        var people = [];
-
-        for (var i = 0; i < cards.length; i++) {
-          var href = cards[i].getAttribute('href');
-          var slug = normalizeSlugFromPeopleHref(href);
-          var nameEl = cards[i].querySelector('.person-name');
-          var name = nameEl ? nameEl.textContent.trim() : slug;
-          if (slug) people.push({ slug: slug, name: name });
-        }
-
-        return people;
-      });
+    // Names and slugs from the prebuilt search index (js/search.js).
+    return BomexSearch.listItems('', 'people');
   }
 
   document.addEventListener('DOMContentLoaded', function () {
@@ -1,25 +1,33 @@
 document.addEventListener("DOMContentLoaded", function() {
     const rootPrefix = document.documentElement.getAttribute('data-root') || '';
 
-    // Load Header
-    fetch(rootPrefix + 'header.html')
-        .then(response => response.text())
-        .then(data => {
-            document.querySelector('header').innerHTML = data;
-            applyRootLinks(rootPrefix);
-            initMenu();
-        })
-        .catch(error => console.error('Error loading header:', error));
-
-    // Load Footer
-    fetch(rootPrefix + 'footer.html')
-        .then(response => response.text())
-        .then(data => {
-            document.querySelector('footer').innerHTML = data;
-            applyRootLinks(rootPrefix);
-            updateCopyrightYear();
-        })
-        .catch(error => console.error('Error loading footer:', error));
+    // Pages built by generate_content_pages.py already contain the header/footer; only fetch them
+    // for pages that were not.
+    if (document.querySelector('header').childElementCount) {
+        initMenu();
+    } else {
+        fetch(rootPrefix + 'header.html')
+            .then(response => response.text())
+            .then(data => {
+                document.querySelector('header').innerHTML = data;
+                applyRootLinks(rootPrefix);
+                initMenu();
+            })
+            .catch(error => console.error('Error loading header:', error));
+    }
+
+    if (document.querySelector('footer').childElementCount) {
+        updateCopyrightYear();
+    } else {
+        fetch(rootPrefix + 'footer.html')
+            .then(response => response.text())
+            .then(data => {
+                document.querySelector('footer').innerHTML = data;
+                applyRootLinks(rootPrefix);
+                updateCopyrightYear();
+            })
+            .catch(error => console.error('Error loading footer:', error));
+    }
 
     function applyRootLinks(prefix) {
         document.querySelectorAll('[data-root-href]').forEach(el => {
@@ -0,0 +1,112 @@
+// Client for the search indexes written by scripts/generate_content_pages.py:
+//   search-index.json  items (kind/slug/name/year) + inverted index of name tokens
+//   search-text.json   inverted index of description/fragment tokens (loaded on first full-text query)
+// Terms are sorted, so a query token matches every term it is a prefix of (binary search).
+window.BomexSearch = (function () {
+  var MIN_TEXT_TOKEN = 3;
+  var cache = {};
+
+  function load(url) {
+    if (!cache[url]) {
+      cache[url] = fetch(url).then(function (res) {
+        if (!res.ok) throw new Error('HTTP ' + res.status);
+        return res.json();
+      });
+      cache[url].catch(function () { delete cache[url]; });
+    }
+    return cache[url];
+  }
+
+  // Must match _tokenize in generate_content_pages.py.
+  function tokenize(text) {
+    return String(text || '')
+      .toLowerCase()
+      .normalize('NFKD')
+      .replace(/[\u0300-\u036f]/g, '')
+      .match(/[a-z0-9]+/g) || [];
+  }
+
+  function lowerBound(terms, prefix) {
+    var lo = 0;
+    var hi = terms.length;
+    while (lo < hi) {
+      var mid = (lo + hi) >> 1;
+      if (terms[mid] < prefix) lo = mid + 1;
+      else hi = mid;
+    }
+    return lo;
+  }
+
+  // Items (as {itemNumber: true}) with a term starting with `token`.
+  function prefixMatches(section, token) {
+    var found = {};
+    for (var i = lowerBound(section.terms, token); i < section.terms.length; i++) {
+      if (section.terms[i].lastIndexOf(token, 0) !== 0) break;
+      var postings = section.postings[i];
+      for (var j = 0; j < postings.length; j++) found[postings[j]] = true;
+    }
+    return found;
+  }
+
+  // Items matching every token (null when there are no tokens).
+  function matchAll(section, tokens) {
+    var result = null;
+    for (var i = 0; i < tokens.length; i++) {
+      var found = prefixMatches(section, tokens[i]);
+      if (result) {
+        for (var key in result) if (!found[key]) delete result[key];
+      } else {
+        result = found;
+      }
+    }
+    return result;
+  }
+
+  function loadIndex(rootPrefix) {
+    return load(rootPrefix + 'search-index.json');
+  }
+
+  // Resolve to {slug: true} for the items of `options.kind` matching `query`, or null for an empty
+  // query. With `options.fullText`, items whose text contains every token (of 3+ characters) match too.
+  function search(rootPrefix, query, options) {
+    options = options || {};
+    var tokens = tokenize(query);
+    if (!tokens.length) return Promise.resolve(null);
+
+    var textTokens = tokens.filter(function (t) { return t.length >= MIN_TEXT_TOKEN; });
+    var useText = options.fullText && textTokens.length === tokens.length;
+    return Promise.all([
+      loadIndex(rootPrefix),
+      useText ? load(rootPrefix + 'search-text.json') : null
+    ]).then(function (loaded) {
+      var index = loaded[0];
+      var matched = matchAll(index.names, tokens) || {};
+      if (loaded[1]) {
+        var inText = matchAll(loaded[1], textTokens) || {};
+        for (var key in inText) matched[key] = true;
+      }
+
+      var kind = options.kind ? index.kinds.indexOf(options.kind) : -1;
+      var slugs = {};
+      for (var n in matched) {
+        if (kind === -1 || index.items.kind[n] === kind) slugs[index.items.slug[n]] = true;
+      }
+      return slugs;
+    });
+  }
+
+  // Items of one kind, in index order, as [{slug, name, year}].
+  function listItems(rootPrefix, kind) {
+    return loadIndex(rootPrefix).then(function (index) {
+      var k = index.kinds.indexOf(kind);
+      var items = [];
+      for (var i = 0; i < index.items.slug.length; i++) {
+        if (index.items.kind[i] !== k) continue;
+        items.push({ slug: index.items.slug[i], name: index.items.name[i], year: index.items.year[i] });
+      }
+      return items;
+    });
+  }
+
+  return { tokenize: tokenize, loadIndex: loadIndex, search: search, listItems: listItems };
+})();
@@ -176,6 +176,76 @@
       '</div>';
   }
 
+  // Per-chapter shards written by scripts/build_similar_verses.py, and the index listing them.
+  var shardCache = {};
+  var shardIndex = null;
+
+  function bookSlug(state) {
+    return state.bookKey.replace(/[^a-z0-9]+/g, '-');
+  }
+
+  function shardUrl(rootPrefix, state) {
+    return rootPrefix + 'data/similar-verses/' + bookSlug(state) + '/' + state.chapter + '.json';
+  }
+
+  function loadShardIndex(rootPrefix) {
+    // A missing or unreadable index means no shards: every lookup goes straight to the widget.
+    if (!shardIndex) {
+      shardIndex = fetch(rootPrefix + 'data/similar-verses/index.json').then(function (res) {
+        if (!res.ok) throw new Error('HTTP ' + res.status);
+        return res.json();
+      }).then(function (index) {
+        return (index && index.chapters) || {};
+      }).catch(function () {
+        return {};
+      });
+    }
+    return shardIndex;
+  }
+
+  function hasShard(chapters, state) {
+    var listed = chapters[bookSlug(state)];
+    return !!listed && listed.indexOf(state.chapter) >= 0;
+  }
+
+  function loadShard(url) {
+    if (!shardCache[url]) {
+      shardCache[url] = fetch(url).then(function (res) {
+        if (!res.ok) throw new Error('HTTP ' + res.status);
+        return res.json();
+      });
+      shardCache[url].catch(function () { delete shardCache[url]; });
+    }
+    return shardCache[url];
+  }
+
+  function renderResults(container, rootPrefix, state, reference) {
+    var token = container.svfToken = {};
+    container.innerHTML = '';
+    loadShardIndex(rootPrefix).then(function (chapters) {
+      if (!hasShard(chapters, state)) throw new Error('no shard');
+      return loadShard(shardUrl(rootPrefix, state));
+    }).then(function (shard) {
+      if (container.svfToken !== token) return;
+      var row = shard.verses.indexOf(state.verse);
+      if (row < 0) throw new Error('verse not in shard');
+
+      var items = shard.neighbors.slice(shard.offsets[row], shard.offsets[row + 1]).map(function (n) {
+        return '<details class="list-row svf-result"><summary>' + escapeText(shard.refs[n]) + '</summary>' +
+          '<p>' + escapeText(shard.texts[n]) + '</p></details>';
+      }).join('');
+
+      container.innerHTML = '<h2 class="svf-heading">' + escapeText(reference) + '</h2>' +
+        '<p>' + escapeText(shard.texts[row]) + '</p>' +
+        '<h2 class="svf-heading">Similar Verses</h2>' +
+        '<div class="list">' + items + '</div>';
+    }).catch(function () {
+      if (container.svfToken !== token) return;
+      // No shard published (or loadable) for this chapter: fall back to the full widget.
+      renderWidget(container, rootPrefix, reference);
+    });
+  }
+
   document.addEventListener('DOMContentLoaded', function () {
     var rootPrefix = getRootPrefix();
     var inputEl = document.getElementById('svf-input');
@@ -190,6 +260,7 @@
 
     function setState(next) {
       state = clampState(next);
+      panelEl.svfToken = null;
 
       if (!state.bookKey) {
         inputEl.value = '';
@@ -207,7 +278,7 @@
         var ref = prettyRef(state);
         inputEl.value = ref;
         setQueryParam('reference', ref);
-        renderWidget(panelEl, rootPrefix, ref);
+        renderResults(panelEl, rootPrefix, state, ref);
         return;
       }
 
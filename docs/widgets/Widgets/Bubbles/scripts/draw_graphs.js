@@ -526,6 +526,29 @@ function updateChartTitle() {
 
     imageString = urlBase + state.currentDataSet + ".jpg"
     document.getElementById('speaker-image').setAttribute('src', imageString)
+    setDerivedSrcset(document.getElementById('speaker-image'), urlBase, state.currentDataSet + ".jpg")
+}
+
+// Resized copies written by scripts/build_image_derivatives.py, keyed by source file name.
+let derivedImages = {};
+fetch('/Widgets/Bubbles/images/derived/manifest.json')
+    .then(res => res.ok ? res.json() : null)
+    .then(manifest => {
+        derivedImages = (manifest && manifest.images) || {};
+        if (state.currentDataSet) updateChartTitle();
+    })
+    .catch(() => {});
+
+function setDerivedSrcset(image, urlBase, file) {
+    const entry = derivedImages[file];
+    if (!entry) {
+        image.removeAttribute('srcset');
+        return;
+    }
+    // The last format is the source's own (jpg/png), which every browser can show.
+    const format = entry.formats[entry.formats.length - 1];
+    image.setAttribute('srcset', entry.widths.map(w => `${urlBase}derived/${entry.hash}-${w}.${format} ${w}w`).join(', '));
+    image.setAttribute('sizes', '100px');
 }
 
 function updateStats() {
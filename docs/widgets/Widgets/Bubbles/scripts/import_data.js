@@ -5,7 +5,53 @@
 When you inevitably run into problems with this, you'll need to change lines 9 and 26. 
 */
 
+// Compiled per-speaker payloads (scripts/compile_widget_data.py): all three charts in one request,
+// fetched and parsed once per speaker.
+const compiledSpeakers = {};
+
+function getCompiledSpeaker(dataset) {
+  if (!(dataset in compiledSpeakers)) {
+    const req = new XMLHttpRequest();
+    req.open("GET", `json/compiled/${dataset.toLowerCase()}.json`, false);
+    req.send(null);
+    compiledSpeakers[dataset] = req.status === 200 ? JSON.parse(req.response) : null;
+  }
+  return compiledSpeakers[dataset];
+}
+
+const internedFields = {
+  name: 'words',
+  partOfSpeech: 'pos',
+  sourceText: 'texts',
+  sourceReference: 'refs',
+  theme: 'themes'
+};
+
+function decodeChart(payload, chartType) {
+  const chart = payload.charts[chartType];
+  const urls = new Map(chart.url || []);
+  const extra = new Map(chart.extra || []);
+  const children = [];
+  for (let row = 0; row < chart.name.length; row++) {
+    const child = {};
+    for (const field in internedFields) {
+      const index = chart[field] ? chart[field][row] : -1;
+      if (index !== -1) child[field] = payload[internedFields[field]][index];
+    }
+    if (chart.size[row] !== null) child.size = chart.size[row];
+    child.url = urls.has(row) ? urls.get(row) : payload.urlPrefix + String(child.name || '').toLowerCase();
+    Object.assign(child, extra.get(row));
+    children.push(child);
+  }
+  return { children };
+}
+
 function getChartData(dataset, chartType) {
+  const compiled = getCompiledSpeaker(dataset);
+  if (compiled && compiled.charts[chartType]) {
+    return decodeChart(compiled, chartType);
+  }
+
   const urlBase = '/Widgets/Bubbles/json/json'; // Online Server
   // const urlBase = './graphs/json/json'; // local Server
   const url = `${location.origin}/${urlBase}/${dataset}/${chartType}.json`; 
@@ -1,95 +1,3 @@
-let relationshipData = [{name: 'Aaron', relations: [{name: 'Alma', connection: "Aaron was friends with Alma's son, Alma the Younger, and the three went on a mission together.", type: 'Associate'}, {name: 'Alma2', connection: 'Aaron and Alma the Younger were friends and went on missions together.', type: 'Associate'}, {name: 'Ammon', connection: 'Aaron and Ammon were brothers and served missions together.', type: 'Family'}, {name: 'Amulek', connection: 'Aaron and Amulek went on a mission to the Zoramites together.', type: 'Associate'}, {name: 'Angels', connection: 'Aaron saw an angel when Alma the Younger was struck down.', type: 'Divine'}, {name: 'AntiNephiLehi', connection: 'Anti-Nephi-Lehi counseled with Aaron and others about how to defend against the Lamanites.', type: 'Associate'}, {name: 'Benjamin', connection: "Benjamin was Aaron's grandfather.", type: 'Family'}, {name: 'FatherLamoni', connection: "Lamoni's father was converted to the gospel through the teachings of Aaron and some of his brothers.", type: 'Associate'}, {name: 'Lamoni', connection: 'Lamoni, Aaron, and others counseled together about how to defend against the Lamanites.', type: 'Associate'}, {name: 'Mosiah', connection: 'Aaron was one of the sons of Mosiah.', type: 'Family'}, {name: 'Satan', connection: "Aaron went about with his brothers and Alma the Younger teaching Satan's doctrine, before he was converted to the gospel.", type: 'Associate'}, {name: 'Zeezrom', connection: 'Aaron and Zeezrom went on a mission to the Zoramites together.', type: 'Associate'}]}, {name: 'Abinadi', relations: [{name: 'Alma', connection: "Abinadi testified of Christ in King Noah's court, which resulted in Alma's conversion to the gospel.", type: 'Associate'}, {name: 'Noah', connection: 'Abinadi was sentenced to death by King Noah after testifying of Christ in his court.', type: 'Enemy'}]},
-{name: 'Abinadom', relations: [{name: 'Amaleki', connection: "Abinadom was Amaleki's father.", type: 'Family'}, {name: 'Amaron', connection: "Abinadom was Amaron's nephew.", type: 'Family'}, {name: 'Chemish', connection: 'Abinadom was the son of Chemish.', type: 'Family'}]},
-{name: 'Akish', relations: [{name: 'Jared2', connection: 'Akish killed Jared after marrying his daughter.', type: 'Enemy'}, {name: 'DaughterJared', connection: 'Akish married the daughter of Jared Son of Omer.', type: 'Family'}, {name: 'Satan', connection: 'Akish dug up the secret oaths and combinations in order to murder Jared Son of Omer because Satan put it into his heart to do so.', type: 'Associate'}]},
-{name: 'Alma', relations: [{name: 'Aaron', connection: "Alma and Aaron went on a mission together. Alma was the father of Alma the Younger, who was Aaron's friend.", type: 'Associate'}, {name: 'Abinadi', connection: "Alma was converted as a result of Abinadi's testimony in King Noah's court.", type: 'Associate'}, {name: 'Alma2', connection: "Alma was Alma the Younger's father.", type: 'Family'}, {name: 'Godhead', connection: 'The Lord spoke to Alma, promising him eternal life.', type: 'Divine'}, {name: 'Helaman', connection: "Alma was Helaman's grandfather.", type: 'Family'}, {name: 'Limhi', connection: 'Alma baptized Limhi after preaching to him and his people.', type: 'Associate'}, {name: 'Noah', connection: "Alma was a priest in King Noah's court before he was converted.", type: 'Associate'}]},
-{name: 'Alma2', relations: [{name: 'Aaron', connection: 'Alma the Younger and Aaron were friends and went on missions together.', type: 'Associate'}, {name: 'Alma', connection: "Alma the Younger was Alma's son.", type: 'Family'}, {name: 'Ammon', connection: 'Alma the Younger and Ammon were friends and went on missions together.', type: 'Associate'}, {name: 'Amulek', connection: 'Alma the Younger and Amulek were mission companions.', type: 'Associate'}, {name: 'Angels', connection: 'Alma the Younger was converted as a result of an angel visiting and chastising him.', type: 'Divine'}, {name: 'Antionah', connection: "Alma the Younger answered Antionah's question about resurrection.", type: 'Associate'}, {name: 'Helaman', connection: "Alma the Younger was Helaman's father.", type: 'Family'}, {name: 'Helaman2', connection: 'Alma the Younger was grandfather to Helaman, Son of Helaman.', type: 'Family'}, {name: 'Korihor', connection: "Alma the Younger struck Korihor dumb as a sign of God's power, after hearing him preach false doctrine.", type: 'Enemy'}, {name: 'Mosiah', connection: 'Alma the Younger became the first chief judge after Mosiah stepped down from the throne.', type: 'Associate'}, {name: 'Nephihah', connection: 'Alma the Younger delivered up the judgment-seat to Nephihah.', type: 'Associate'}, {name: 'Satan', connection: "Alma the Younger and the sons of Mosiah went about teaching Satan's doctrine before they were converted to the Lord.", type: 'Associate'}, {name: 'Zeezrom', connection: "Alma and Amulek bore testimony of the gospel to Zeezrom. After Zeezrom's conversion, they went on missions together.", type: 'Associate'}]},
-{name: 'Amaleki', relations: [{name: 'Abinadom', connection: "Amaleki was Abinadom's son.", type: 'Family'}, {name: 'Benjamin', connection: 'Amaleki gave the plates to Benjamin before he died.', type: 'Associate'}, {name: 'Chemish', connection: "Amaleki was Chemish's grandson.", type: 'Family'}]},
-{name: 'Amalickiah', relations: [{name: 'Ammoron', connection: 'Amalickiah and Ammoron were brothers.', type: 'Family'}, {name: 'CaptainMoroni', connection: "Amalickiah waged a war against the Nephites and swore to drink Captain Moroni's blood.", type: 'Enemy'}, {name: 'Gid', connection: 'Amalickiah and his brother fought against the Nephite army, of which, Gid was one of the leaders.', type: 'Enemy'}, {name: 'Helaman', connection: 'Amalickiah fought against the Nephite army led by Helaman.', type: 'Enemy'}, {name: 'Laman2', connection: "Amalickiah's army fought against the Nephite army that Laman was a soldier and spy for.", type: 'Enemy'},{name: 'Lehi3', connection: 'Amalickiah and his brother fought against the Nephite army, of which, Lehi was one of the leaders.', type: 'Enemy'}, {name: 'Pahoran', connection: 'Amalickiah and Ammoron fought against Pahoran and his people.', type: 'Enemy'}, {name: 'Satan', connection: "Satan had great hold on Amalickiah's heart.", type: 'Associate'}]},
-{name: 'Amaron', relations: [{name: 'Abinadom', connection: "Amaron was Abinadom's uncle.", type: 'Family'}, {name: 'Chemish', connection: "Amaron was Chemish's brother.", type: 'Family'}, {name: 'Godhead', connection: 'Amaron quoted the Lord in his brief writings.', type: 'Divine'}, {name: 'Jarom', connection: "Amaron was Jarom's grandson.", type: 'Family'}, {name: 'Omni', connection: "Amaron was Omni's son.", type: 'Family'}]},
-{name: 'Aminadab', relations: [{name: 'Angels', connection: 'Angels came and ministered to Aminadab and the other Lamanites when Nephi and Lehi were surrounded by fire.', type: 'Divine'}, {name: 'Godhead', connection: "The Holy Spirit entered into Aminidab's heart.", type: 'Divine'}, {name: 'Lehi2', connection: 'After the experience with Lehi and Nephi being surrounded by fire, Aminadab was brought back to the faith.', type: 'Associate'}, {name: 'Nephi2', connection: 'After the experience with Nephi and Lehi being surrounded by fire, Aminadab was brought back to the faith.', type: 'Associate'}]},
-{name: 'Ammaron', relations: [{name: 'Mormon', connection: 'Ammaron told Mormon where to find the sacred records so he could continue writing the Nephite record.', type: 'Associate'}]},
-{name: 'Ammon', relations: [{name: 'Aaron', connection: 'Ammon and Aaron were brothers and served missions together.', type: 'Family'}, {name: 'Alma2', connection: 'Ammon and Alma the Younger were friends and went on missions together.', type: 'Associate'}, {name: 'Amulek', connection: 'Ammon and Amulek went on a mission to the Zoramites together.', type: 'Associate'}, {name: 'Angels', connection: 'Ammon, his brothers, and Alma the Younger were converted to the gospel when they saw an angel.', type: 'Divine'}, {name: 'AntiNephiLehi', connection: 'Ammon and others counseled with Anti-Nephi-Lehi about how to defend against the Lamanites.', type: 'Associate'}, {name: 'Benjamin', connection: "Ammon was Benjamin's grandson.", type: 'Family'}, {name: 'FatherLamoni', connection: "Ammon contended with Lamoni's father on the way to rescue his brothers from prison.", type: 'Associate'}, {name: 'Lamoni', connection: 'Ammon helped convert Lamoni and his kingdom to the faith.', type: 'Associate'}, {name: 'Mosiah', connection: "Ammon was Mosiah's son.", type: 'Family'}, {name: 'Satan', connection: "Ammon went about with his brothers and Alma the Younger teaching Satan's doctrine before they were converted to the Lord.", type: 'Associate'}, {name: 'Zeezrom', connection: 'Ammon and Zeezrom went on a mission to the Zoramites together.', type: 'Associate'}]},
-{name: 'Ammon2', relations: [{name: 'Limhi', connection: "Ammon found, taught, and helped deliver Limhi and his people.", type: 'Associate'}, {name: 'Mosiah', connection: "Ammon the Mulekite petitioned Mosiah so Limhi's people could come live with the people of Zarahemla.", type: 'Associate'}]},
-{name: 'Ammoron', relations: [{name: 'Amalickiah', connection: 'Ammoron and Amalickiah were brothers.', type: 'Family'}, {name: 'CaptainMoroni', connection: 'Ammoron took over the war against Captain Moroni and the Nephites when Amalickiah was killed.', type: 'Enemy'}, {name: 'Gid', connection: 'Ammoron and his brother fought against the Nephite army, over which Gid was a leader.', type: 'Enemy'}, {name: 'Helaman', connection: "Helaman was a leader in Captain Moroni's army when they fought against Amalickiah and his brother. Helaman led 2,000 stripling warriors under Moroni's command.", type: 'Enemy'}, {name: 'Laman2', connection: 'Ammoron and his brother fought against the Nephite army, for which Laman was a soldier and spy.', type: 'Enemy'}, {name: 'Lehi3', connection: 'Ammoron and his brother fought against the Nephite army, over which Lehi was a commander.', type: 'Enemy'}, {name: 'Pahoran', connection: 'Amalickiah and Ammoron fought against Pahoran and his people.', type: 'Enemy'}, {name: 'Satan', connection: "Satan had great hold on Ammoron's heart.", type: 'Associate'}]},
-{name: 'Amulek', relations: [{name: 'Aaron', connection: 'Amulek and Aaron went on a mission to the Zoramites together.', type: 'Associate'}, {name: 'Alma2', connection: 'Amulek and Alma the Younger were mission companions.', type: 'Associate'}, {name: 'Ammon', connection: 'Amulek and Ammon went on a mission to the Zoramites together.', type: 'Associate'}, {name: 'Angels', connection: 'Amulek saw an angel who told him to care for Alma.', type: 'Divine'}, {name: 'Antionah', connection: "Amulek answered Antionah's question about resurrection.", type: 'Associate'}, {name: 'Giddonah2', connection: "Amulek was Giddonah's son.", type: 'Family'}, {name: 'Zeezrom', connection: "Amulek and Alma taught the gospel to Zeezrom. After Zeezrom's conversion, they all went on missions together.", type: 'Associate'}]},
-{name: 'Angels', relations: [{name: 'Aaron', connection: 'An angel chastised Aaron, his brothers, and Alma the Younger for destroying the Church. This experience helped convert them to the gospel.', type: 'Divine'}, {name: 'Alma2', connection: 'An angel visited Alma the Younger and chastised him, after which he was converted to the gospel.', type: 'Divine'}, {name: 'Aminadab', connection: 'Angels came and ministered to Aminadab and the other Lamanites when Nephi and Lehi were surrounded by fire.', type: 'Divine'}, {name: 'Ammon', connection: 'An angel chastised Ammon, his brothers, and Alma the Younger for destroying the Church, after which they were converted to the gospel.', type: 'Divine'}, {name: 'Amulek', connection: 'An angel visited Amulek and told him to care for Alma.', type: 'Divine'}, {name: 'Benjamin', connection: 'An angel visited King Benjamin and commanded him to speak to his people.', type: 'Divine'}, {name: 'BrothersNephi', connection: 'An angel rebuked Laman and Lemuel for beating Sam and Nephi.', type: 'Divine'}, {name: 'ChristAmerica', connection: 'Christ and His angels ministered to the Nephites in the Americas.', type: 'Divine'}, {name: 'Godhead', connection: 'God works through angels.', type: 'Divine'}, {name: 'Isaiah', connection: 'Isaiah was a prophet of God and had many visions.', type: 'Divine'}, {name: 'Jacob', connection: 'Jacob had angels minister to him and had many visions.', type: 'Divine'}, {name: 'Lamoni', connection: 'An angel visited and taught Lamoni while he was unconscious.', type: 'Divine'}, {name: 'Lehi', connection: 'Lehi saw and talked with angels in a vision.', type: 'Divine'}, {name: 'Nephi', connection: 'Nephi saw a vision that was narrated by an angel. Another angel intervened when Laman and Lemuel were beating Nephi and Sam.', type: 'Divine'}, {name: 'Nephi2', connection: 'Nephi and Lehi conversed with angels while surrounded by heavenly fire.', type: 'Divine'},{name: 'Lehi2', connection: 'Lehi and Nephi conversed with angels while surrounded by heavenly fire.', type: 'Divine'}, {name: 'SamuelLamanite', connection: 'An angel spoke to Samuel, declaring glad tidings; he also said that destruction awaited the Nephites unless they repented.', type: 'Divine'}, {name: 'Satan', connection: 'Satan was among the angels in the preexistence and is at war with the angels of heaven.', type: 'Divine'}]},
-{name: 'AntiNephiLehi', relations: [{name: 'Aaron', connection: ' Anti-Nephi-Lehi counseled with Aaron and others about how to defend against the Lamanites.', type: 'Associate'}, {name: 'Ammon', connection: ' Anti-Nephi-Lehi counseled with Ammon and others about how to defend against the Lamanites.', type: 'Associate'}, {name: 'FatherLamoni', connection: "Lamoni's father was also Anti-Nephi-Lehi's father.", type: 'Family'}, {name: 'Lamoni', connection: 'Anti-Nephi-Lehi and Lamoni were brothers.', type: 'Family'}]},
-{name: 'Antionah', relations: [{name: 'Alma2', connection: 'Antionah questioned Alma the Younger and Amulek about resurrection.', type: 'Associate'}, {name: 'Amulek', connection: 'Antionah questioned Alma the Younger and Amulek about resurrection.', type: 'Associate'}]},
-{name: 'Benjamin', relations: [{name: 'Aaron', connection: "Benjamin was Aaron's grandfather.", type: 'Family'}, {name: 'Amaleki', connection: 'Benjamin received the plates from Amaleki before Amaleki died.', type: 'Associate'}, {name: 'Ammon', connection: "Benjamin was Ammon's grandfather.", type: 'Family'}, {name: 'Angels', connection: 'Benjamin saw an angel who commanded him to speak to his people.', type: 'Divine'}, {name: 'Mosiah', connection: "Benjamin was Mosiah's father. Benjamin's father was also named Mosiah.", type: 'Family'}]},
-{name: 'BrotherJared', relations: [{name: 'Godhead', connection: "After the brother of Jared had faith enough to see Christ's finger, Christ showed Himself to him.", type: 'Divine'}, {name: 'Jared', connection: "The brother of Jared was Jared's brother.", type: 'Family'}]},
-{name: 'BrothersNephi', relations: [{name: 'Angels', connection: 'An angel rebuked Laman and Lemuel for hitting Sam and Nephi.', type: 'Divine'}, {name: 'Jacob', connection: "Laman and Lemuel were Jacob's brothers.", type: 'Family'}, {name: 'Joseph2', connection: "Laman and Lemuel were Joseph's brothers.", type: 'Family'}, {name: 'Laban', connection: 'Laman and his brothers took the brass plates from Laban, who tried to kill them in the process.', type: 'Enemy'}, {name: 'Lehi', connection: "Laman and Lemuel were Lehi's sons.", type: 'Family'}, {name: 'Nephi', connection: "Laman and Lemuel were Nephi's brothers.", type: 'Family'}, {name: 'Sariah', connection: "Laman and Lemuel were Sariah's sons.", type: 'Family'}, {name: 'Satan', connection: "Satan had a hold on Laman's and Lemuel's hearts.", type: 'Associate'}]},
-{name: 'CaptainMoroni', relations: [{name: 'Amalickiah', connection: 'Captain Moroni defended the Nephites against Amalickiah.', type: 'Enemy'}, {name: 'Ammoron', connection: 'Captain Moroni defended the Nephites against Ammoron after Amalickiah was killed.', type: 'Enemy'}, {name: 'Gid', connection: "Gid was a leader of one of Captain Moroni's armies.", type: 'Associate'}, {name: 'Helaman', connection: "Helaman was a leader of one of Captain Moroni's armies when they fought against Amalickiah and his brother. He led the 2,000 stripling warriors under Moroni's command.", type: 'Associate'}, {name: 'Laman2', connection: "Laman was a soldier in Captain Moroni's army when they fought against Amalickiah and Ammoron.", type: 'Associate'}, {name: 'Lehi3', connection: 'Lehi was a commander under Captain Moroni in the war against Amalickiah and his brother.', type: 'Associate'}, {name: 'Pahoran', connection: 'Captain Moroni was leader of the Nephite armies when Pahoran was chief judge, and they fought together against Ammoron and Amalickiah.', type: 'Associate'}, {name: 'Zerahemnah', connection: 'Captain Moroni fought against Zerahemna and the Lamanite armies.', type: 'Enemy'}]},
-{name: 'Chemish', relations: [{name: 'Abinadom', connection: "Chemish was Abinadom's father.", type: 'Family'}, {name: 'Amaleki', connection: "Chemish was Amaleki's grandfather.", type: 'Family'}, {name: 'Amaron', connection: "Chemish was Amaron's brother.", type: 'Family'}, {name: 'Omni', connection: "Chemish was Omni's son.", type: 'Family'}]},
-{name: 'ChristAmerica', relations: [{name: 'Angels', connection: 'Christ and His angels ministered to the Nephites in the Americas.', type: 'Divine'}, {name: 'Godhead', connection: 'Christ is part of the Godhead. He was introduced to the Nephites by God the Father saying, "Behold my Beloved Son ..."', type: 'Divine'}, {name: 'SamuelLamanite', connection: "Christ's birth and death were foretold by Samuel.", type: 'Divine'}, {name: 'Satan', connection: 'Christ and Satan are at odds, with Christ fighting for our salvation and Satan fighting against it.', type: 'Enemy'}]},
-{name: 'DaughterJared', relations: [{name: 'Jared2', connection: 'This woman was Jared\'s daughter.', type: 'Family'}, {name: 'Akish', connection: 'The daughter of Jared married Akish.', type: 'Family'}]},
-{name: 'Enos', relations: [{name: 'Godhead', connection: 'Enos prayed to God for forgiveness of his sins.', type: 'Divine'}, {name: 'Jacob', connection: "Enos was Jacob's son.", type: 'Family'}, {name: 'Jarom', connection: "Enos was Jarom's father.", type: 'Family'}, {name: 'Lehi', connection: "Enos was Lehi's grandson.", type: 'Family'}, {name: 'Omni', connection: "Enos was Omni's grandfather.", type: 'Family'}, {name: 'Sariah', connection: "Enos was Sariah's grandson.", type: 'Family'}]},
-{name: 'Ether', relations: [{name: 'Godhead', connection: 'Ether spoke to God as His prophet.', type: 'Divine'}]},
-{name: 'FatherLamoni', relations: [{name: 'Aaron', connection: "Lamoni's father was converted to the gospel through the teachings of Aaron and his brothers.", type: 'Associate'}, {name: 'Ammon', connection: "Lamoni's father fought Ammon when Ammon went to rescue his brothers from prison.", type: 'Enemy'}, {name: 'AntiNephiLehi', connection: "Lamoni's father was also Anti-Nephi-Lehi's father.", type: 'Family'}, {name: 'Godhead', connection: "Lamoni's father prayed to God for forgiveness of his sins.", type: 'Divine'}, {name: 'Lamoni', connection: "Lamoni was the son of this man.", type: 'Family'}, {name: 'Satan', connection: "Satan influenced Lamoni's father before his conversion.", type: 'Associate'}]},
-{name: 'Gid', relations: [{name: 'Amalickiah', connection: 'Gid was a leader of the Nephite army that Amalickiah and his brother fought against.', type: 'Enemy'}, {name: 'Ammoron', connection: 'Gid was a leader of the Nephite army that Ammoron and his brother fought against.', type: 'Enemy'}, {name: 'CaptainMoroni', connection: "Gid was a leader of one of Captain Moroni's armies.", type: 'Associate'}, {name: 'Helaman', connection: 'Gid and Helaman were fellow army commanders serving under Captain Moroni.', type: 'Associate'}, {name: 'Lehi3', connection: 'Gid and Lehi were fellow army commanders serving under Captain Moroni.', type: 'Associate'}]},
-{name: 'Giddianhi', relations: [{name: 'Gidgiddoni', connection: 'Giddianhi and his robbers were defeated by Gidgiddoni and the Nephite army.', type: 'Enemy'}, {name: 'Lachoneus', connection: 'Giddianhi and his robbers were defeated by Lachoneus and his Nephite army.', type: 'Enemy'}, {name: 'Satan', connection: "Satan had a great hold on Giddianhi's heart and gave him the secret combinations.", type: 'Associate'}]},
-{name: 'Giddonah', relations: [{name: 'Korihor', connection: 'Giddonah was a priest who examined Korihor before he was brought before Alma the Younger.', type: 'Enemy'}]},
-{name: 'Giddonah2', relations: [{name: 'Amulek', connection: "Giddonah was Amulek's father.", type: 'Family'}]},
-{name: 'Gideon', relations: [{name: 'Limhi', connection: "Gideon was captain of Limhi's armies and helped organize the escape of Limhi's people from bondage.", type: 'Associate'}, {name: 'Noah', connection: 'Gideon tried to kill King Noah as part of a rebellion.', type: 'Enemy'}]},
-{name: 'Gidgiddoni', relations: [{name: 'Giddianhi', connection: 'Gidgiddoni was a leader of the Nephite army who defeated Giddianhi and his robbers.', type: 'Enemy'}, {name: 'Lachoneus', connection: 'Gidgiddoni served as a chief captain under Lachoneus when fighting the Gaddianton robbers.', type: 'Associate'}]},
-{name: 'Godhead', relations: [{name: 'Alma', connection: 'The Lord spoke to Alma, promising him eternal life.', type: 'Divine'}, {name: 'Aminadab', connection: "The Holy Spirit entered into Aminidab's heart.", type: 'Divine'}, {name: 'Angels', connection: 'God works through angels.', type: 'Divine'}, {name: 'BrotherJared', connection: "Christ showed Himself to the brother of Jared after he had faith enough to see Christ's finger.", type: 'Divine'}, {name: 'ChristAmerica', connection: 'During his ministry in the new world, Christ prayed to the Father.', type: 'Divine'}, {name: 'Enos', connection: 'God spoke to Enos, forgiving his sins.', type: 'Divine'}, {name: 'Ether', connection: 'The Lord spoke to Ether as his prophet.', type: 'Divine'}, {name: 'FatherLamoni', connection: "Lamoni's father prayed to God for forgiveness of his sins.", type: 'Divine'}, {name: 'Jacob2', connection: 'Jacob was a prophet of God, and progenitor of His chosen people.', type: 'Divine'}, {name: 'Jacob', connection: 'Jacob saw the Lord in a vision and was a prophet of God.', type: 'Divine'}, {name: 'Jared', connection: 'The Lord guided Jared, his brother, and their people to the promised land.', type: 'Divine'}, {name: 'Joshua', connection: 'Joshua was a prophet of the Lord.', type: 'Divine'}, {name: 'Lehi', connection: 'Lehi was a prophet of God and saw God and Jesus in a vision.', type: 'Divine'}, {name: 'Malachi', connection: 'Malachi was a prophet of God.', type: 'Divine'}, {name: 'Micah', connection: 'Micah was a prophet of God.', type: 'Divine'}, {name: 'Mormon', connection: 'Mormon was a prophet of God; God and Jesus ministered to him and his son, Moroni.', type: 'Divine'}, {name: 'Moroni', connection: 'Moroni was a prophet of God; God and Jesus ministered to him and his father, Mormon.', type: 'Divine'}, {name: 'Moses', connection: 'Moses was a prophet of God. God showed him a vision of everything in the world from beginning to end.', type: 'Divine'}, {name: 'Mosiah', connection: 'Mosiah was a prophet of God.', type: 'Divine'}, {name: 'Nephi', connection: 'Nephi was a prophet of God and had a vision of Christ.', type: 'Divine'}, {name: 'Nephi2', connection: 'Nephi Son of Helaman was a prophet and father of the Nephi whom Christ chose as an apostle among the Nephites.', type: 'Divine'}, {name: 'SamuelLamanite', connection: 'The Lord told Samuel to turn back after being rejected in Zarahemla and told him what to preach to the Nephites.', type: 'Divine'}, {name: 'Satan', connection: 'The Godhead and Satan are at war with each other.', type: 'Divine'}, {name: 'Sherem', connection: 'The Lord struck Sherem to the earth as a sign of His power.', type: 'Divine'}, {name: 'Zenock', connection: 'Zenock was a prophet of God.', type: 'Divine'}, {name: 'Zenos', connection: 'Zenos was a prophet of God.', type: 'Divine'}]},
-{name: 'Helaman', relations: [{name: 'Alma', connection: "Helaman was Alma's grandson.", type: 'Family'}, {name: 'Alma2', connection: "Helaman was Alma the Younger's son.", type: 'Family'}, {name: 'Amalickiah', connection: 'Helaman was one of the generals fighting in the war against Amalickiah.', type: 'Enemy'}, {name: 'Ammoron', connection: "Helaman was a leader in Captain Moroni's army when they fought against Amalickiah and his brother, Ammoron.", type: 'Enemy'}, {name: 'CaptainMoroni', connection: "Helaman was a leader in Captain Moroni's army when they fought against Amalickiah and his brother. Helaman led the 2,000 stripling warriors under Moroni's command.", type: 'Associate'}, {name: 'Gid', connection: 'Helaman and Gid were fellow army commanders serving under Captain Moroni.', type: 'Associate'}, {name: 'Helaman2', connection: "Helaman was Helaman's father.", type: 'Family'},{name: 'Lehi2', connection: "Helaman was Lehi's grandfather.", type: 'Family'}, {name: 'Nephi2', connection: "Helaman was Nephi's grandfather.", type: 'Family'}]},
-{name: 'Helaman2', relations: [{name: 'Alma2', connection: "Helaman was Alma the Younger's grandson.", type: 'Family'}, {name: 'Helaman', connection: "Helaman was the Son of Helaman (Alma the Younger's son).", type: 'Family'}, {name: 'Lehi2', connection: "Helaman Son of Helaman was Lehi's father.", type: 'Family'}, {name: 'Nephi2', connection: "Helaman Son of Helaman was Nephi's father.", type: 'Family'}]},
-{name: 'Isaiah', relations: [{name: 'Godhead', connection: 'Isaiah was a prophet of God who had many visions of the Godhead.', type: 'Divine'}]},
-{name: 'Jacob2', relations: [{name: 'Godhead', connection: 'Jacob was a prophet of God and had a vision of the Savior.', type: 'Divine'}, {name: 'Joseph', connection: "Jacob was Joseph's father.", type: 'Family'}]},
-{name: 'Jacob', relations: [{name: 'Angels', connection: 'Jacob was visited by angels and had many visions.', type: 'Divine'}, {name: 'BrothersNephi', connection: "Jacob was Laman and Lemuel's younger brother", type: 'Family'}, {name: 'Enos', connection: "Jacob was Enos' father.", type: 'Family'}, {name: 'Godhead', connection: 'Jacob saw the Lord in a vision and was His prophet.', type: 'Divine'}, {name: 'Jarom', connection: "Jacob was Jarom's grandfather.", type: 'Family'}, {name: 'Joseph2', connection: "Jacob was Joseph's brother.", type: 'Family'}, {name: 'Lehi', connection: "Jacob was Lehi's son.", type: 'Family'}, {name: 'Nephi', connection: "Jacob was Nephi's brother.", type: 'Family'}, {name: 'Sariah', connection: "Jacob was Sariah's son.", type: 'Family'}, {name: 'Sherem', connection: "Jacob confounded Sherem in all his words when Sherem challenged Jacob's faith.", type: 'Enemy'}]},
-{name: 'Jared', relations: [{name: 'BrotherJared', connection: "The brother of Jared was Jared's brother.", type: 'Family'}, {name: 'Godhead', connection: 'Jared, his brother, and their people were led to the promised land by the Lord.', type: 'Divine'}]},
-{name: 'Jared2', relations: [{name: 'Akish', connection: "Jared Son of Omer was murdered by Akish after Akish married Jared\'s daughter.", type: 'Enemy'}, {name: 'DaughterJared', connection: 'This woman was Jared\'s daughter.', type: 'Family'}]},
-{name: 'Jarom', relations: [{name: 'Amaron', connection: "Jarom was Amaron's grandfather.", type: 'Family'}, {name: 'Enos', connection: "Jarom was Enos's son.", type: 'Family'}, {name: 'Jacob', connection: "Jarom was Jacob's grandson.", type: 'Family'}, {name: 'Omni', connection: "Jarom was Omni's father.", type: 'Family'}]},
-{name: 'JohnBaptist', relations: [{name: 'ChristAmerica', connection: "John the Baptist was Jesus's cousin who prepared the way for His first coming.", type: 'Family'}, {name: 'Lehi', connection: 'Lehi saw John the Baptist in a vision.', type: 'Divine'}, {name: 'Nephi', connection: 'Nephi saw John the Baptist in a vision.', type: 'Divine'}]},
-{name: 'Joseph', relations: [{name: 'Jacob2', connection: "Joseph was Jacob's son.", type: 'Family'}]},
-{name: 'Joseph2', relations: [{name: 'BrothersNephi', connection: "Laman and Lemuel were Joseph's brothers.", type: 'Family'}, {name: 'Jacob', connection: "Jacob was Joseph's brother.", type: 'Family'}, {name: 'Lehi', connection: "Lehi was Joseph's father.", type: 'Family'}, {name: 'Nephi', connection: "Nephi was Joseph's brother.", type: 'Family'}, {name: 'Sariah', connection: "Sariah was Joseph's mother.", type: 'Family'}]},
-{name: 'Joshua', relations: [{name: 'Godhead', connection: 'Joshua was a prophet of the Lord.', type: 'Divine'}, {name: 'Moses', connection: 'Joshua assisted Moses during the Exodus and was chosen by God to succeed Moses as the next leader of the Hebrews.', type: 'Associate'}]},
-{name: 'Korihor', relations: [{name: 'Alma2', connection: "Alma the Younger struck Korihor dumb as a sign of God's power, after hearing him preach false doctrine.", type: 'Enemy'}, {name: 'Giddonah', connection: 'Korihor was examined by Giddonah the priest before he was brought before Alma.', type: 'Enemy'}, {name: 'Satan', connection: 'Satan appeared to Korihor and told him what false doctrine to preach.', type: 'Associate'}]},
-{name: 'Laban', relations: [{name: 'BrothersNephi', connection: 'Nephi and his brothers got the brass plates from Laban, who tried to kill them in the process.', type: 'Enemy'}, {name: 'Nephi', connection: 'Nephi obtained the brass plates from Laban after asking, bartering, and finally killing him.', type: 'Enemy'}]},
-{name: 'Lachoneus', relations: [{name: 'Giddianhi', connection: 'Lachoneus was the leader of the Nephite army who defeated Giddianhi and his robbers.', type: 'Enemy'}, {name: 'Gidgiddoni', connection: 'Gidgiddoni served as a chief captain under Lachoneus when fighting the Gaddianton robbers.', type: 'Associate'}]},
-{name: 'Laman2', relations: [{name: 'Amalickiah', connection: "Laman was a soldier fighting against Amalickiah's army.", type: 'Enemy'}, {name: 'Ammoron', connection: "Laman was a soldier fighting against Ammoron's army.", type: 'Enemy'}, {name: 'CaptainMoroni', connection: "Laman was a soldier in Captain Moroni's army when they fought against Amalickiah and Ammoron.", type: 'Associate'}]},
-{name: 'Lamoni', relations: [{name: 'Aaron', connection: 'Lamoni, Aaron, and others counseled together about how to defend against the Lamanites.', type: 'Associate'}, {name: 'Ammon', connection: 'Lamoni, Ammon, and others counseled together about how to defend against the Lamanites. Ammon also helped convert Lamoni and his people to the faith.', type: 'Associate'}, {name: 'Angels', connection: 'Lamoni had a vision of an angel while unconscious.', type: 'Divine'}, {name: 'AntiNephiLehi', connection: 'Lamoni and Anti-Nephi-Lehi were brothers.', type: 'Family'}, {name: 'FatherLamoni', connection: "Lamoni's father.", type: 'Family'}]},
-{name: 'Lehi', relations: [{name: 'BrothersNephi', connection: "Lehi was Laman's and Lemuel's father.", type: 'Family'}, {name: 'Enos', connection: "Lehi was Enos' grandfather.", type: 'Family'}, {name: 'Godhead', connection: 'Lehi was a prophet of God and saw God and Jesus in a vision.', type: 'Divine'}, {name: 'Jacob', connection: "Lehi was Jacob's father.", type: 'Family'}, {name: 'JohnBaptist', connection: 'Lehi saw John the Baptist in a vision.', type: 'Divine'}, {name: 'Joseph2', connection: "Lehi was Joseph's father.", type: 'Family'}, {name: 'Nephi', connection: "Lehi was Nephi's father.", type: 'Family'}, {name: 'Sariah', connection: "Lehi was Sariah's husband.", type: 'Family'}]},
-{name: 'Lehi2', relations: [{name: 'Aminadab', connection: 'After the experience with Lehi and Nephi being surrounded by fire, Aminadab was brought back to the faith.', type: 'Associate'}, {name: 'Angels', connection: 'Lehi and Nephi conversed with angels while surrounded by heavenly fire.', type: 'Divine'}, {name: 'Nephi2', connection: "Lehi was Nephi's brother.", type: 'Family'},  {name: 'Helaman', connection: "Lehi was the grandson of Helaman.", type: 'Family'}, {name: 'Helaman2', connection: "Lehi was the son of Helaman Son of Helaman.", type: 'Family'}]},
-{name: 'Lehi3', relations: [{name: 'Amalickiah', connection: 'Amalickiah and his brother fought against the Nephite army, over which Lehi was a commander.', type: 'Enemy'}, {name: 'Ammoron', connection: 'Ammoron and his brother fought against the Nephite army, over which Lehi was a commander.', type: 'Enemy'}, {name: 'CaptainMoroni', connection: 'Lehi was a commander under Captain Moroni in the war against Amalickiah and his brother.', type: 'Associate'}, {name: 'Gid', connection: 'Gid and Lehi were fellow army commanders serving under Captain Moroni.', type: 'Associate'}]},
-{name: 'Limhi', relations: [{name: 'Alma', connection: 'Alma baptized Limhi after preaching to him and his people.', type: 'Associate'}, {name: 'Ammon2', connection: "Limhi and his people were found, taught, and delivered with Ammon's help.", type: 'Associate'}, {name: 'Gideon', connection: "Gideon was captain of Limhi's armies. Gideon helped organize the escape of Limhi's people from bondage.", type: 'Associate'}, {name: 'Mosiah', connection: "Limhi became subject to King Mosiah. He also gave Mosiah the Jaredite plates so he could translate them.", type: 'Associate'}, {name: 'Noah', connection: "Limhi was King Noah's son.", type: 'Family'}, {name: 'Zeniff', connection: "Limhi was Zeniff's grandson.", type: 'Family'}]},
-{name: 'Malachi', relations: [{name: 'Godhead', connection: 'Malachi was a prophet of God.', type: 'Divine'}]},
-{name: 'Micah', relations: [{name: 'Godhead', connection: 'Micah was a prophet of God.', type: 'Divine'}]},
-{name: 'Mormon', relations: [{name: 'Ammaron', connection: 'Ammaron told Mormon where to find sacred records so he could continue writing the Nephite record.', type: 'Associate'}, {name: 'Godhead', connection: 'Mormon was a prophet of God; God and Jesus ministered to him and his son, Moroni.', type: 'Divine'}, {name: 'Moroni', connection: "Mormon was Moroni's father.", type: 'Family'}]},
-{name: 'Moroni', relations: [{name: 'Godhead', connection: 'Moroni was a prophet of God; God and Jesus ministered to him and his father, Mormon.', type: 'Divine'}, {name: 'Mormon', connection: "Moroni was Mormon's son.", type: 'Family'}]},
-{name: 'Moses', relations: [{name: 'Godhead', connection: 'Moses was a prophet of God; God showed him a vision of everything in the world from beginning to end.', type: 'Divine'}, {name: 'Joshua', connection: 'Joshua assisted Moses during the Exodus and was chosen by God to succeed Moses as the next leader of the Hebrews.', type: 'Associate'}, {name: 'Satan', connection: 'Moses was tempted by Satan.', type: 'Enemy'}]},
-{name: 'Mosiah', relations: [{name: 'Aaron', connection: "Mosiah was Aaron's father.", type: 'Family'}, {name: 'Alma2', connection: 'Mosiah made Alma the Younger the first chief judge, after he stepped down from the throne.', type: 'Associate'}, {name: 'Ammon', connection: "Mosiah was Ammon's father.", type: 'Family'}, {name: 'Ammon2', connection: "Ammon the Mulekite petitioned Mosiah so Limhi's people could come live with them.", type: 'Associate'}, {name: 'Benjamin', connection: "Mosiah was Benjamin's son. Mosiah's grandfather was also named Mosiah.", type: 'Family'}, {name: 'Godhead', connection: 'Mosiah was a prophet of God.', type: 'Divine'}, {name: 'Limhi', connection: 'Limhi became subject to Mosiah', type: 'Associate'}]},
-{name: 'Nephi', relations: [{name: 'Angels', connection: 'Nephi saw a vision that was narrated by an angel. Another angel intervened when Laman and Lemuel were beating Nephi and Sam.', type: 'Divine'}, {name: 'BrothersNephi', connection: "Laman and Lemuel were Nephi's brothers.", type: 'Family'}, {name: 'Godhead', connection: 'Nephi was a prophet of God and had a vision of Christ.', type: 'Divine'}, {name: 'Jacob', connection: "Nephi was Jacob's brother.", type: 'Family'}, {name: 'Joseph2', connection: "Nephi was Joseph's brother.", type: 'Family'}, {name: 'JohnBaptist', connection: 'Nephi saw John the Baptist in a vision.', type: 'Divine'}, {name: 'Laban', connection: 'Nephi obtained the brass plates from Laban after asking, bartering, and finally killing him.', type: 'Enemy'}, {name: 'Lehi', connection: "Nephi was Lehi's son.", type: 'Family'}, {name: 'Sariah', connection: "Nephi was Sariah's son.", type: 'Family'}]},
-{name: 'Nephi2', relations: [{name: 'Aminadab', connection: 'After the experience with Nephi and Lehi being surrounded by fire, Aminadab was brought back to the faith.', type: 'Associate'}, {name: 'Angels', connection: 'Nephi and Lehi conversed with angels while surrounded by heavenly fire.', type: 'Divine'}, {name: 'Godhead', connection: 'Nephi was a prophet and father of the Nephi who Christ chose as an apostle among the Nephites.', type: 'Divine'}, {name: 'Helaman', connection: "Nephi was the grandson of Helaman.", type: 'Family'}, {name: 'Helaman2', connection: "Nephi was the son of Helaman Son of Helaman.", type: 'Family'}, {name: 'Lehi2', connection: "Nephi was Lehi's brother.", type: 'Family'}, {name: 'SamuelLamanite', connection: "Nephi baptized the believers after Samuel's preaching.", type: 'Associate'}]},
-{name: 'Nephihah', relations: [{name: 'Alma2', connection: "Nephihah was Alma the Younger's successor for the judgment-seat.", type: 'Associate'}, {name: 'Pahoran', connection: "Nephihah was Pahoran's father; Pahoran took the judgment-seat after Nephihah died.", type: 'Family'}]},
-{name: 'Noah', relations: [{name: 'Abinadi', connection: 'King Noah sentenced Abinadi to death after Abinadi testified in the royal court.', type: 'Enemy'}, {name: 'Alma', connection: "Alma was a priest in King Noah's court before he was converted.", type: 'Associate'}, {name: 'Gideon', connection: 'Noah pled for his life to Gideon, who was attempting to kill him.', type: 'Enemy'}, {name: 'Limhi', connection: "Noah was Limhi's father.", type: 'Family'}, {name: 'Satan', connection: "Satan had great hold on Noah's heart.", type: 'Associate'}, {name: 'Zeniff', connection: "Noah was Zeniff's son.", type: 'Family'}]},
-{name: 'Omni', relations: [{name: 'Amaron', connection: "Omni was Amaron's father.", type: 'Family'}, {name: 'Chemish', connection: "Omni was Chemish's father.", type: 'Family'}, {name: 'Enos', connection: "Omni was Enos's grandson.", type: 'Family'}, {name: 'Jarom', connection: "Omni was Jarom's son.", type: 'Family'}]},
-{name: 'Pahoran', relations: [{name: 'Amalickiah', connection: 'Pahoran, the chief judge, fought in the war against Amalickiah and Ammoron.', type: 'Enemy'}, {name: 'Ammoron', connection: 'Pahoran, the chief judge, fought in the war against Amalickiah and Ammoron.', type: 'Enemy'}, {name: 'CaptainMoroni', connection: "Pahoran was one of the chief judges in Captain Moroni's time and fought with him against Ammoron and Amalickiah.", type: 'Associate'}, {name: 'Nephihah', connection: "Pahoran was Nephihah's son and took the judgment-seat after Nephihah died.", type: 'Family'}]},
-{name: 'SamuelLamanite', relations: [{name: 'Angels', connection: 'An angel spoke to Samuel, declaring glad tidings and that destruction awaited the Nephites unless they repented.', type: 'Divine'}, {name: 'ChristAmerica', connection: "Samuel foretold Christ's birth and death.", type: 'Divine'}, {name: 'Godhead', connection: 'The Lord told Samuel to turn back after being cast out of Zarahemla and told him what to preach to the Nephites.', type: 'Divine'}, {name: 'Nephi2', connection: "After Samuel's preaching, the believers were baptized by Nephi.", type: 'Associate'}]},
-{name: 'Sariah', relations: [{name: 'BrothersNephi', connection: "Sariah was Nephi and his brothers' mother.", type: 'Family'}, {name: 'Enos', connection: "Sariah was Enos' grandmother.", type: 'Family'}, {name: 'Jacob', connection: "Sariah was Jacob's mother.", type: 'Family'}, {name: 'Joseph2', connection: "Sariah was Joseph's mother.", type: 'Family'}, {name: 'Lehi', connection: "Sariah was Lehi's wife.", type: 'Family'}, {name: 'Nephi', connection: "Sariah was Nephi's mother.", type: 'Family'}]},
-{name: 'Satan', relations: [{name: 'Aaron', connection: "Before he was converted to the Lord, Aaron went about with his brothers and Alma the Younger teaching Satan's doctrine.", type: 'Associate'}, {name: 'Akish', connection: "Satan put it into Akish's heart to dig up the secret oaths and combinations in order to murder Jared Son of Omer.", type: 'Associate'}, {name: 'Alma2', connection: "Before he was converted to the Lord, Alma the Younger and the sons of Mosiah went about teaching Satan's doctrine.", type: 'Associate'}, {name: 'Amalickiah', connection: "Satan had great hold on Amalickiah's heart.", type: 'Associate'}, {name: 'Ammon', connection: "Before he was converted to the Lord, Ammon went about with his brothers and Alma the Younger teaching Satan's doctrine.", type: 'Associate'}, {name: 'Ammoron', connection: "Satan had great hold on Ammoron's heart.", type: 'Associate'}, {name: 'Angels', connection: 'Satan is a fallen angel.', type: 'Divine'}, {name: 'BrothersNephi', connection: 'Satan influenced Laman and Lemuel.', type: 'Associate'}, {name: 'ChristAmerica', connection: 'Satan and Christ are enemies.', type: 'Enemy'}, {name: 'FatherLamoni', connection: "Satan influenced Lamoni's father before his conversion.", type: 'Associate'}, {name: 'Giddianhi', connection: "Satan had a great hold on Giddianhi's heart and gave him the secret combinations.", type: 'Associate'}, {name: 'Godhead', connection: 'Satan and the Godhead are at war with each other.', type: 'Divine'}, {name: 'Korihor', connection: 'Satan appeared to Korihor and told him what false doctrine to preach.', type: 'Associate'}, {name: 'Moses', connection: 'Satan tried to tempt Moses.', type: 'Enemy'}, {name: 'Noah', connection: "Satan had great hold on King Noah's heart.", type: 'Associate'}, {name: 'Sherem', connection: 'Sherem taught false doctrines from Satan.', type: 'Associate'}, {name: 'Zeezrom', connection: "Before Zeezrom's conversion, Satan had great hold on his heart.", type: 'Enemy'}, {name: 'Zerahemnah', connection: "Satan had hold on Zerahemnah's heart.", type: 'Associate'}]},
-{name: 'Sherem', relations: [{name: 'Godhead', connection: 'The Lord struck Sherem to the earth as a sign of His power.', type: 'Divine'}, {name: 'Jacob', connection: "Sherem challenged Jacob's faith, but Jacob confounded him in all his words.", type: 'Enemy'}, {name: 'Satan', connection: 'Sherem taught false doctrines from Satan.', type: 'Associate'}]},
-{name: 'Zeezrom', relations: [{name: 'Aaron', connection: 'Zeezrom and Aaron went on a mission to the Zoramites together.', type: 'Associate'}, {name: 'Alma2', connection: "Zeezrom was converted after hearing Alma the Younger's and Amulek's testimonies. They later went on missions together.", type: 'Associate'}, {name: 'Ammon', connection: 'Zeezrom and Ammon went on a mission to the Zoramites together.', type: 'Associate'}, {name: 'Amulek', connection: "Zeezrom was converted after hearing Amulek's and Alma the Younger's testimonies. They later served missions together.", type: 'Associate'}, {name: 'Satan', connection: "Before Zeezrom's conversion, Satan had great hold on his heart.", type: 'Associate'}]},
-{name: 'Zeniff', relations: [{name: 'Limhi', connection: "Zeniff was Limhi's grandfather.", type: 'Family'}, {name: 'Noah', connection: "Zeniff was King Noah's father.", type: 'Family'}]},
-{name: 'Zenock', relations: [{name: 'Godhead', connection: 'Zenock was a prophet of God.', type: 'Divine'}]},
-{name: 'Zenos', relations: [{name: 'Godhead', connection: 'Zenos was a prophet of God.', type: 'Divine'}]}]
-
-
-
-let linguisticData = [{name: 'Abinadi', relations: [{name: 'Godhead', connection: 'The Lord sent Abinadi to preach.', type: 'Quote'}, {name: 'Isaiah', connection: 'Abinadi quoted the words of Isaiah.', type: 'Quote'}, {name: 'Moses', connection: 'Abinadi quoted the words of Moses.', type: 'Quote'}]},
-{name: 'Alma2', relations: [{name: 'Zenock', connection: 'Alma the Younger quoted the words of Zenock.', type: 'Quote'}, {name: 'Zenos', connection: 'Alma the Younger quoted the words of Zenos.', type: 'Quote'}]},
-{name: 'CaptainMoroni', relations: [{name: 'Godhead', connection: 'Captain Moroni quoted the Lord while preaching.', type: 'Quote'}, {name: 'Jacob2', connection: 'Captain Moroni quoted Jacob (Israel).', type: 'Quote'}]},
-{name: 'ChristAmerica', relations: [{name: 'Isaiah', connection: 'Christ quoted Isaiah while ministering in the new world.', type: 'Quote'}, {name: 'Malachi', connection: 'Christ quoted Malachi while ministering in the new world.', type: 'Quote'}, {name: 'JohnBaptist', connection: "Jesus was John the Baptist's cousin, and John prepared the way for His first coming.", type: 'Divine'}, {name: 'Micah', connection: 'Christ quoted Micah while ministering in the new world.', type: 'Quote'}, {name: 'Moses', connection: 'Christ quoted Moses while ministering in the new world.', type: 'Quote'}]},
-{name: 'Godhead', relations: [{name: 'Abinadi', connection: 'The Lord sent Abinadi to preach.', type: 'Quote'}, {name: 'Amaron', connection: 'Amaron quoted the Lord in his brief writings.', type: 'Quote'}, {name: 'CaptainMoroni', connection: 'Captain Moroni quoted the Lord while preaching.', type: 'Quote'}]},
-{name: 'Isaiah', relations: [{name: 'Abinadi', connection: 'Abinadi quoted the words of Isaiah.', type: 'Quote'}, {name: 'ChristAmerica', connection: 'Christ quoted Isaiah while ministering in the new world.', type: 'Quote'}, {name: 'Jacob', connection: 'Jacob quoted Isaiah in his preaching.', type: 'Quote'}, {name: 'Nephi', connection: 'Nephi quoted Isaiah to his brothers.', type: 'Quote'}]},
-{name: 'Jacob2', relations: [{name: 'CaptainMoroni', connection: 'Captain Moroni quoted Jacob (Israel).', type: 'Quote'}]},
-{name: 'Jacob', relations: [{name: 'Zenos', connection: "Jacob quoted Zenos's allegory of the olive tree.", type: 'Quote'}, {name: 'Jacob', connection: 'Jacob quoted Isaiah in his preaching.', type: 'Quote'}]},
-{name: 'JohnBaptist', relations: [{name: 'Lehi', connection: 'Lehi quoted John the Baptist after seeing him in a vision.', type: 'Quote'}]},
-{name: 'Joseph', relations: [{name: 'Lehi', connection: 'Lehi quoted Joseph from the Old Testament while blessing his son, Joseph.', type: 'Quote'}]},
-{name: 'Lehi', relations: [{name: 'JohnBaptist', connection: 'Lehi quoted John the Baptist after seeing him in a vision.', type: 'Quote'}, {name: 'Joseph', connection: 'Lehi quoted Joseph from the Old Testament while blessing his son, Joseph.', type: 'Quote'}]},
-{name: 'Malachi', relations: [{name: 'ChristAmerica', connection: 'Christ quoted Malachi while ministering in the New World.', type: 'Quote'}]},
-{name: 'Micah', relations: [{name: 'ChristAmerica', connection: 'Christ quoted Micah while ministering in the New World.', type: 'Quote'}]},
-{name: 'Moses', relations: [{name: 'Abinadi', connection: 'Abinadi quoted Moses in his preaching', type: 'Quote'}, {name: 'ChristAmerica', connection: 'Christ quoted Moses while ministering in the New World.', type: 'Quote'}, {name: 'Nephi', connection: 'Nephi quoted the words of Moses.', type: 'Quote'}]},
-{name: 'Nephi', relations: [{name: 'Isaiah', connection: 'Nephi quoted Isaiah to his brothers.', type: 'Quote'}, {name: 'Moses', connection: 'Nephi quoted the words of Moses.', type: 'Quote'}, {name: 'Zenock', connection: "Nephi quoted Zenos's prophecies of Christ.", type: 'Quote'}, {name: 'Zenos', connection: "Nephi quoted Zenock's prophecies of Christ.", type: 'Quote'}]},
-{name: 'Zenock', relations: [{name: 'Alma2', connection: 'Alma quoted the words of Zenock.', type: 'Quote'}, {name: 'Nephi', connection: "Nephi quoted Zenock's prophecies of Christ.", type: 'Quote'}]},
-{name: 'Zenos', relations: [{name: 'Alma2', connection: 'Alma quoted the words of Zenos.', type: 'Quote'}, {name: 'Jacob', connection: "Jacob quoted Zenos's allegory of the olive tree.", type: 'Quote'}, {name: 'Nephi', connection: "Nephi quoted Zenos's prophecies of Christ.", type: 'Quote'}]}]
+// GENERATED from docs/content/speakers.json by scripts/build_derived_data.py - do not edit.
+let relationshipData = JSON.parse('[{"name":"Aaron","relations":[{"name":"Alma","connection":"Aaron was friends with Alma\'s son, Alma the Younger, and the three went on a mission together.","type":"Associate"},{"name":"Alma2","connection":"Aaron and Alma the Younger were friends and went on missions together.","type":"Associate"},{"name":"Ammon","connection":"Aaron and Ammon were brothers and served missions together.","type":"Family"},{"name":"Amulek","connection":"Aaron and Amulek went on a mission to the Zoramites together.","type":"Associate"},{"name":"Angels","connection":"Aaron saw an angel when Alma the Younger was struck down.","type":"Divine"},{"name":"AntiNephiLehi","connection":"Anti-Nephi-Lehi counseled with Aaron and others about how to defend against the Lamanites.","type":"Associate"},{"name":"Benjamin","connection":"Benjamin was Aaron\'s grandfather.","type":"Family"},{"name":"FatherLamoni","connection":"Lamoni\'s father was converted to the gospel through the teachings of Aaron and some of his brothers.","type":"Associate"},{"name":"Lamoni","connection":"Lamoni, Aaron, and others counseled together about how to defend against the Lamanites.","type":"Associate"},{"name":"Mosiah","connection":"Aaron was one of the sons of Mosiah.","type":"Family"},{"name":"Satan","connection":"Aaron went about with his brothers and Alma the Younger teaching Satan\'s doctrine, before he was converted to the gospel.","type":"Associate"},{"name":"Zeezrom","connection":"Aaron and Zeezrom went on a mission to the Zoramites together.","type":"Associate"}]},{"name":"Abinadi","relations":[{"name":"Alma","connection":"Abinadi testified of Christ in King Noah\'s court, which resulted in Alma\'s conversion to the gospel.","type":"Associate"},{"name":"Noah","connection":"Abinadi was sentenced to death by King Noah after testifying of Christ in his court.","type":"Enemy"}]},{"name":"Abinadom","relations":[{"name":"Amaleki","connection":"Abinadom was Amaleki\'s father.","type":"Family"},{"name":"Amaron","connection":"Abinadom was Amaron\'s nephew.","type":"Family"},{"name":"Chemish","connection":"Abinadom was the son of Chemish.","type":"Family"}]},{"name":"Akish","relations":[{"name":"Jared2","connection":"Akish killed Jared after marrying his daughter.","type":"Enemy"},{"name":"DaughterJared","connection":"Akish married the daughter of Jared Son of Omer.","type":"Family"},{"name":"Satan","connection":"Akish dug up the secret oaths and combinations in order to murder Jared Son of Omer because Satan put it into his heart to do so.","type":"Associate"}]},{"name":"Alma","relations":[{"name":"Aaron","connection":"Alma and Aaron went on a mission together. Alma was the father of Alma the Younger, who was Aaron\'s friend.","type":"Associate"},{"name":"Abinadi","connection":"Alma was converted as a result of Abinadi\'s testimony in King Noah\'s court.","type":"Associate"},{"name":"Alma2","connection":"Alma was Alma the Younger\'s father.","type":"Family"},{"name":"Godhead","connection":"The Lord spoke to Alma, promising him eternal life.","type":"Divine"},{"name":"Helaman","connection":"Alma was Helaman\'s grandfather.","type":"Family"},{"name":"Limhi","connection":"Alma baptized Limhi after preaching to him and his people.","type":"Associate"},{"name":"Noah","connection":"Alma was a priest in King Noah\'s court before he was converted.","type":"Associate"}]},{"name":"Alma2","relations":[{"name":"Aaron","connection":"Alma the Younger and Aaron were friends and went on missions together.","type":"Associate"},{"name":"Alma","connection":"Alma the Younger was Alma\'s son.","type":"Family"},{"name":"Ammon","connection":"Alma the Younger and Ammon were friends and went on missions together.","type":"Associate"},{"name":"Amulek","connection":"Alma the Younger and Amulek were mission companions.","type":"Associate"},{"name":"Angels","connection":"Alma the Younger was converted as a result of an angel visiting and chastising him.","type":"Divine"},{"name":"Antionah","connection":"Alma the Younger answered Antionah\'s question about resurrection.","type":"Associate"},{"name":"Helaman","connection":"Alma the Younger was Helaman\'s father.","type":"Family"},{"name":"Helaman2","connection":"Alma the Younger was grandfather to Helaman, Son of Helaman.","type":"Family"},{"name":"Korihor","connection":"Alma the Younger struck Korihor dumb as a sign of God\'s power, after hearing him preach false doctrine.","type":"Enemy"},{"name":"Mosiah","connection":"Alma the Younger became the first chief judge after Mosiah stepped down from the throne.","type":"Associate"},{"name":"Nephihah","connection":"Alma the Younger delivered up the judgment-seat to Nephihah.","type":"Associate"},{"name":"Satan","connection":"Alma the Younger and the sons of Mosiah went about teaching Satan\'s doctrine before they were converted to the Lord.","type":"Associate"},{"name":"Zeezrom","connection":"Alma and Amulek bore testimony of the gospel to Zeezrom. After Zeezrom\'s conversion, they went on missions together.","type":"Associate"}]},{"name":"Amaleki","relations":[{"name":"Abinadom","connection":"Amaleki was Abinadom\'s son.","type":"Family"},{"name":"Benjamin","connection":"Amaleki gave the plates to Benjamin before he died.","type":"Associate"},{"name":"Chemish","connection":"Amaleki was Chemish\'s grandson.","type":"Family"}]},{"name":"Amalickiah","relations":[{"name":"Ammoron","connection":"Amalickiah and Ammoron were brothers.","type":"Family"},{"name":"CaptainMoroni","connection":"Amalickiah waged a war against the Nephites and swore to drink Captain Moroni\'s blood.","type":"Enemy"},{"name":"Gid","connection":"Amalickiah and his brother fought against the Nephite army, of which, Gid was one of the leaders.","type":"Enemy"},{"name":"Helaman","connection":"Amalickiah fought against the Nephite army led by Helaman.","type":"Enemy"},{"name":"Laman2","connection":"Amalickiah\'s army fought against the Nephite army that Laman was a soldier and spy for.","type":"Enemy"},{"name":"Lehi3","connection":"Amalickiah and his brother fought against the Nephite army, of which, Lehi was one of the leaders.","type":"Enemy"},{"name":"Pahoran","connection":"Amalickiah and Ammoron fought against Pahoran and his people.","type":"Enemy"},{"name":"Satan","connection":"Satan had great hold on Amalickiah\'s heart.","type":"Associate"}]},{"name":"Amaron","relations":[{"name":"Abinadom","connection":"Amaron was Abinadom\'s uncle.","type":"Family"},{"name":"Chemish","connection":"Amaron was Chemish\'s brother.","type":"Family"},{"name":"Godhead","connection":"Amaron quoted the Lord in his brief writings.","type":"Divine"},{"name":"Jarom","connection":"Amaron was Jarom\'s grandson.","type":"Family"},{"name":"Omni","connection":"Amaron was Omni\'s son.","type":"Family"}]},{"name":"Aminadab","relations":[{"name":"Angels","connection":"Angels came and ministered to Aminadab and the other Lamanites when Nephi and Lehi were surrounded by fire.","type":"Divine"},{"name":"Godhead","connection":"The Holy Spirit entered into Aminidab\'s heart.","type":"Divine"},{"name":"Lehi2","connection":"After the experience with Lehi and Nephi being surrounded by fire, Aminadab was brought back to the faith.","type":"Associate"},{"name":"Nephi2","connection":"After the experience with Nephi and Lehi being surrounded by fire, Aminadab was brought back to the faith.","type":"Associate"}]},{"name":"Ammaron","relations":[{"name":"Mormon","connection":"Ammaron told Mormon where to find the sacred records so he could continue writing the Nephite record.","type":"Associate"}]},{"name":"Ammon","relations":[{"name":"Aaron","connection":"Ammon and Aaron were brothers and served missions together.","type":"Family"},{"name":"Alma2","connection":"Ammon and Alma the Younger were friends and went on missions together.","type":"Associate"},{"name":"Amulek","connection":"Ammon and Amulek went on a mission to the Zoramites together.","type":"Associate"},{"name":"Angels","connection":"Ammon, his brothers, and Alma the Younger were converted to the gospel when they saw an angel.","type":"Divine"},{"name":"AntiNephiLehi","connection":"Ammon and others counseled with Anti-Nephi-Lehi about how to defend against the Lamanites.","type":"Associate"},{"name":"Benjamin","connection":"Ammon was Benjamin\'s grandson.","type":"Family"},{"name":"FatherLamoni","connection":"Ammon contended with Lamoni\'s father on the way to rescue his brothers from prison.","type":"Associate"},{"name":"Lamoni","connection":"Ammon helped convert Lamoni and his kingdom to the faith.","type":"Associate"},{"name":"Mosiah","connection":"Ammon was Mosiah\'s son.","type":"Family"},{"name":"Satan","connection":"Ammon went about with his brothers and Alma the Younger teaching Satan\'s doctrine before they were converted to the Lord.","type":"Associate"},{"name":"Zeezrom","connection":"Ammon and Zeezrom went on a mission to the Zoramites together.","type":"Associate"}]},{"name":"Ammon2","relations":[{"name":"Limhi","connection":"Ammon found, taught, and helped deliver Limhi and his people.","type":"Associate"},{"name":"Mosiah","connection":"Ammon the Mulekite petitioned Mosiah so Limhi\'s people could come live with the people of Zarahemla.","type":"Associate"}]},{"name":"Ammoron","relations":[{"name":"Amalickiah","connection":"Ammoron and Amalickiah were brothers.","type":"Family"},{"name":"CaptainMoroni","connection":"Ammoron took over the war against Captain Moroni and the Nephites when Amalickiah was killed.","type":"Enemy"},{"name":"Gid","connection":"Ammoron and his brother fought against the Nephite army, over which Gid was a leader.","type":"Enemy"},{"name":"Helaman","connection":"Helaman was a leader in Captain Moroni\'s army when they fought against Amalickiah and his brother. Helaman led 2,000 stripling warriors under Moroni\'s command.","type":"Enemy"},{"name":"Laman2","connection":"Ammoron and his brother fought against the Nephite army, for which Laman was a soldier and spy.","type":"Enemy"},{"name":"Lehi3","connection":"Ammoron and his brother fought against the Nephite army, over which Lehi was a commander.","type":"Enemy"},{"name":"Pahoran","connection":"Amalickiah and Ammoron fought against Pahoran and his people.","type":"Enemy"},{"name":"Satan","connection":"Satan had great hold on Ammoron\'s heart.","type":"Associate"}]},{"name":"Amulek","relations":[{"name":"Aaron","connection":"Amulek and Aaron went on a mission to the Zoramites together.","type":"Associate"},{"name":"Alma2","connection":"Amulek and Alma the Younger were mission companions.","type":"Associate"},{"name":"Ammon","connection":"Amulek and Ammon went on a mission to the Zoramites together.","type":"Associate"},{"name":"Angels","connection":"Amulek saw an angel who told him to care for Alma.","type":"Divine"},{"name":"Antionah","connection":"Amulek answered Antionah\'s question about resurrection.","type":"Associate"},{"name":"Giddonah2","connection":"Amulek was Giddonah\'s son.","type":"Family"},{"name":"Zeezrom","connection":"Amulek and Alma taught the gospel to Zeezrom. After Zeezrom\'s conversion, they all went on missions together.","type":"Associate"}]},{"name":"Angels","relations":[{"name":"Aaron","connection":"An angel chastised Aaron, his brothers, and Alma the Younger for destroying the Church. This experience helped convert them to the gospel.","type":"Divine"},{"name":"Alma2","connection":"An angel visited Alma the Younger and chastised him, after which he was converted to the gospel.","type":"Divine"},{"name":"Aminadab","connection":"Angels came and ministered to Aminadab and the other Lamanites when Nephi and Lehi were surrounded by fire.","type":"Divine"},{"name":"Ammon","connection":"An angel chastised Ammon, his brothers, and Alma the Younger for destroying the Church, after which they were converted to the gospel.","type":"Divine"},{"name":"Amulek","connection":"An angel visited Amulek and told him to care for Alma.","type":"Divine"},{"name":"Benjamin","connection":"An angel visited King Benjamin and commanded him to speak to his people.","type":"Divine"},{"name":"BrothersNephi","connection":"An angel rebuked Laman and Lemuel for beating Sam and Nephi.","type":"Divine"},{"name":"ChristAmerica","connection":"Christ and His angels ministered to the Nephites in the Americas.","type":"Divine"},{"name":"Godhead","connection":"God works through angels.","type":"Divine"},{"name":"Isaiah","connection":"Isaiah was a prophet of God and had many visions.","type":"Divine"},{"name":"Jacob","connection":"Jacob had angels minister to him and had many visions.","type":"Divine"},{"name":"Lamoni","connection":"An angel visited and taught Lamoni while he was unconscious.","type":"Divine"},{"name":"Lehi","connection":"Lehi saw and talked with angels in a vision.","type":"Divine"},{"name":"Nephi","connection":"Nephi saw a vision that was narrated by an angel. Another angel intervened when Laman and Lemuel were beating Nephi and Sam.","type":"Divine"},{"name":"Nephi2","connection":"Nephi and Lehi conversed with angels while surrounded by heavenly fire.","type":"Divine"},{"name":"Lehi2","connection":"Lehi and Nephi conversed with angels while surrounded by heavenly fire.","type":"Divine"},{"name":"SamuelLamanite","connection":"An angel spoke to Samuel, declaring glad tidings; he also said that destruction awaited the Nephites unless they repented.","type":"Divine"},{"name":"Satan","connection":"Satan was among the angels in the preexistence and is at war with the angels of heaven.","type":"Divine"}]},{"name":"AntiNephiLehi","relations":[{"name":"Aaron","connection":" Anti-Nephi-Lehi counseled with Aaron and others about how to defend against the Lamanites.","type":"Associate"},{"name":"Ammon","connection":" Anti-Nephi-Lehi counseled with Ammon and others about how to defend against the Lamanites.","type":"Associate"},{"name":"FatherLamoni","connection":"Lamoni\'s father was also Anti-Nephi-Lehi\'s father.","type":"Family"},{"name":"Lamoni","connection":"Anti-Nephi-Lehi and Lamoni were brothers.","type":"Family"}]},{"name":"Antionah","relations":[{"name":"Alma2","connection":"Antionah questioned Alma the Younger and Amulek about resurrection.","type":"Associate"},{"name":"Amulek","connection":"Antionah questioned Alma the Younger and Amulek about resurrection.","type":"Associate"}]},{"name":"Benjamin","relations":[{"name":"Aaron","connection":"Benjamin was Aaron\'s grandfather.","type":"Family"},{"name":"Amaleki","connection":"Benjamin received the plates from Amaleki before Amaleki died.","type":"Associate"},{"name":"Ammon","connection":"Benjamin was Ammon\'s grandfather.","type":"Family"},{"name":"Angels","connection":"Benjamin saw an angel who commanded him to speak to his people.","type":"Divine"},{"name":"Mosiah","connection":"Benjamin was Mosiah\'s father. Benjamin\'s father was also named Mosiah.","type":"Family"}]},{"name":"BrotherJared","relations":[{"name":"Godhead","connection":"After the brother of Jared had faith enough to see Christ\'s finger, Christ showed Himself to him.","type":"Divine"},{"name":"Jared","connection":"The brother of Jared was Jared\'s brother.","type":"Family"}]},{"name":"BrothersNephi","relations":[{"name":"Angels","connection":"An angel rebuked Laman and Lemuel for hitting Sam and Nephi.","type":"Divine"},{"name":"Jacob","connection":"Laman and Lemuel were Jacob\'s brothers.","type":"Family"},{"name":"Joseph2","connection":"Laman and Lemuel were Joseph\'s brothers.","type":"Family"},{"name":"Laban","connection":"Laman and his brothers took the brass plates from Laban, who tried to kill them in the process.","type":"Enemy"},{"name":"Lehi","connection":"Laman and Lemuel were Lehi\'s sons.","type":"Family"},{"name":"Nephi","connection":"Laman and Lemuel were Nephi\'s brothers.","type":"Family"},{"name":"Sariah","connection":"Laman and Lemuel were Sariah\'s sons.","type":"Family"},{"name":"Satan","connection":"Satan had a hold on Laman\'s and Lemuel\'s hearts.","type":"Associate"}]},{"name":"CaptainMoroni","relations":[{"name":"Amalickiah","connection":"Captain Moroni defended the Nephites against Amalickiah.","type":"Enemy"},{"name":"Ammoron","connection":"Captain Moroni defended the Nephites against Ammoron after Amalickiah was killed.","type":"Enemy"},{"name":"Gid","connection":"Gid was a leader of one of Captain Moroni\'s armies.","type":"Associate"},{"name":"Helaman","connection":"Helaman was a leader of one of Captain Moroni\'s armies when they fought against Amalickiah and his brother. He led the 2,000 stripling warriors under Moroni\'s command.","type":"Associate"},{"name":"Laman2","connection":"Laman was a soldier in Captain Moroni\'s army when they fought against Amalickiah and Ammoron.","type":"Associate"},{"name":"Lehi3","connection":"Lehi was a commander under Captain Moroni in the war against Amalickiah and his brother.","type":"Associate"},{"name":"Pahoran","connection":"Captain Moroni was leader of the Nephite armies when Pahoran was chief judge, and they fought together against Ammoron and Amalickiah.","type":"Associate"},{"name":"Zerahemnah","connection":"Captain Moroni fought against Zerahemna and the Lamanite armies.","type":"Enemy"}]},{"name":"Chemish","relations":[{"name":"Abinadom","connection":"Chemish was Abinadom\'s father.","type":"Family"},{"name":"Amaleki","connection":"Chemish was Amaleki\'s grandfather.","type":"Family"},{"name":"Amaron","connection":"Chemish was Amaron\'s brother.","type":"Family"},{"name":"Omni","connection":"Chemish was Omni\'s son.","type":"Family"}]},{"name":"ChristAmerica","relations":[{"name":"Angels","connection":"Christ and His angels ministered to the Nephites in the Americas.","type":"Divine"},{"name":"Godhead","connection":"Christ is part of the Godhead. He was introduced to the Nephites by God the Father saying, \\"Behold my Beloved Son ...\\"","type":"Divine"},{"name":"SamuelLamanite","connection":"Christ\'s birth and death were foretold by Samuel.","type":"Divine"},{"name":"Satan","connection":"Christ and Satan are at odds, with Christ fighting for our salvation and Satan fighting against it.","type":"Enemy"}]},{"name":"DaughterJared","relations":[{"name":"Jared2","connection":"This woman was Jared\'s daughter.","type":"Family"},{"name":"Akish","connection":"The daughter of Jared married Akish.","type":"Family"}]},{"name":"Enos","relations":[{"name":"Godhead","connection":"Enos prayed to God for forgiveness of his sins.","type":"Divine"},{"name":"Jacob","connection":"Enos was Jacob\'s son.","type":"Family"},{"name":"Jarom","connection":"Enos was Jarom\'s father.","type":"Family"},{"name":"Lehi","connection":"Enos was Lehi\'s grandson.","type":"Family"},{"name":"Omni","connection":"Enos was Omni\'s grandfather.","type":"Family"},{"name":"Sariah","connection":"Enos was Sariah\'s grandson.","type":"Family"}]},{"name":"Ether","relations":[{"name":"Godhead","connection":"Ether spoke to God as His prophet.","type":"Divine"}]},{"name":"FatherLamoni","relations":[{"name":"Aaron","connection":"Lamoni\'s father was converted to the gospel through the teachings of Aaron and his brothers.","type":"Associate"},{"name":"Ammon","connection":"Lamoni\'s father fought Ammon when Ammon went to rescue his brothers from prison.","type":"Enemy"},{"name":"AntiNephiLehi","connection":"Lamoni\'s father was also Anti-Nephi-Lehi\'s father.","type":"Family"},{"name":"Godhead","connection":"Lamoni\'s father prayed to God for forgiveness of his sins.","type":"Divine"},{"name":"Lamoni","connection":"Lamoni was the son of this man.","type":"Family"},{"name":"Satan","connection":"Satan influenced Lamoni\'s father before his conversion.","type":"Associate"}]},{"name":"Gid","relations":[{"name":"Amalickiah","connection":"Gid was a leader of the Nephite army that Amalickiah and his brother fought against.","type":"Enemy"},{"name":"Ammoron","connection":"Gid was a leader of the Nephite army that Ammoron and his brother fought against.","type":"Enemy"},{"name":"CaptainMoroni","connection":"Gid was a leader of one of Captain Moroni\'s armies.","type":"Associate"},{"name":"Helaman","connection":"Gid and Helaman were fellow army commanders serving under Captain Moroni.","type":"Associate"},{"name":"Lehi3","connection":"Gid and Lehi were fellow army commanders serving under Captain Moroni.","type":"Associate"}]},{"name":"Giddianhi","relations":[{"name":"Gidgiddoni","connection":"Giddianhi and his robbers were defeated by Gidgiddoni and the Nephite army.","type":"Enemy"},{"name":"Lachoneus","connection":"Giddianhi and his robbers were defeated by Lachoneus and his Nephite army.","type":"Enemy"},{"name":"Satan","connection":"Satan had a great hold on Giddianhi\'s heart and gave him the secret combinations.","type":"Associate"}]},{"name":"Giddonah","relations":[{"name":"Korihor","connection":"Giddonah was a priest who examined Korihor before he was brought before Alma the Younger.","type":"Enemy"}]},{"name":"Giddonah2","relations":[{"name":"Amulek","connection":"Giddonah was Amulek\'s father.","type":"Family"}]},{"name":"Gideon","relations":[{"name":"Limhi","connection":"Gideon was captain of Limhi\'s armies and helped organize the escape of Limhi\'s people from bondage.","type":"Associate"},{"name":"Noah","connection":"Gideon tried to kill King Noah as part of a rebellion.","type":"Enemy"}]},{"name":"Gidgiddoni","relations":[{"name":"Giddianhi","connection":"Gidgiddoni was a leader of the Nephite army who defeated Giddianhi and his robbers.","type":"Enemy"},{"name":"Lachoneus","connection":"Gidgiddoni served as a chief captain under Lachoneus when fighting the Gaddianton robbers.","type":"Associate"}]},{"name":"Godhead","relations":[{"name":"Alma","connection":"The Lord spoke to Alma, promising him eternal life.","type":"Divine"},{"name":"Aminadab","connection":"The Holy Spirit entered into Aminidab\'s heart.","type":"Divine"},{"name":"Angels","connection":"God works through angels.","type":"Divine"},{"name":"BrotherJared","connection":"Christ showed Himself to the brother of Jared after he had faith enough to see Christ\'s finger.","type":"Divine"},{"name":"ChristAmerica","connection":"During his ministry in the new world, Christ prayed to the Father.","type":"Divine"},{"name":"Enos","connection":"God spoke to Enos, forgiving his sins.","type":"Divine"},{"name":"Ether","connection":"The Lord spoke to Ether as his prophet.","type":"Divine"},{"name":"FatherLamoni","connection":"Lamoni\'s father prayed to God for forgiveness of his sins.","type":"Divine"},{"name":"Jacob2","connection":"Jacob was a prophet of God, and progenitor of His chosen people.","type":"Divine"},{"name":"Jacob","connection":"Jacob saw the Lord in a vision and was a prophet of God.","type":"Divine"},{"name":"Jared","connection":"The Lord guided Jared, his brother, and their people to the promised land.","type":"Divine"},{"name":"Joshua","connection":"Joshua was a prophet of the Lord.","type":"Divine"},{"name":"Lehi","connection":"Lehi was a prophet of God and saw God and Jesus in a vision.","type":"Divine"},{"name":"Malachi","connection":"Malachi was a prophet of God.","type":"Divine"},{"name":"Micah","connection":"Micah was a prophet of God.","type":"Divine"},{"name":"Mormon","connection":"Mormon was a prophet of God; God and Jesus ministered to him and his son, Moroni.","type":"Divine"},{"name":"Moroni","connection":"Moroni was a prophet of God; God and Jesus ministered to him and his father, Mormon.","type":"Divine"},{"name":"Moses","connection":"Moses was a prophet of God. God showed him a vision of everything in the world from beginning to end.","type":"Divine"},{"name":"Mosiah","connection":"Mosiah was a prophet of God.","type":"Divine"},{"name":"Nephi","connection":"Nephi was a prophet of God and had a vision of Christ.","type":"Divine"},{"name":"Nephi2","connection":"Nephi Son of Helaman was a prophet and father of the Nephi whom Christ chose as an apostle among the Nephites.","type":"Divine"},{"name":"SamuelLamanite","connection":"The Lord told Samuel to turn back after being rejected in Zarahemla and told him what to preach to the Nephites.","type":"Divine"},{"name":"Satan","connection":"The Godhead and Satan are at war with each other.","type":"Divine"},{"name":"Sherem","connection":"The Lord struck Sherem to the earth as a sign of His power.","type":"Divine"},{"name":"Zenock","connection":"Zenock was a prophet of God.","type":"Divine"},{"name":"Zenos","connection":"Zenos was a prophet of God.","type":"Divine"}]},{"name":"Helaman","relations":[{"name":"Alma","connection":"Helaman was Alma\'s grandson.","type":"Family"},{"name":"Alma2","connection":"Helaman was Alma the Younger\'s son.","type":"Family"},{"name":"Amalickiah","connection":"Helaman was one of the generals fighting in the war against Amalickiah.","type":"Enemy"},{"name":"Ammoron","connection":"Helaman was a leader in Captain Moroni\'s army when they fought against Amalickiah and his brother, Ammoron.","type":"Enemy"},{"name":"CaptainMoroni","connection":"Helaman was a leader in Captain Moroni\'s army when they fought against Amalickiah and his brother. Helaman led the 2,000 stripling warriors under Moroni\'s command.","type":"Associate"},{"name":"Gid","connection":"Helaman and Gid were fellow army commanders serving under Captain Moroni.","type":"Associate"},{"name":"Helaman2","connection":"Helaman was Helaman\'s father.","type":"Family"},{"name":"Lehi2","connection":"Helaman was Lehi\'s grandfather.","type":"Family"},{"name":"Nephi2","connection":"Helaman was Nephi\'s grandfather.","type":"Family"}]},{"name":"Helaman2","relations":[{"name":"Alma2","connection":"Helaman was Alma the Younger\'s grandson.","type":"Family"},{"name":"Helaman","connection":"Helaman was the Son of Helaman (Alma the Younger\'s son).","type":"Family"},{"name":"Lehi2","connection":"Helaman Son of Helaman was Lehi\'s father.","type":"Family"},{"name":"Nephi2","connection":"Helaman Son of Helaman was Nephi\'s father.","type":"Family"}]},{"name":"Isaiah","relations":[{"name":"Godhead","connection":"Isaiah was a prophet of God who had many visions of the Godhead.","type":"Divine"}]},{"name":"Jacob","relations":[{"name":"Angels","connection":"Jacob was visited by angels and had many visions.","type":"Divine"},{"name":"BrothersNephi","connection":"Jacob was Laman and Lemuel\'s younger brother","type":"Family"},{"name":"Enos","connection":"Jacob was Enos\' father.","type":"Family"},{"name":"Godhead","connection":"Jacob saw the Lord in a vision and was His prophet.","type":"Divine"},{"name":"Jarom","connection":"Jacob was Jarom\'s grandfather.","type":"Family"},{"name":"Joseph2","connection":"Jacob was Joseph\'s brother.","type":"Family"},{"name":"Lehi","connection":"Jacob was Lehi\'s son.","type":"Family"},{"name":"Nephi","connection":"Jacob was Nephi\'s brother.","type":"Family"},{"name":"Sariah","connection":"Jacob was Sariah\'s son.","type":"Family"},{"name":"Sherem","connection":"Jacob confounded Sherem in all his words when Sherem challenged Jacob\'s faith.","type":"Enemy"}]},{"name":"Jacob2","relations":[{"name":"Godhead","connection":"Jacob was a prophet of God and had a vision of the Savior.","type":"Divine"},{"name":"Joseph","connection":"Jacob was Joseph\'s father.","type":"Family"}]},{"name":"Jared","relations":[{"name":"BrotherJared","connection":"The brother of Jared was Jared\'s brother.","type":"Family"},{"name":"Godhead","connection":"Jared, his brother, and their people were led to the promised land by the Lord.","type":"Divine"}]},{"name":"Jared2","relations":[{"name":"Akish","connection":"Jared Son of Omer was murdered by Akish after Akish married Jared\'s daughter.","type":"Enemy"},{"name":"DaughterJared","connection":"This woman was Jared\'s daughter.","type":"Family"}]},{"name":"Jarom","relations":[{"name":"Amaron","connection":"Jarom was Amaron\'s grandfather.","type":"Family"},{"name":"Enos","connection":"Jarom was Enos\'s son.","type":"Family"},{"name":"Jacob","connection":"Jarom was Jacob\'s grandson.","type":"Family"},{"name":"Omni","connection":"Jarom was Omni\'s father.","type":"Family"}]},{"name":"JohnBaptist","relations":[{"name":"ChristAmerica","connection":"John the Baptist was Jesus\'s cousin who prepared the way for His first coming.","type":"Family"},{"name":"Lehi","connection":"Lehi saw John the Baptist in a vision.","type":"Divine"},{"name":"Nephi","connection":"Nephi saw John the Baptist in a vision.","type":"Divine"}]},{"name":"Joseph","relations":[{"name":"Jacob2","connection":"Joseph was Jacob\'s son.","type":"Family"}]},{"name":"Joseph2","relations":[{"name":"BrothersNephi","connection":"Laman and Lemuel were Joseph\'s brothers.","type":"Family"},{"name":"Jacob","connection":"Jacob was Joseph\'s brother.","type":"Family"},{"name":"Lehi","connection":"Lehi was Joseph\'s father.","type":"Family"},{"name":"Nephi","connection":"Nephi was Joseph\'s brother.","type":"Family"},{"name":"Sariah","connection":"Sariah was Joseph\'s mother.","type":"Family"}]},{"name":"Joshua","relations":[{"name":"Godhead","connection":"Joshua was a prophet of the Lord.","type":"Divine"},{"name":"Moses","connection":"Joshua assisted Moses during the Exodus and was chosen by God to succeed Moses as the next leader of the Hebrews.","type":"Associate"}]},{"name":"Korihor","relations":[{"name":"Alma2","connection":"Alma the Younger struck Korihor dumb as a sign of God\'s power, after hearing him preach false doctrine.","type":"Enemy"},{"name":"Giddonah","connection":"Korihor was examined by Giddonah the priest before he was brought before Alma.","type":"Enemy"},{"name":"Satan","connection":"Satan appeared to Korihor and told him what false doctrine to preach.","type":"Associate"}]},{"name":"Laban","relations":[{"name":"BrothersNephi","connection":"Nephi and his brothers got the brass plates from Laban, who tried to kill them in the process.","type":"Enemy"},{"name":"Nephi","connection":"Nephi obtained the brass plates from Laban after asking, bartering, and finally killing him.","type":"Enemy"}]},{"name":"Lachoneus","relations":[{"name":"Giddianhi","connection":"Lachoneus was the leader of the Nephite army who defeated Giddianhi and his robbers.","type":"Enemy"},{"name":"Gidgiddoni","connection":"Gidgiddoni served as a chief captain under Lachoneus when fighting the Gaddianton robbers.","type":"Associate"}]},{"name":"Laman2","relations":[{"name":"Amalickiah","connection":"Laman was a soldier fighting against Amalickiah\'s army.","type":"Enemy"},{"name":"Ammoron","connection":"Laman was a soldier fighting against Ammoron\'s army.","type":"Enemy"},{"name":"CaptainMoroni","connection":"Laman was a soldier in Captain Moroni\'s army when they fought against Amalickiah and Ammoron.","type":"Associate"}]},{"name":"Lamoni","relations":[{"name":"Aaron","connection":"Lamoni, Aaron, and others counseled together about how to defend against the Lamanites.","type":"Associate"},{"name":"Ammon","connection":"Lamoni, Ammon, and others counseled together about how to defend against the Lamanites. Ammon also helped convert Lamoni and his people to the faith.","type":"Associate"},{"name":"Angels","connection":"Lamoni had a vision of an angel while unconscious.","type":"Divine"},{"name":"AntiNephiLehi","connection":"Lamoni and Anti-Nephi-Lehi were brothers.","type":"Family"},{"name":"FatherLamoni","connection":"Lamoni\'s father.","type":"Family"}]},{"name":"Lehi","relations":[{"name":"BrothersNephi","connection":"Lehi was Laman\'s and Lemuel\'s father.","type":"Family"},{"name":"Enos","connection":"Lehi was Enos\' grandfather.","type":"Family"},{"name":"Godhead","connection":"Lehi was a prophet of God and saw God and Jesus in a vision.","type":"Divine"},{"name":"Jacob","connection":"Lehi was Jacob\'s father.","type":"Family"},{"name":"JohnBaptist","connection":"Lehi saw John the Baptist in a vision.","type":"Divine"},{"name":"Joseph2","connection":"Lehi was Joseph\'s father.","type":"Family"},{"name":"Nephi","connection":"Lehi was Nephi\'s father.","type":"Family"},{"name":"Sariah","connection":"Lehi was Sariah\'s husband.","type":"Family"}]},{"name":"Lehi2","relations":[{"name":"Aminadab","connection":"After the experience with Lehi and Nephi being surrounded by fire, Aminadab was brought back to the faith.","type":"Associate"},{"name":"Angels","connection":"Lehi and Nephi conversed with angels while surrounded by heavenly fire.","type":"Divine"},{"name":"Nephi2","connection":"Lehi was Nephi\'s brother.","type":"Family"},{"name":"Helaman","connection":"Lehi was the grandson of Helaman.","type":"Family"},{"name":"Helaman2","connection":"Lehi was the son of Helaman Son of Helaman.","type":"Family"}]},{"name":"Lehi3","relations":[{"name":"Amalickiah","connection":"Amalickiah and his brother fought against the Nephite army, over which Lehi was a commander.","type":"Enemy"},{"name":"Ammoron","connection":"Ammoron and his brother fought against the Nephite army, over which Lehi was a commander.","type":"Enemy"},{"name":"CaptainMoroni","connection":"Lehi was a commander under Captain Moroni in the war against Amalickiah and his brother.","type":"Associate"},{"name":"Gid","connection":"Gid and Lehi were fellow army commanders serving under Captain Moroni.","type":"Associate"}]},{"name":"Limhi","relations":[{"name":"Alma","connection":"Alma baptized Limhi after preaching to him and his people.","type":"Associate"},{"name":"Ammon2","connection":"Limhi and his people were found, taught, and delivered with Ammon\'s help.","type":"Associate"},{"name":"Gideon","connection":"Gideon was captain of Limhi\'s armies. Gideon helped organize the escape of Limhi\'s people from bondage.","type":"Associate"},{"name":"Mosiah","connection":"Limhi became subject to King Mosiah. He also gave Mosiah the Jaredite plates so he could translate them.","type":"Associate"},{"name":"Noah","connection":"Limhi was King Noah\'s son.","type":"Family"},{"name":"Zeniff","connection":"Limhi was Zeniff\'s grandson.","type":"Family"}]},{"name":"Malachi","relations":[{"name":"Godhead","connection":"Malachi was a prophet of God.","type":"Divine"}]},{"name":"Micah","relations":[{"name":"Godhead","connection":"Micah was a prophet of God.","type":"Divine"}]},{"name":"Mormon","relations":[{"name":"Ammaron","connection":"Ammaron told Mormon where to find sacred records so he could continue writing the Nephite record.","type":"Associate"},{"name":"Godhead","connection":"Mormon was a prophet of God; God and Jesus ministered to him and his son, Moroni.","type":"Divine"},{"name":"Moroni","connection":"Mormon was Moroni\'s father.","type":"Family"}]},{"name":"Moroni","relations":[{"name":"Godhead","connection":"Moroni was a prophet of God; God and Jesus ministered to him and his father, Mormon.","type":"Divine"},{"name":"Mormon","connection":"Moroni was Mormon\'s son.","type":"Family"}]},{"name":"Moses","relations":[{"name":"Godhead","connection":"Moses was a prophet of God; God showed him a vision of everything in the world from beginning to end.","type":"Divine"},{"name":"Joshua","connection":"Joshua assisted Moses during the Exodus and was chosen by God to succeed Moses as the next leader of the Hebrews.","type":"Associate"},{"name":"Satan","connection":"Moses was tempted by Satan.","type":"Enemy"}]},{"name":"Mosiah","relations":[{"name":"Aaron","connection":"Mosiah was Aaron\'s father.","type":"Family"},{"name":"Alma2","connection":"Mosiah made Alma the Younger the first chief judge, after he stepped down from the throne.","type":"Associate"},{"name":"Ammon","connection":"Mosiah was Ammon\'s father.","type":"Family"},{"name":"Ammon2","connection":"Ammon the Mulekite petitioned Mosiah so Limhi\'s people could come live with them.","type":"Associate"},{"name":"Benjamin","connection":"Mosiah was Benjamin\'s son. Mosiah\'s grandfather was also named Mosiah.","type":"Family"},{"name":"Godhead","connection":"Mosiah was a prophet of God.","type":"Divine"},{"name":"Limhi","connection":"Limhi became subject to Mosiah","type":"Associate"}]},{"name":"Nephi","relations":[{"name":"Angels","connection":"Nephi saw a vision that was narrated by an angel. Another angel intervened when Laman and Lemuel were beating Nephi and Sam.","type":"Divine"},{"name":"BrothersNephi","connection":"Laman and Lemuel were Nephi\'s brothers.","type":"Family"},{"name":"Godhead","connection":"Nephi was a prophet of God and had a vision of Christ.","type":"Divine"},{"name":"Jacob","connection":"Nephi was Jacob\'s brother.","type":"Family"},{"name":"Joseph2","connection":"Nephi was Joseph\'s brother.","type":"Family"},{"name":"JohnBaptist","connection":"Nephi saw John the Baptist in a vision.","type":"Divine"},{"name":"Laban","connection":"Nephi obtained the brass plates from Laban after asking, bartering, and finally killing him.","type":"Enemy"},{"name":"Lehi","connection":"Nephi was Lehi\'s son.","type":"Family"},{"name":"Sariah","connection":"Nephi was Sariah\'s son.","type":"Family"}]},{"name":"Nephi2","relations":[{"name":"Aminadab","connection":"After the experience with Nephi and Lehi being surrounded by fire, Aminadab was brought back to the faith.","type":"Associate"},{"name":"Angels","connection":"Nephi and Lehi conversed with angels while surrounded by heavenly fire.","type":"Divine"},{"name":"Godhead","connection":"Nephi was a prophet and father of the Nephi who Christ chose as an apostle among the Nephites.","type":"Divine"},{"name":"Helaman","connection":"Nephi was the grandson of Helaman.","type":"Family"},{"name":"Helaman2","connection":"Nephi was the son of Helaman Son of Helaman.","type":"Family"},{"name":"Lehi2","connection":"Nephi was Lehi\'s brother.","type":"Family"},{"name":"SamuelLamanite","connection":"Nephi baptized the believers after Samuel\'s preaching.","type":"Associate"}]},{"name":"Nephihah","relations":[{"name":"Alma2","connection":"Nephihah was Alma the Younger\'s successor for the judgment-seat.","type":"Associate"},{"name":"Pahoran","connection":"Nephihah was Pahoran\'s father; Pahoran took the judgment-seat after Nephihah died.","type":"Family"}]},{"name":"Noah","relations":[{"name":"Abinadi","connection":"King Noah sentenced Abinadi to death after Abinadi testified in the royal court.","type":"Enemy"},{"name":"Alma","connection":"Alma was a priest in King Noah\'s court before he was converted.","type":"Associate"},{"name":"Gideon","connection":"Noah pled for his life to Gideon, who was attempting to kill him.","type":"Enemy"},{"name":"Limhi","connection":"Noah was Limhi\'s father.","type":"Family"},{"name":"Satan","connection":"Satan had great hold on Noah\'s heart.","type":"Associate"},{"name":"Zeniff","connection":"Noah was Zeniff\'s son.","type":"Family"}]},{"name":"Omni","relations":[{"name":"Amaron","connection":"Omni was Amaron\'s father.","type":"Family"},{"name":"Chemish","connection":"Omni was Chemish\'s father.","type":"Family"},{"name":"Enos","connection":"Omni was Enos\'s grandson.","type":"Family"},{"name":"Jarom","connection":"Omni was Jarom\'s son.","type":"Family"}]},{"name":"Pahoran","relations":[{"name":"Amalickiah","connection":"Pahoran, the chief judge, fought in the war against Amalickiah and Ammoron.","type":"Enemy"},{"name":"Ammoron","connection":"Pahoran, the chief judge, fought in the war against Amalickiah and Ammoron.","type":"Enemy"},{"name":"CaptainMoroni","connection":"Pahoran was one of the chief judges in Captain Moroni\'s time and fought with him against Ammoron and Amalickiah.","type":"Associate"},{"name":"Nephihah","connection":"Pahoran was Nephihah\'s son and took the judgment-seat after Nephihah died.","type":"Family"}]},{"name":"SamuelLamanite","relations":[{"name":"Angels","connection":"An angel spoke to Samuel, declaring glad tidings and that destruction awaited the Nephites unless they repented.","type":"Divine"},{"name":"ChristAmerica","connection":"Samuel foretold Christ\'s birth and death.","type":"Divine"},{"name":"Godhead","connection":"The Lord told Samuel to turn back after being cast out of Zarahemla and told him what to preach to the Nephites.","type":"Divine"},{"name":"Nephi2","connection":"After Samuel\'s preaching, the believers were baptized by Nephi.","type":"Associate"}]},{"name":"Sariah","relations":[{"name":"BrothersNephi","connection":"Sariah was Nephi and his brothers\' mother.","type":"Family"},{"name":"Enos","connection":"Sariah was Enos\' grandmother.","type":"Family"},{"name":"Jacob","connection":"Sariah was Jacob\'s mother.","type":"Family"},{"name":"Joseph2","connection":"Sariah was Joseph\'s mother.","type":"Family"},{"name":"Lehi","connection":"Sariah was Lehi\'s wife.","type":"Family"},{"name":"Nephi","connection":"Sariah was Nephi\'s mother.","type":"Family"}]},{"name":"Satan","relations":[{"name":"Aaron","connection":"Before he was converted to the Lord, Aaron went about with his brothers and Alma the Younger teaching Satan\'s doctrine.","type":"Associate"},{"name":"Akish","connection":"Satan put it into Akish\'s heart to dig up the secret oaths and combinations in order to murder Jared Son of Omer.","type":"Associate"},{"name":"Alma2","connection":"Before he was converted to the Lord, Alma the Younger and the sons of Mosiah went about teaching Satan\'s doctrine.","type":"Associate"},{"name":"Amalickiah","connection":"Satan had great hold on Amalickiah\'s heart.","type":"Associate"},{"name":"Ammon","connection":"Before he was converted to the Lord, Ammon went about with his brothers and Alma the Younger teaching Satan\'s doctrine.","type":"Associate"},{"name":"Ammoron","connection":"Satan had great hold on Ammoron\'s heart.","type":"Associate"},{"name":"Angels","connection":"Satan is a fallen angel.","type":"Divine"},{"name":"BrothersNephi","connection":"Satan influenced Laman and Lemuel.","type":"Associate"},{"name":"ChristAmerica","connection":"Satan and Christ are enemies.","type":"Enemy"},{"name":"FatherLamoni","connection":"Satan influenced Lamoni\'s father before his conversion.","type":"Associate"},{"name":"Giddianhi","connection":"Satan had a great hold on Giddianhi\'s heart and gave him the secret combinations.","type":"Associate"},{"name":"Godhead","connection":"Satan and the Godhead are at war with each other.","type":"Divine"},{"name":"Korihor","connection":"Satan appeared to Korihor and told him what false doctrine to preach.","type":"Associate"},{"name":"Moses","connection":"Satan tried to tempt Moses.","type":"Enemy"},{"name":"Noah","connection":"Satan had great hold on King Noah\'s heart.","type":"Associate"},{"name":"Sherem","connection":"Sherem taught false doctrines from Satan.","type":"Associate"},{"name":"Zeezrom","connection":"Before Zeezrom\'s conversion, Satan had great hold on his heart.","type":"Enemy"},{"name":"Zerahemnah","connection":"Satan had hold on Zerahemnah\'s heart.","type":"Associate"}]},{"name":"Sherem","relations":[{"name":"Godhead","connection":"The Lord struck Sherem to the earth as a sign of His power.","type":"Divine"},{"name":"Jacob","connection":"Sherem challenged Jacob\'s faith, but Jacob confounded him in all his words.","type":"Enemy"},{"name":"Satan","connection":"Sherem taught false doctrines from Satan.","type":"Associate"}]},{"name":"Zeezrom","relations":[{"name":"Aaron","connection":"Zeezrom and Aaron went on a mission to the Zoramites together.","type":"Associate"},{"name":"Alma2","connection":"Zeezrom was converted after hearing Alma the Younger\'s and Amulek\'s testimonies. They later went on missions together.","type":"Associate"},{"name":"Ammon","connection":"Zeezrom and Ammon went on a mission to the Zoramites together.","type":"Associate"},{"name":"Amulek","connection":"Zeezrom was converted after hearing Amulek\'s and Alma the Younger\'s testimonies. They later served missions together.","type":"Associate"},{"name":"Satan","connection":"Before Zeezrom\'s conversion, Satan had great hold on his heart.","type":"Associate"}]},{"name":"Zeniff","relations":[{"name":"Limhi","connection":"Zeniff was Limhi\'s grandfather.","type":"Family"},{"name":"Noah","connection":"Zeniff was King Noah\'s father.","type":"Family"}]},{"name":"Zenock","relations":[{"name":"Godhead","connection":"Zenock was a prophet of God.","type":"Divine"}]},{"name":"Zenos","relations":[{"name":"Godhead","connection":"Zenos was a prophet of God.","type":"Divine"}]}]');
+let linguisticData = [{"name":"Abinadi","relations":[{"name":"Godhead","connection":"The Lord sent Abinadi to preach.","type":"Quote"},{"name":"Isaiah","connection":"Abinadi quoted the words of Isaiah.","type":"Quote"},{"name":"Moses","connection":"Abinadi quoted the words of Moses.","type":"Quote"}]},{"name":"Alma2","relations":[{"name":"Zenock","connection":"Alma the Younger quoted the words of Zenock.","type":"Quote"},{"name":"Zenos","connection":"Alma the Younger quoted the words of Zenos.","type":"Quote"}]},{"name":"CaptainMoroni","relations":[{"name":"Godhead","connection":"Captain Moroni quoted the Lord while preaching.","type":"Quote"},{"name":"Jacob2","connection":"Captain Moroni quoted Jacob (Israel).","type":"Quote"}]},{"name":"ChristAmerica","relations":[{"name":"Isaiah","connection":"Christ quoted Isaiah while ministering in the new world.","type":"Quote"},{"name":"Malachi","connection":"Christ quoted Malachi while ministering in the new world.","type":"Quote"},{"name":"JohnBaptist","connection":"Jesus was John the Baptist's cousin, and John prepared the way for His first coming.","type":"Divine"},{"name":"Micah","connection":"Christ quoted Micah while ministering in the new world.","type":"Quote"},{"name":"Moses","connection":"Christ quoted Moses while ministering in the new world.","type":"Quote"}]},{"name":"Godhead","relations":[{"name":"Abinadi","connection":"The Lord sent Abinadi to preach.","type":"Quote"},{"name":"Amaron","connection":"Amaron quoted the Lord in his brief writings.","type":"Quote"},{"name":"CaptainMoroni","connection":"Captain Moroni quoted the Lord while preaching.","type":"Quote"}]},{"name":"Isaiah","relations":[{"name":"Abinadi","connection":"Abinadi quoted the words of Isaiah.","type":"Quote"},{"name":"ChristAmerica","connection":"Christ quoted Isaiah while ministering in the new world.","type":"Quote"},{"name":"Jacob","connection":"Jacob quoted Isaiah in his preaching.","type":"Quote"},{"name":"Nephi","connection":"Nephi quoted Isaiah to his brothers.","type":"Quote"}]},{"name":"Jacob","relations":[{"name":"Zenos","connection":"Jacob quoted Zenos's allegory of the olive tree.","type":"Quote"},{"name":"Jacob","connection":"Jacob quoted Isaiah in his preaching.","type":"Quote"}]},{"name":"Jacob2","relations":[{"name":"CaptainMoroni","connection":"Captain Moroni quoted Jacob (Israel).","type":"Quote"}]},{"name":"JohnBaptist","relations":[{"name":"Lehi","connection":"Lehi quoted John the Baptist after seeing him in a vision.","type":"Quote"}]},{"name":"Joseph","relations":[{"name":"Lehi","connection":"Lehi quoted Joseph from the Old Testament while blessing his son, Joseph.","type":"Quote"}]},{"name":"Lehi","relations":[{"name":"JohnBaptist","connection":"Lehi quoted John the Baptist after seeing him in a vision.","type":"Quote"},{"name":"Joseph","connection":"Lehi quoted Joseph from the Old Testament while blessing his son, Joseph.","type":"Quote"}]},{"name":"Malachi","relations":[{"name":"ChristAmerica","connection":"Christ quoted Malachi while ministering in the New World.","type":"Quote"}]},{"name":"Micah","relations":[{"name":"ChristAmerica","connection":"Christ quoted Micah while ministering in the New World.","type":"Quote"}]},{"name":"Moses","relations":[{"name":"Abinadi","connection":"Abinadi quoted Moses in his preaching","type":"Quote"},{"name":"ChristAmerica","connection":"Christ quoted Moses while ministering in the New World.","type":"Quote"},{"name":"Nephi","connection":"Nephi quoted the words of Moses.","type":"Quote"}]},{"name":"Nephi","relations":[{"name":"Isaiah","connection":"Nephi quoted Isaiah to his brothers.","type":"Quote"},{"name":"Moses","connection":"Nephi quoted the words of Moses.","type":"Quote"},{"name":"Zenock","connection":"Nephi quoted Zenos's prophecies of Christ.","type":"Quote"},{"name":"Zenos","connection":"Nephi quoted Zenock's prophecies of Christ.","type":"Quote"}]},{"name":"Zenock","relations":[{"name":"Alma2","connection":"Alma quoted the words of Zenock.","type":"Quote"},{"name":"Nephi","connection":"Nephi quoted Zenock's prophecies of Christ.","type":"Quote"}]},{"name":"Zenos","relations":[{"name":"Alma2","connection":"Alma quoted the words of Zenos.","type":"Quote"},{"name":"Jacob","connection":"Jacob quoted Zenos's allegory of the olive tree.","type":"Quote"},{"name":"Nephi","connection":"Nephi quoted Zenos's prophecies of Christ.","type":"Quote"}]}];
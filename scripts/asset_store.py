@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""Find duplicate images by content hash and link one copy of each payload.
+
+The same portrait often sits under several paths (`content/people/<a>/<a>.jpg` and
+`content/people/<b>/<b>.jpg`, and again under the widget folders), so browsers and CDNs fetch and
+cache it once per URL. This step hashes every image under `docs/`, picks one canonical copy per
+payload (content first, then shared images, then widget folders; shortest path on ties) and records,
+in the committed `img/asset-aliases.json`, the canonical copy for each duplicate under `content/`:
+
+    {
+      "version": 1,
+      "files": {
+        "content/people/benjamin-people/benjamin-people.jpg": {
+          "canonical": "content/people/benjamin-new/benjamin-new.jpg",
+          "hash": "6b0d..."
+        }
+      }
+    }
+
+generate_content_pages.py links the canonical copy wherever it writes one of those paths (the `<img>`
+fallback and the index avatars; the srcset derivatives are already named by hash), the same way it
+links `--fingerprint` copies, so no second copy is stored. An entry is only used while both files
+still hash to the recorded payload, so replacing an image takes effect before the step is re-run.
+
+The widgets build their image URLs at runtime (`"../../Images/" + name + ".jpg"`), so their copies
+are left where they are. `--link` additionally replaces duplicate images anywhere under `docs/` with
+hard links to the canonical copy. That only saves local disk space: links are lost on clone and on
+most deploys, and editing one linked copy in place changes all of them, so replace such files rather
+than edit them.
+
+Hashes are cached by size and mtime in `.cache/asset-store.json`.
+
+`place()` is the metadata-only copy/move the import scripts use: a rename for moves, and a reflink
+(falling back to a real copy) for copies.
+
+Usage:
+    uv run scripts/bomex.py assets
+"""
+
+from __future__ import annotations
+
+import argparse
+import errno
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # optional (not on Windows)
+    fcntl = None
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DOCS_ROOT = REPO_ROOT / "docs"
+CACHE_PATH = REPO_ROOT / ".cache" / "asset-store.json"
+
+ALIASES_NAME = "img/asset-aliases.json"
+ALIASES_VERSION = 1
+CACHE_VERSION = 1
+ASSET_SUFFIXES = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif")
+
+# Images whose URLs the page generator writes, and so get an alias.
+ALIAS_SOURCES = ("content/",)
+
+# Which copy of a duplicated payload is canonical for --link: the first matching prefix, then the shortest path.
+CANONICAL_PREFIXES = ("content/", "img/", "widgets/Images/", "widgets/")
+
+FICLONE = 0x40049409  # linux/fs.h: share src's extents with dst (copy-on-write)
+
+Entry = Dict[str, Any]
+
+
+def _clone(src: Path, dst: Path) -> bool:
+    """Reflink src to a new file dst; False where the filesystem (or platform) can't."""
+    if fcntl is None:
+        return False
+    try:
+        with src.open("rb") as s, dst.open("xb") as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+    except OSError:
+        dst.unlink(missing_ok=True)
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def _tmp_name(dst: Path) -> Path:
+    return dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+
+
+def place(src: Path, dst: Path, *, move: bool = False, reflink: bool = True, link: bool = False) -> str:
+    """Make dst hold src's content without copying bytes where the filesystem allows.
+
+    Moves are renames. Copies are a reflink, else a real copy; with `link`, a hard link instead (see
+    the module docstring for why that's opt-in). dst is replaced atomically if it exists. Returns how:
+    "same", "renamed", "reflinked", "linked" or "copied".
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if dst.exists() and os.path.samefile(src, dst):
+            return "same"
+    except OSError:
+        pass
+    if move:
+        try:
+            os.replace(src, dst)
+            return "renamed"
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
+    tmp = _tmp_name(dst)
+    tmp.unlink(missing_ok=True)
+    try:
+        if link:
+            try:
+                os.link(src, tmp)
+                how = "linked"
+            except OSError:
+                shutil.copy2(src, tmp)
+                how = "copied"
+        elif reflink and _clone(src, tmp):
+            how = "reflinked"
+        else:
+            shutil.copy2(src, tmp)
+            how = "copied"
+        os.replace(tmp, dst)
+    finally:
+        tmp.unlink(missing_ok=True)
+    if move:
+        src.unlink()
+    return how
+
+
+def _read_versioned(path: Path, version: int) -> Dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != version or not isinstance(data.get("files"), dict):
+        return {}
+    return data
+
+
+class HashCache:
+    """Content hashes of files, reused while their size and mtime are unchanged."""
+
+    def __init__(self, path: Optional[Path], *, force: bool = False) -> None:
+        self.path = path
+        self.entries: Dict[str, Entry] = {}
+        if path is not None and not force:
+            self.entries = _read_versioned(path, CACHE_VERSION).get("files", {})
+        self.used: Dict[str, Entry] = {}
+
+    def hash(self, path: Path) -> str:
+        key = str(path.resolve())
+        st = path.stat()
+        entry = self.entries.get(key)
+        if not entry or (entry.get("size"), entry.get("mtime_ns")) != (st.st_size, st.st_mtime_ns):
+            entry = {"hash": _hash_file(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        self.used[key] = entry
+        return entry["hash"]
+
+    def save(self, docs_root: Path) -> None:
+        """Write the hashes used this run, keeping other site roots' entries (bench and test builds)."""
+        if self.path is None:
+            return
+        prefix = str(docs_root.resolve()) + os.sep
+        entries = {k: v for k, v in self.entries.items() if not k.startswith(prefix)}
+        entries.update(self.used)
+        _write_if_changed(self.path, json.dumps({"version": CACHE_VERSION, "files": dict(sorted(entries.items()))}))
+
+
+def load_aliases(docs_root: Path, cache_path: Optional[Path] = CACHE_PATH) -> Dict[str, str]:
+    """{site path: canonical site path} for each recorded duplicate that still has its canonical's content."""
+    cache = HashCache(cache_path)
+    aliases: Dict[str, str] = {}
+    for rel, entry in _read_versioned(docs_root / ALIASES_NAME, ALIASES_VERSION).get("files", {}).items():
+        try:
+            digest, canonical = entry["hash"], entry["canonical"]
+            if cache.hash(docs_root / rel) == digest and cache.hash(docs_root / canonical) == digest:
+                aliases[rel] = canonical
+        except (OSError, KeyError, TypeError):
+            continue
+    return aliases
+
+
+def _iter_assets(docs_root: Path) -> List[Path]:
+    found: List[Path] = []
+    for dirpath, dirnames, filenames in os.walk(docs_root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        for name in sorted(filenames):
+            if not name.startswith(".") and name.lower().endswith(ASSET_SUFFIXES):
+                found.append(Path(dirpath) / name)
+    return found
+
+
+def _canonical_key(rel: str) -> Tuple[int, int, str]:
+    rank = next((i for i, prefix in enumerate(CANONICAL_PREFIXES) if rel.startswith(prefix)), len(CANONICAL_PREFIXES))
+    return rank, len(rel), rel
+
+
+def _hash_file(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()[:16]
+
+
+def _write_if_changed(path: Path, content: str) -> None:
+    if not path.exists() or path.read_text(encoding="utf-8") != content:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+def build_store(
+    docs_root: Path, *, cache_path: Optional[Path] = CACHE_PATH, link: bool = False, force: bool = False
+) -> Tuple[int, int, int, int, int]:
+    """Hash the site's images and record each content duplicate's canonical copy; with `link`, hard-link duplicates.
+
+    Returns (images, distinct payloads, aliases, linked, bytes saved by linking).
+    """
+    cache = HashCache(cache_path, force=force)
+    groups: Dict[str, List[str]] = {}
+    for path in _iter_assets(docs_root):
+        groups.setdefault(cache.hash(path), []).append(path.relative_to(docs_root).as_posix())
+
+    files: Dict[str, Entry] = {}
+    linked = saved = 0
+    for digest, rels in groups.items():
+        canonical = min(rels, key=_canonical_key)
+        for rel in rels:
+            if rel != canonical and rel.startswith(ALIAS_SOURCES):
+                files[rel] = {"canonical": canonical, "hash": digest}
+        if not link:
+            continue
+        src = docs_root / canonical
+        inode = src.stat().st_ino
+        for rel in rels:
+            dst = docs_root / rel
+            if rel == canonical or dst.stat().st_ino == inode:
+                continue
+            if place(src, dst, link=True) == "linked":
+                linked += 1
+                saved += dst.stat().st_size
+            cache.hash(dst)
+
+    content = json.dumps({"version": ALIASES_VERSION, "files": files}, indent=2, sort_keys=True) + "\n"
+    _write_if_changed(docs_root / ALIASES_NAME, content)
+    cache.save(docs_root)
+    return sum(len(rels) for rels in groups.values()), len(groups), len(files), linked, saved
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Find duplicate docs/ images by content hash.")
+    parser.add_argument(
+        "--docs-root",
+        default=str(DOCS_ROOT),
+        help="Site root to scan (default: <repo>/docs)",
+    )
+    parser.add_argument(
+        "--cache",
+        default=str(CACHE_PATH),
+        help="Image hash cache (default: <repo>/.cache/asset-store.json)",
+    )
+    parser.add_argument(
+        "--link",
+        action="store_true",
+        help="Also hard-link duplicate images under docs/ (saves local disk only; links don't survive git or a deploy)",
+    )
+    parser.add_argument("--force", action="store_true", help="Ignore the hash cache and rehash every image")
+    args = parser.parse_args(argv)
+
+    docs_root = Path(args.docs_root)
+    total, payloads, aliases, linked, saved = build_store(
+        docs_root, cache_path=Path(args.cache), link=args.link, force=args.force
+    )
+    line = f"Assets: images={total} payloads={payloads} aliases={aliases}"
+    if args.link:
+        line += f" linked={linked} ({saved / 1e6:.1f} MB reclaimed)"
+    print(f"{line} -> {docs_root / ALIASES_NAME}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""Benchmark the build pipeline on synthetic corpora at several multiples of docs/content.
+
+For each scale the corpus is synthesised from the real content: every item is cloned with a suffixed
+id, fragments keep their tables and chronology blocks, some punctuation is turned into mojibake, and
+a legacy `*-analysis.js` file is emitted per item. Stages timed:
+
+- pages: `generate_content_pages` full (`--force`) build          -> items/s, MB/s of details + fragments
+  (into a site root with the real stylesheets, scripts and chrome, so critical CSS and chrome inlining
+  are part of the timing)
+- parse: `convert_people_to_static.parse_analysis_file`             -> blocks/s, MB/s of analysis JS
+- fix:   `fix_apostrophes.run` in check mode                        -> files/s, MB/s scanned
+
+Results can be saved as a baseline and later runs compared against it; any stage whose throughput
+drops by more than `--tolerance` fails the run. A run without a baseline fails too, unless it saves
+one: baselines are machine-specific, so record one on the machine that runs the comparison.
+
+Usage:
+    uv run scripts/bomex.py bench --scales 1,10 --save-baseline
+    uv run scripts/bomex.py bench --scales 1,10
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import convert_people_to_static as convert
+import fix_apostrophes
+import generate_content_pages as gen
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DETAILS_NAMES = {
+    "people": "person-details.json",
+    "concepts": "concept-details.json",
+    "influences": "influence-details.json",
+}
+ID_KEYS = {"people": "person_id", "concepts": "item_id", "influences": "item_id"}
+# What the pages stage reads from the site root besides content (stylesheets, scripts, chrome).
+SITE_FILES = ("css", "js", *gen.CHROME_FILES)
+
+
+def _mojibake(text: str, rng: random.Random) -> str:
+    """Re-introduce the legacy encoding damage fix_apostrophes is meant to repair."""
+    out: List[str] = []
+    for ch in text:
+        if ch == "’" and rng.random() < 0.3:
+            out.append("â€™" if rng.random() < 0.7 else "�")
+        elif ch == " " and rng.random() < 0.002:
+            out.append("Â ")
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def _analysis_js(blocks: List[Tuple[str, str]]) -> str:
+    branches = []
+    for i, (analysis_id, fragment) in enumerate(blocks):
+        jsx = fragment.replace('class="', 'className="').replace("<br>", "<br/>")
+        branches.append(
+            f'  {"else " if i else ""}if (id === "{analysis_id}") {{\n'
+            f"    return (\n      <div className=\"analysis\">{jsx}</div>\n    );\n  }}"
+        )
+    return "export default function Analysis({ id }) {\n" + "\n".join(branches) + "\n}\n"
+
+
+def synthesize_corpus(source: Path, dest: Path, scale: int, *, seed: int = 0) -> Dict[str, int]:
+    """Write `scale` copies of every item under `source` into `dest`; return corpus counts."""
+    rng = random.Random(seed)
+    counts = {"items": 0, "fragments": 0, "analysis_files": 0}
+    for kind, details_name in DETAILS_NAMES.items():
+        for details_path in sorted((source / kind).glob(f"*/{details_name}")):
+            data = json.loads(details_path.read_text(encoding="utf-8"))
+            fragments = {
+                p.name: p.read_text(encoding="utf-8") for p in sorted(details_path.parent.glob("*.html"))
+            }
+            for copy in range(scale):
+                suffix = f"-s{copy}" if copy else ""
+                item_dir = dest / kind / f"{details_path.parent.name}{suffix}"
+                item_dir.mkdir(parents=True, exist_ok=True)
+
+                clone = json.loads(json.dumps(data))
+                item_id = str(clone.get(ID_KEYS[kind]) or details_path.parent.name)
+                clone[ID_KEYS[kind]] = f"{item_id}{suffix}"
+                clone["display_name"] = f"{clone.get('display_name') or item_id}{suffix}"
+                (item_dir / details_name).write_text(json.dumps(clone, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+                blocks = []
+                for name, fragment in fragments.items():
+                    damaged = _mojibake(fragment, rng)
+                    (item_dir / name).write_text(damaged, encoding="utf-8")
+                    blocks.append((f"{Path(name).stem}{suffix}", damaged))
+                (item_dir / f"{item_dir.name}-analysis.js").write_text(_analysis_js(blocks), encoding="utf-8")
+
+                counts["items"] += 1
+                counts["fragments"] += len(fragments)
+                counts["analysis_files"] += 1
+    return counts
+
+
+def _tree_bytes(root: Path, pattern: str) -> int:
+    return sum(p.stat().st_size for p in root.rglob(pattern) if p.is_file())
+
+
+def _best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _site_root(out: Path) -> None:
+    """Give `out` the real SITE_FILES, so the pages stage does the same per-page work as a real build."""
+    out.mkdir(parents=True, exist_ok=True)
+    for name in SITE_FILES:
+        src = gen.SRC_ROOT / name
+        if src.is_dir():
+            shutil.copytree(src, out / name, dirs_exist_ok=True)
+        elif src.is_file():
+            shutil.copy2(src, out / name)
+
+
+def bench_scale(scale: int, work_root: Path, *, repeat: int, jobs: int) -> Dict[str, Dict[str, float]]:
+    corpus = work_root / f"content-x{scale}"
+    out = work_root / f"docs-x{scale}"
+    counts = synthesize_corpus(gen.SRC_ROOT / "content", corpus, scale)
+    _site_root(out)
+
+    results: Dict[str, Dict[str, float]] = {}
+
+    page_bytes = _tree_bytes(corpus, "*.json") + _tree_bytes(corpus, "*.html")
+    seconds = _best_of(
+        repeat,
+        lambda: gen.main(
+            ["--src-root", str(out), "--data-root", str(corpus), "--force", "--no-fragment-cache", "--jobs", str(jobs)]
+        ),
+    )
+    results["pages"] = _rates(seconds, counts["items"], page_bytes)
+
+    js_files = sorted(corpus.rglob("*-analysis.js"))
+    js_bytes = sum(p.stat().st_size for p in js_files)
+    block_count = sum(len(convert.parse_analysis_file(p)) for p in js_files)
+    seconds = _best_of(repeat, lambda: [convert.parse_analysis_file(p) for p in js_files])
+    results["parse"] = _rates(seconds, block_count, js_bytes)
+
+    fix_files = list(fix_apostrophes._iter_files(corpus))
+    fix_bytes = sum(p.stat().st_size for p in fix_files)
+    seconds = _best_of(repeat, lambda: fix_apostrophes.run(root=corpus, apply=False))
+    results["fix"] = _rates(seconds, len(fix_files), fix_bytes)
+
+    return results
+
+
+def _rates(seconds: float, items: int, nbytes: int) -> Dict[str, float]:
+    return {
+        "seconds": round(seconds, 4),
+        "items": items,
+        "bytes": nbytes,
+        "items_per_s": round(items / seconds, 1) if seconds else 0.0,
+        "mb_per_s": round(nbytes / 1e6 / seconds, 2) if seconds else 0.0,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Return one message per stage whose items/s fell more than `tolerance` below the baseline."""
+    regressions = []
+    for scale, stages in results.items():
+        for stage, current in stages.items():
+            base = baseline.get(scale, {}).get(stage)
+            if not base or not base.get("items_per_s"):
+                continue
+            ratio = current["items_per_s"] / base["items_per_s"]
+            if ratio < 1 - tolerance:
+                regressions.append(
+                    f"{scale} {stage}: {current['items_per_s']} items/s vs baseline {base['items_per_s']} ({ratio:.0%})"
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pages/parse/fix on synthetic corpora.")
+    parser.add_argument("--scales", default="1,10,100", help="Comma-separated corpus multiples (default: 1,10,100)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage; the fastest is kept (default: 3)")
+    parser.add_argument("--jobs", type=int, default=1, help="--jobs passed to the pages stage (default: 1)")
+    parser.add_argument(
+        "--baseline",
+        default=str(REPO_ROOT / "benchmarks" / "baseline.json"),
+        help="Baseline results to compare against (default: <repo>/benchmarks/baseline.json)",
+    )
+    parser.add_argument("--save-baseline", action="store_true", help="Write these results as the new baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed fractional drop in items/s before a stage counts as a regression (default: 0.25)",
+    )
+    parser.add_argument("--out", default="", help="Also write the results JSON here")
+    parser.add_argument("--keep", default="", help="Synthesise corpora into this directory and keep them")
+    args = parser.parse_args(argv)
+
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+
+    with contextlib.ExitStack() as stack:
+        if args.keep:
+            work_root = Path(args.keep).resolve()
+            shutil.rmtree(work_root, ignore_errors=True)
+            work_root.mkdir(parents=True)
+        else:
+            work_root = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="bomex-bench-")))
+
+        results: Dict[str, Any] = {}
+        for scale in scales:
+            results[f"x{scale}"] = bench_scale(scale, work_root, repeat=args.repeat, jobs=args.jobs)
+            for stage, r in results[f"x{scale}"].items():
+                print(
+                    f"x{scale:<4} {stage:<6} {r['items']:>7} items {r['seconds']:>8.3f}s "
+                    f"{r['items_per_s']:>10.1f} items/s {r['mb_per_s']:>8.2f} MB/s"
+                )
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"Saved baseline: {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; run with --save-baseline to create one.")
+        return 2
+
+    regressions = compare(results, json.loads(baseline_path.read_text(encoding="utf-8")), args.tolerance)
+    if regressions:
+        print("PERFORMANCE REGRESSION:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print(f"No regressions against {baseline_path} (tolerance {args.tolerance:.0%}).")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
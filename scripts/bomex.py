@@ -9,25 +9,51 @@ Examples:
     uv run scripts/bomex.py build --steps pages
     uv run scripts/bomex.py convert --in "old/bomex-webstructure/cameo jsons" --out docs/content
     uv run scripts/bomex.py images --copy
+    uv run --extra images scripts/bomex.py derivatives
+    uv run scripts/bomex.py assets
     uv run scripts/bomex.py pages
+    uv run scripts/bomex.py watch --serve 8008
     uv run scripts/bomex.py fix --check
+    uv run scripts/bomex.py data
+    uv run scripts/bomex.py verses --neighbors path/to/SimilarVerse/utils.js
+    uv run scripts/bomex.py widgets --verify
+    uv run scripts/bomex.py tiles
+    uv run scripts/bomex.py compress --jobs 0
+    uv run scripts/bomex.py serve --port 8008
+    uv run scripts/bomex.py icons --source path/to/fontawesome-free
+    uv run scripts/bomex.py bench --scales 1,10
 """
 
 from __future__ import annotations
 
 import argparse
-from typing import List, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Set
+
+if TYPE_CHECKING:
+    from build_profile import BuildProfiler
 
 
 def _print_help() -> None:
     print(
         "usage: bomex.py <command> [args...]\n\n"
         "Commands:\n"
-        "  build    Run multi-step pipeline (convert/images/pages/fix)\n"
-        "  convert  Convert legacy people sources (convert_people_to_static.py)\n"
-        "  images   Consolidate person images (move_person_images.py)\n"
-        "  pages    Generate docs pages (generate_content_pages.py)\n"
-        "  fix      Fix apostrophes/mojibake (fix_apostrophes.py)\n\n"
+        "  build        Run multi-step pipeline (convert/images/derivatives/assets/pages/fix/data/verses/widgets/tiles/compress)\n"
+        "  convert      Convert legacy people sources (convert_people_to_static.py)\n"
+        "  images       Consolidate person images (move_person_images.py)\n"
+        "  derivatives  Write resized/WebP/AVIF image derivatives (build_image_derivatives.py)\n"
+        "  assets       Find duplicate images by content hash; pages link one copy (asset_store.py)\n"
+        "  pages        Generate docs pages (generate_content_pages.py)\n"
+        "  watch        Regenerate affected pages on content changes (watch_content.py)\n"
+        "  fix          Fix apostrophes/mojibake (fix_apostrophes.py)\n"
+        "  data         Generate derived verse/speaker data scripts (build_derived_data.py)\n"
+        "  verses       Shard the similar-verse neighbour table (build_similar_verses.py)\n"
+        "  widgets      Compile widget chart data into compact payloads (compile_widget_data.py)\n"
+        "  tiles        Build semantic map quadtree tiles (build_semantic_tiles.py)\n"
+        "  compress     Write .gz/.br siblings and a static-server manifest (compress_site.py)\n"
+        "  serve        Serve docs/ with compression, cache headers and Range support (serve_site.py)\n"
+        "  icons        Subset Font Awesome to the icons the site uses (build_icon_subset.py)\n"
+        "  bench        Benchmark pages/parse/fix on synthetic corpora (benchmark.py)\n\n"
         "Help for a command:\n"
         "  uv run scripts/bomex.py <command> --help"
     )
@@ -42,7 +68,8 @@ def _build_main(argv: Optional[List[str]] = None) -> int:
         prog="bomex.py build",
         description=(
             "Build the BomEx static site. Optionally rebuild docs/content from legacy sources, "
-            "consolidate images, regenerate docs pages, and fix mojibake/apostrophes."
+            "consolidate images, write responsive image derivatives, store each image payload once, regenerate docs pages, fix mojibake/apostrophes, generate derived data, shard the similar-verse "
+            "index, compile widget data, tile the semantic map, and precompress the output."
         ),
     )
 
@@ -50,7 +77,8 @@ def _build_main(argv: Optional[List[str]] = None) -> int:
         "--steps",
         default="pages",
         help=(
-            "Comma-separated steps to run. Choices: convert, images, pages, fix. "
+            "Comma-separated steps to run. Choices: convert, images, derivatives, assets, pages, fix, data, verses, widgets, "
+            "tiles, compress. "
             "Default: pages. Example: --steps convert,images,pages"
         ),
     )
@@ -113,6 +141,17 @@ def _build_main(argv: Optional[List[str]] = None) -> int:
         default="docs/content",
         help="Data root for page generation (default: docs/content)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for the convert, derivatives, pages, fix and compress steps (default: 1; 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--fingerprint",
+        action="store_true",
+        help="Link generated pages to content-hashed asset copies listed in docs/manifest.json (pages step)",
+    )
 
     # fix_apostrophes.py args
     parser.add_argument(
@@ -126,19 +165,58 @@ def _build_main(argv: Optional[List[str]] = None) -> int:
         help="Report apostrophe fixes without modifying files (fix step)",
     )
 
+    # build_similar_verses.py args
+    parser.add_argument(
+        "--neighbors",
+        default=None,
+        help="Neighbour table for verses step (default: <src-root>/widgets/Widgets/SimilarVerse/utils.js)",
+    )
+
+    # Profiling
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record wall/CPU time, peak RSS, file I/O and hot spots per step",
+    )
+    parser.add_argument(
+        "--profile-out",
+        default=".cache/profile/build-profile.json",
+        help="JSON report path for --profile (default: .cache/profile/build-profile.json)",
+    )
+    parser.add_argument(
+        "--profile-pstats",
+        default="",
+        help="Also dump one cProfile .pstats file per step into this directory (--profile)",
+    )
+
     args = parser.parse_args(argv)
 
     steps = set(s.lower() for s in _split_csv(args.steps))
-    allowed = {"convert", "images", "pages", "fix"}
+    allowed = {"convert", "images", "derivatives", "assets", "pages", "fix", "data", "verses", "widgets", "tiles", "compress"}
     unknown = sorted(steps - allowed)
     if unknown:
         print(f"Unknown steps: {', '.join(unknown)}")
         return 2
 
+    from build_profile import BuildProfiler
+
+    profiler = BuildProfiler(args.profile, pstats_dir=Path(args.profile_pstats) if args.profile_pstats else None)
+    rc = _run_steps(args, steps, profiler)
+    if args.profile:
+        profiler.print_summary()
+        profiler.write(Path(args.profile_out), list(argv or []))
+        print(f"Profile report: {args.profile_out}")
+    return rc
+
+
+def _run_steps(args: argparse.Namespace, steps: Set[str], profiler: "BuildProfiler") -> int:
     if "convert" in steps:
         from convert_people_to_static import main as convert_main
 
-        rc = convert_main(["--in", args.in_dir, "--out", args.out_dir, "--include", args.include])
+        with profiler.step("convert") as report:
+            rc = report.rc = convert_main(
+                ["--in", args.in_dir, "--out", args.out_dir, "--include", args.include, "--jobs", str(args.jobs)]
+            )
         if rc != 0:
             return rc
 
@@ -158,24 +236,96 @@ def _build_main(argv: Optional[List[str]] = None) -> int:
         if args.dry_run:
             img_argv.append("--dry-run")
 
-        rc = move_images_main(img_argv)
+        with profiler.step("images") as report:
+            rc = report.rc = move_images_main(img_argv)
+        if rc != 0:
+            return rc
+
+    if "derivatives" in steps:
+        from build_image_derivatives import main as derivatives_main
+
+        with profiler.step("derivatives") as report:
+            rc = report.rc = derivatives_main(["--docs-root", args.src_root, "--jobs", str(args.jobs)])
+        if rc != 0:
+            return rc
+
+    if "assets" in steps:
+        from asset_store import main as assets_main
+
+        with profiler.step("assets") as report:
+            rc = report.rc = assets_main(["--docs-root", args.src_root])
         if rc != 0:
             return rc
 
     if "pages" in steps:
         from generate_content_pages import main as generate_pages_main
 
-        rc = generate_pages_main(["--src-root", args.src_root, "--data-root", args.data_root])
+        pages_argv: List[str] = ["--src-root", args.src_root, "--data-root", args.data_root, "--jobs", str(args.jobs)]
+        if args.fingerprint:
+            pages_argv.append("--fingerprint")
+        with profiler.step("pages") as report:
+            rc = report.rc = generate_pages_main(pages_argv)
         if rc != 0:
             return rc
 
     if "fix" in steps:
         from fix_apostrophes import main as fix_apostrophes_main
 
-        fix_argv: List[str] = ["--root", args.fix_root]
+        fix_argv: List[str] = ["--root", args.fix_root, "--jobs", str(args.jobs)]
         if args.check:
             fix_argv.append("--check")
-        rc = fix_apostrophes_main(fix_argv)
+        with profiler.step("fix") as report:
+            rc = report.rc = fix_apostrophes_main(fix_argv)
+        if rc != 0:
+            return rc
+
+    if "data" in steps:
+        from build_derived_data import main as data_main
+
+        with profiler.step("data") as report:
+            rc = report.rc = data_main(["--docs-root", args.src_root])
+        if rc != 0:
+            return rc
+
+    if "verses" in steps:
+        from build_similar_verses import main as verses_main
+
+        with profiler.step("verses") as report:
+            widgets = Path(args.src_root) / "widgets" / "Widgets"
+            verses_argv = [
+                "--neighbors",
+                args.neighbors or str(widgets / "SimilarVerse" / "utils.js"),
+                "--verses",
+                str(widgets / "SemanticMaps" / "bomVerses.js"),
+                "--out",
+                str(Path(args.src_root) / "data" / "similar-verses"),
+            ]
+            rc = report.rc = verses_main(verses_argv)
+        if rc != 0:
+            return rc
+
+    if "widgets" in steps:
+        from compile_widget_data import main as widgets_main
+
+        with profiler.step("widgets") as report:
+            rc = report.rc = widgets_main([])
+        if rc != 0:
+            return rc
+
+    if "tiles" in steps:
+        from build_semantic_tiles import main as tiles_main
+
+        with profiler.step("tiles") as report:
+            rc = report.rc = tiles_main([])
+        if rc != 0:
+            return rc
+
+    # Last, so the siblings match everything the other steps wrote.
+    if "compress" in steps:
+        from compress_site import main as compress_main
+
+        with profiler.step("compress") as report:
+            rc = report.rc = compress_main(["--docs-root", args.src_root, "--jobs", str(args.jobs)])
         if rc != 0:
             return rc
 
@@ -206,14 +356,58 @@ def main(argv: Optional[List[str]] = None) -> int:
         from move_person_images import main as images_main
 
         return images_main(forwarded)
+    if cmd == "derivatives":
+        from build_image_derivatives import main as derivatives_main
+
+        return derivatives_main(forwarded)
+    if cmd == "assets":
+        from asset_store import main as assets_main
+
+        return assets_main(forwarded)
     if cmd == "pages":
         from generate_content_pages import main as pages_main
 
         return pages_main(forwarded)
+    if cmd == "watch":
+        from watch_content import main as watch_main
+
+        return watch_main(forwarded)
     if cmd == "fix":
         from fix_apostrophes import main as fix_main
 
         return fix_main(forwarded)
+    if cmd == "data":
+        from build_derived_data import main as data_main
+
+        return data_main(forwarded)
+    if cmd == "verses":
+        from build_similar_verses import main as verses_main
+
+        return verses_main(forwarded)
+    if cmd == "widgets":
+        from compile_widget_data import main as widgets_main
+
+        return widgets_main(forwarded)
+    if cmd == "tiles":
+        from build_semantic_tiles import main as tiles_main
+
+        return tiles_main(forwarded)
+    if cmd == "compress":
+        from compress_site import main as compress_main
+
+        return compress_main(forwarded)
+    if cmd == "serve":
+        from serve_site import main as serve_main
+
+        return serve_main(forwarded)
+    if cmd == "icons":
+        from build_icon_subset import main as icons_main
+
+        return icons_main(forwarded)
+    if cmd == "bench":
+        from benchmark import main as bench_main
+
+        return bench_main(forwarded)
 
     print(f"Unknown command: {cmd}\n")
     _print_help()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Generate the site's derived verse and speaker data from their canonical sources.
+
+Several scripts and widgets ship data that is derived from two datasets:
+
+    widgets/Widgets/SemanticMaps/BOMSemanticMap/bom_scatter.json   every verse, in canonical order
+    content/speakers.json                                          speaker lifespans, events and relations
+
+This step writes, in one pass over those sources:
+
+    js/bom-structure.js                         books and verses per chapter (Similar Verse Finder menus)
+    widgets/Widgets/SemanticMaps/bomVerses.js   full verse references (semantic map search)
+    widgets/Widgets/Timeline/data.js            speaker lifespans and events
+    widgets/Widgets/Connections/data.js         speaker relations and quotations
+
+The widgets read these as globals, so they stay scripts. Large payloads are emitted as
+`JSON.parse('...')`, which engines parse much faster than an equivalent object literal.
+
+`.cache/derived-data.json` records each source's content hash (keyed by mtime/size) and each output's
+inputs and hash. Outputs whose inputs are unchanged and whose file wasn't edited are skipped, and a
+source is only read when an output that depends on it is rebuilt.
+
+Usage:
+    uv run scripts/bomex.py data
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DOCS_ROOT = REPO_ROOT / "docs"
+
+# Bump when an output's format changes so every output is rewritten.
+DERIVED_VERSION = "1"
+VERSES_SOURCE = "widgets/Widgets/SemanticMaps/BOMSemanticMap/bom_scatter.json"
+SPEAKERS_SOURCE = "content/speakers.json"
+JSON_PARSE_MIN = 10 * 1024  # smaller payloads stay object literals
+
+
+def _js_value(data: Any) -> str:
+    text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    if len(text) < JSON_PARSE_MIN:
+        return text
+    escaped = text.replace("\\", "\\\\").replace("'", "\\'").replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+    return f"JSON.parse('{escaped}')"
+
+
+def _script(sources: Tuple[str, ...], declarations: List[Tuple[str, Any]]) -> str:
+    lines = [f"// GENERATED from docs/{', docs/'.join(sources)} by scripts/build_derived_data.py - do not edit."]
+    lines += [f"{decl} = {_js_value(value)};" for decl, value in declarations]
+    return "\n".join(lines) + "\n"
+
+
+def bom_structure(verses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """[{name, key, versesByChapter}] in canonical book order."""
+    books: List[Dict[str, Any]] = []
+    for v in verses:
+        chapter, verse = (int(n) for n in v["verse_long"].rsplit(" ", 1)[1].split(":"))
+        if not books or books[-1]["name"] != v["book"]:
+            books.append({"name": v["book"], "key": v["book"].lower(), "versesByChapter": []})
+        counts = books[-1]["versesByChapter"]
+        while len(counts) < chapter:
+            counts.append(0)
+        counts[chapter - 1] = max(counts[chapter - 1], verse)
+    return books
+
+
+def _speakers_with(speakers: List[Dict[str, Any]], key: str, fields: Dict[str, str]) -> List[Dict[str, Any]]:
+    """Speakers that have `key`, as {"name", <out field>: speaker[<canonical field>], ...}."""
+    return [{"name": s["name"], **{out: s[f] for out, f in fields.items()}} for s in speakers if key in s]
+
+
+def _bom_structure_js(src: Dict[str, Any]) -> str:
+    return _script((VERSES_SOURCE,), [("window.BOM_STRUCTURE", bom_structure(src[VERSES_SOURCE]))])
+
+
+def _bom_verses_js(src: Dict[str, Any]) -> str:
+    return _script((VERSES_SOURCE,), [("var verses", [v["verse_long"] for v in src[VERSES_SOURCE]])])
+
+
+def _timeline_js(src: Dict[str, Any]) -> str:
+    fields = {f: f for f in ("lifespan_start", "lifespan_end", "events")}
+    events = _speakers_with(src[SPEAKERS_SOURCE]["speakers"], "events", fields)
+    return _script((SPEAKERS_SOURCE,), [("var eventsData", events)])
+
+
+def _connections_js(src: Dict[str, Any]) -> str:
+    speakers = src[SPEAKERS_SOURCE]["speakers"]
+    return _script(
+        (SPEAKERS_SOURCE,),
+        [
+            ("let relationshipData", _speakers_with(speakers, "relations", {"relations": "relations"})),
+            ("let linguisticData", _speakers_with(speakers, "quotes", {"relations": "quotes"})),
+        ],
+    )
+
+
+@dataclass(frozen=True)
+class Output:
+    sources: Tuple[str, ...]
+    build: Callable[[Dict[str, Any]], str]  # {source: parsed JSON} -> file content
+
+
+OUTPUTS: Dict[str, Output] = {
+    "js/bom-structure.js": Output((VERSES_SOURCE,), _bom_structure_js),
+    "widgets/Widgets/SemanticMaps/bomVerses.js": Output((VERSES_SOURCE,), _bom_verses_js),
+    "widgets/Widgets/Timeline/data.js": Output((SPEAKERS_SOURCE,), _timeline_js),
+    "widgets/Widgets/Connections/data.js": Output((SPEAKERS_SOURCE,), _connections_js),
+}
+
+
+class DerivedCache:
+    """Source hashes (keyed by mtime/size) and, per output, the hash of its inputs and of what was written."""
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self.sources: Dict[str, Dict[str, Any]] = {}
+        self.outputs: Dict[str, Dict[str, str]] = {}
+        if path is None or not path.exists():
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == DERIVED_VERSION:
+            self.sources = data.get("sources") or {}
+            self.outputs = data.get("outputs") or {}
+
+    def source_digest(self, path: Path) -> str:
+        key = str(path)
+        st = path.stat()
+        entry = self.sources.get(key)
+        if entry and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            return entry["sha256"]
+        digest = _sha256(path.read_bytes())
+        self.sources[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": digest}
+        return digest
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": DERIVED_VERSION, "sources": self.sources, "outputs": dict(sorted(self.outputs.items()))}
+        self.path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def build(docs_root: Path, names: List[str], cache: DerivedCache, *, force: bool) -> Tuple[int, int]:
+    """Write the stale outputs among `names`; return (written, skipped)."""
+    parsed: Dict[str, Any] = {}  # each source is read and parsed at most once
+    written = skipped = 0
+    for rel in names:
+        output = OUTPUTS[rel]
+        digests = [cache.source_digest(docs_root / s) for s in output.sources]
+        inputs = _sha256("\0".join([DERIVED_VERSION, rel, *digests]).encode("utf-8"))
+        out_path = docs_root / rel
+        previous = cache.outputs.get(rel, {})
+        if (
+            not force
+            and previous.get("inputs") == inputs
+            and out_path.exists()
+            and previous.get("sha256") == _sha256(out_path.read_bytes())
+        ):
+            skipped += 1
+            continue
+
+        for source in output.sources:
+            if source not in parsed:
+                parsed[source] = json.loads((docs_root / source).read_text(encoding="utf-8"))
+        content = output.build(parsed).encode("utf-8")
+        if not out_path.exists() or out_path.read_bytes() != content:
+            out_path.write_bytes(content)
+        cache.outputs[rel] = {"inputs": inputs, "sha256": _sha256(content)}
+        written += 1
+    return written, skipped
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate derived verse/speaker data scripts from their canonical sources.")
+    parser.add_argument(
+        "--docs-root",
+        default=str(DOCS_ROOT),
+        help="Site root the sources and outputs are relative to (default: <repo>/docs)",
+    )
+    parser.add_argument(
+        "--outputs",
+        default=",".join(OUTPUTS),
+        help="Comma-separated outputs to build (default: all)",
+    )
+    parser.add_argument(
+        "--cache",
+        default=str(REPO_ROOT / ".cache" / "derived-data.json"),
+        help="Source/output hash cache (default: <repo>/.cache/derived-data.json)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Neither read nor write the cache")
+    parser.add_argument("--force", action="store_true", help="Rewrite every output")
+    args = parser.parse_args(argv)
+
+    names = [n.strip() for n in args.outputs.split(",") if n.strip()]
+    unknown = [n for n in names if n not in OUTPUTS]
+    if unknown:
+        print(f"Unknown output(s): {', '.join(unknown)}. Allowed: {', '.join(OUTPUTS)}")
+        return 2
+
+    cache = DerivedCache(None if args.no_cache else Path(args.cache))
+    written, skipped = build(Path(args.docs_root), names, cache, force=args.force)
+    cache.save()
+    print(f"Derived data: written={written} unchanged={skipped}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Write `docs/css/icons.css`: the Font Awesome icons the site uses, self-hosted as CSS masks.
+
+Pages mark icons up the Font Awesome way (`<i class="fas fa-search"></i>`) but used to load the whole
+Font Awesome stylesheet and webfonts from cdnjs. This step scans the site's pages, scripts and page
+templates for `fa-<name>` classes, looks each name (or its Font Awesome 5 alias, e.g. `search` for
+`magnifying-glass`) up in a Font Awesome Free package's `metadata/icons.json`, and writes one rule per
+icon:
+
+    .fa-search{--fa-icon:url("data:image/svg+xml,...");width:1em}
+
+The shared `.fas`/`.far` rule paints `currentColor` through the icon mask, so icons keep following
+the text colour and size. `far` icons use the regular style where one exists. The package is only
+needed to rebuild the subset: `npm pack @fortawesome/fontawesome-free@6.4.0` or
+`pip download fontawesomefree==6.4.0` both contain it.
+
+Usage:
+    uv run scripts/bomex.py icons --source path/to/fontawesome-free
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import quote
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DOCS_ROOT = REPO_ROOT / "docs"
+
+# Where icon classes can appear: hand-authored and generated pages, site scripts, page templates.
+# Widgets load their own Font Awesome and are not scanned.
+SCAN_GLOBS = ("*.html", "*/*.html", "js/*.js")
+TEMPLATE_SOURCES = (REPO_ROOT / "scripts" / "generate_content_pages.py",)
+
+_ICON_RE = re.compile(r"\bfa-([a-z0-9]+(?:-[a-z0-9]+)*)")
+_REGULAR_RE = re.compile(r"\b(?:far|fa-regular)\s+fa-([a-z0-9]+(?:-[a-z0-9]+)*)")
+
+BASE_RULE = (
+    ".fas,.far,.fa-solid,.fa-regular{display:inline-block;width:1em;height:1em;vertical-align:-.125em;"
+    "background-color:currentColor;-webkit-mask:var(--fa-icon) center/contain no-repeat;"
+    "mask:var(--fa-icon) center/contain no-repeat}"
+)
+
+
+def _find_source(path: Path) -> Optional[Path]:
+    """Accept the package root or any folder above `metadata/icons.json` (e.g. the pip wheel)."""
+    for candidate in (path, path / "static" / "fontawesomefree", path / "fontawesomefree" / "static" / "fontawesomefree"):
+        if (candidate / "metadata" / "icons.json").exists():
+            return candidate
+    return None
+
+
+def scan_icon_names(docs_root: Path, extra: Iterable[Path] = TEMPLATE_SOURCES) -> Tuple[Set[str], Set[str]]:
+    """Return (all fa-* names, names used with the regular style) found in the site's sources."""
+    paths = [p for pattern in SCAN_GLOBS for p in docs_root.glob(pattern)]
+    names: Set[str] = set()
+    regular: Set[str] = set()
+    for path in [*paths, *extra]:
+        if not path.is_file() or path.parent.name == "widgets":
+            continue
+        text = path.read_text(encoding="utf-8", errors="replace")
+        names.update(_ICON_RE.findall(text))
+        regular.update(_REGULAR_RE.findall(text))
+    return names, regular
+
+
+def _alias_table(icons: Dict[str, Any]) -> Dict[str, str]:
+    table: Dict[str, str] = {}
+    for name, icon in icons.items():
+        for alias in (icon.get("aliases") or {}).get("names", []):
+            table.setdefault(alias, name)
+    for name in icons:
+        table[name] = name
+    return table
+
+
+def _data_uri(svg: Dict[str, Any]) -> str:
+    path = svg["path"] if isinstance(svg["path"], str) else "".join(svg["path"])
+    markup = f"<svg xmlns='http://www.w3.org/2000/svg' viewBox='{' '.join(map(str, svg['viewBox']))}'><path d='{path}'/></svg>"
+    return "data:image/svg+xml," + quote(markup, safe=" /:='.,-")
+
+
+def _rule(selector: str, svg: Dict[str, Any]) -> str:
+    width = round(svg["width"] / svg["height"], 4)
+    return f'{selector}{{--fa-icon:url("{_data_uri(svg)}");width:{width:g}em}}'
+
+
+def build_css(icons: Dict[str, Any], names: Set[str], regular: Set[str], *, version: str) -> Tuple[str, List[str]]:
+    """Return (icons.css, names that are not icons) for the scanned names."""
+    aliases = _alias_table(icons)
+    rules: List[str] = []
+    unknown: List[str] = []
+    for name in sorted(names):
+        icon = icons.get(aliases.get(name, ""))
+        if icon is None or "solid" not in icon["svg"] and "regular" not in icon["svg"]:
+            unknown.append(name)
+            continue
+        svgs = icon["svg"]
+        rules.append(_rule(f".fa-{name}", svgs.get("solid") or svgs["regular"]))
+        if name in regular and "regular" in svgs:
+            rules.append(_rule(f".far.fa-{name},.fa-regular.fa-{name}", svgs["regular"]))
+
+    header = (
+        f"/* Font Awesome Free {version} subset written by scripts/build_icon_subset.py - do not edit.\n"
+        "   https://fontawesome.com License - https://fontawesome.com/license/free (Icons: CC BY 4.0) */\n"
+    )
+    return header + BASE_RULE + "\n" + "\n".join(rules) + "\n", unknown
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Write docs/css/icons.css with only the Font Awesome icons the site uses.")
+    parser.add_argument(
+        "--source",
+        default=str(REPO_ROOT / "node_modules" / "@fortawesome" / "fontawesome-free"),
+        help="Font Awesome Free package (folder with metadata/icons.json; default: <repo>/node_modules/@fortawesome/fontawesome-free)",
+    )
+    parser.add_argument(
+        "--docs-root",
+        default=str(DOCS_ROOT),
+        help="Site root to scan (default: <repo>/docs)",
+    )
+    parser.add_argument(
+        "--out",
+        default=str(DOCS_ROOT / "css" / "icons.css"),
+        help="Output stylesheet (default: <repo>/docs/css/icons.css)",
+    )
+    args = parser.parse_args(argv)
+
+    source = _find_source(Path(args.source))
+    if source is None:
+        print(f"Font Awesome Free package not found (no metadata/icons.json under {args.source})")
+        return 2
+    icons = json.loads((source / "metadata" / "icons.json").read_text(encoding="utf-8"))
+    version = "6"
+    package_json = source / "package.json"
+    stylesheet = source / "css" / "all.min.css"
+    if package_json.exists():
+        version = json.loads(package_json.read_text(encoding="utf-8")).get("version", version)
+    elif stylesheet.exists():
+        m = re.search(r"Font Awesome Free ([\d.]+)", stylesheet.read_text(encoding="utf-8")[:200])
+        version = m.group(1) if m else version
+
+    names, regular = scan_icon_names(Path(args.docs_root))
+    css, unknown = build_css(icons, names, regular, version=version)
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    if not out.exists() or out.read_text(encoding="utf-8") != css:
+        out.write_text(css, encoding="utf-8")
+    print(f"Wrote {len(names) - len(unknown)} icons ({len(css.encode('utf-8')) / 1024:.1f} KiB) to {out}")
+    if unknown:
+        print(f"Not icons (style/utility classes): {', '.join(unknown)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
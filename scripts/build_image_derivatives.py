@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""Write resized (and WebP/AVIF) derivatives of the site's people and widget images.
+
+Each collection of source images gets a `derived/` folder holding one file per size and format,
+named after the source's content hash, plus a manifest keyed by the source path:
+
+    docs/img/derived/people/manifest.json
+    docs/img/derived/people/<hash>-<width>.<ext>
+
+    {
+      "version": 1,
+      "images": {
+        "abinadi-new/abinadi-new.jpg": {
+          "hash": "3f1c...", "width": 1274, "height": 1227,   # source (after EXIF rotation)
+          "widths": [160, 480, 1200], "formats": ["avif", "webp", "jpg"]
+        }
+      }
+    }
+
+Sources whose hash is already in the manifest (with every file present) are not re-encoded, and files
+no manifest entry refers to are removed. Encoding needs Pillow (the `images` extra); WebP/AVIF are
+written when Pillow was built with them. Without Pillow nothing is encoded or removed: changed sources
+keep their previous entry (and files) until a run with Pillow, new ones get only their dimensions (read
+from the JPEG/PNG header), and `--force` is refused.
+
+Usage:
+    uv run --extra images scripts/bomex.py derivatives
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from PIL import Image, ImageOps, features  # type: ignore[import-not-found]
+except ImportError:  # optional
+    Image = None
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DOCS_ROOT = REPO_ROOT / "docs"
+
+MANIFEST_VERSION = 1
+SOURCE_SUFFIXES = (".jpg", ".jpeg", ".png")
+
+# format -> (MIME type, Pillow save options); listed in order of preference.
+MODERN_FORMATS = {
+    "avif": ("image/avif", {"quality": 55, "speed": 6}),
+    "webp": ("image/webp", {"quality": 78, "method": 5}),
+}
+FALLBACK_FORMATS = {
+    "jpg": ("image/jpeg", {"quality": 80, "optimize": True, "progressive": True}),
+    "png": ("image/png", {"optimize": True}),
+}
+
+
+@dataclass(frozen=True)
+class Collection:
+    src: str  # relative to the docs root
+    pattern: str
+    out: str
+    widths: Tuple[int, ...]
+
+
+COLLECTIONS = {
+    # thumbnail (people grid), medium, hero (person detail banner)
+    "people": Collection("content/people", "*/*", "img/derived/people", (160, 480, 1200)),
+    # the Bubbles widget shows its speaker image 100px wide
+    "bubbles": Collection("widgets/Widgets/Bubbles/images", "*", "widgets/Widgets/Bubbles/images/derived", (160, 320)),
+}
+
+
+def image_size(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (width, height) from a JPEG or PNG header, or None if it cannot be read."""
+    try:
+        with path.open("rb") as f:
+            head = f.read(24)
+            if head.startswith(b"\x89PNG\r\n\x1a\n") and head[12:16] == b"IHDR":
+                return struct.unpack(">II", head[16:24])
+            if not head.startswith(b"\xff\xd8"):
+                return None
+            f.seek(2)
+            while True:
+                marker = f.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    return None
+                # SOFn frames carry the size; C4 (DHT), C8 (JPG) and CC (DAC) share the range.
+                if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+                    height, width = struct.unpack(">xHH", f.read(7)[2:])
+                    return width, height
+                (length,) = struct.unpack(">H", f.read(2))
+                f.seek(length - 2, os.SEEK_CUR)
+    except (OSError, struct.error):
+        return None
+
+
+def derived_name(digest: str, width: int, fmt: str) -> str:
+    return f"{digest}-{width}.{fmt}"
+
+
+def fallback_format(source: Path) -> str:
+    return "png" if source.suffix.lower() == ".png" else "jpg"
+
+
+def mime_type(fmt: str) -> str:
+    return {**MODERN_FORMATS, **FALLBACK_FORMATS}[fmt][0]
+
+
+def available_formats() -> List[str]:
+    if Image is None:
+        return []
+    return [fmt for fmt in MODERN_FORMATS if features.check(fmt)]
+
+
+def load_manifest(out_dir: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        data = json.loads((out_dir / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return {}
+    images = data.get("images")
+    return images if isinstance(images, dict) else {}
+
+
+def _hash_file(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()[:16]
+
+
+def _is_current(entry: Optional[Dict[str, Any]], digest: str, out_dir: Path) -> bool:
+    if not entry or entry.get("hash") != digest or not entry.get("widths"):
+        return False
+    return all(
+        (out_dir / derived_name(digest, w, fmt)).exists() for w in entry["widths"] for fmt in entry.get("formats", [])
+    )
+
+
+def _encode(task: Tuple[str, str, str, Tuple[int, ...], Tuple[str, ...]]) -> Dict[str, Any]:
+    """Write every size/format of one source; return its manifest entry (without the hash)."""
+    source, out_dir, digest, widths, formats = task
+    with Image.open(source) as opened:
+        img = ImageOps.exif_transpose(opened)
+        img.load()
+    src_w, src_h = img.size
+    fallback = fallback_format(Path(source))
+    if fallback == "jpg" and img.mode != "RGB":
+        img = img.convert("RGB")
+
+    # Never upscale: a source narrower than a target width contributes its own width instead.
+    sizes = sorted({min(w, src_w) for w in widths})
+    all_formats = [*formats, fallback]
+    for w in sizes:
+        resized = img if w == src_w else img.resize((w, max(1, round(src_h * w / src_w))), Image.Resampling.LANCZOS)
+        for fmt in all_formats:
+            options = {**MODERN_FORMATS, **FALLBACK_FORMATS}[fmt][1]
+            resized.save(Path(out_dir) / derived_name(digest, w, fmt), **options)
+    return {"width": src_w, "height": src_h, "widths": sizes, "formats": all_formats}
+
+
+def build_collection(
+    name: str, collection: Collection, docs_root: Path, *, force: bool, mapper: Any = map
+) -> Tuple[int, int]:
+    """Bring one collection's derived folder up to date; return (sources, encoded)."""
+    src_root = docs_root / collection.src
+    out_dir = docs_root / collection.out
+    out_dir.mkdir(parents=True, exist_ok=True)
+    previous = load_manifest(out_dir)
+    formats = tuple(available_formats())
+
+    sources = sorted(
+        p for p in src_root.glob(collection.pattern) if p.suffix.lower() in SOURCE_SUFFIXES and out_dir not in p.parents
+    )
+    # Derivatives are named by content hash, so renamed or duplicated sources share one entry's files.
+    known = {e.get("hash"): e for e in previous.values()}
+    images: Dict[str, Dict[str, Any]] = {}
+    tasks: List[Tuple[str, str, str, Tuple[int, ...], Tuple[str, ...]]] = []
+    queued: Dict[str, str] = {}  # key -> hash of sources waiting to be encoded
+    stale = 0
+    for path in sources:
+        key = path.relative_to(src_root).as_posix()
+        digest = _hash_file(path)
+        entry = known.get(digest)
+        if not force and _is_current(entry, digest, out_dir):
+            images[key] = dict(entry)
+        elif Image is not None:
+            if digest not in queued.values():
+                tasks.append((str(path), str(out_dir), digest, collection.widths, formats))
+            queued[key] = digest
+        elif key in previous:
+            # Can't re-encode: keep serving the old derivatives rather than none.
+            images[key] = dict(previous[key])
+            stale += 1
+        else:
+            size = image_size(path)
+            images[key] = {"hash": digest, "width": size[0] if size else 0, "height": size[1] if size else 0}
+            images[key].update(widths=[], formats=[])
+
+    encoded = {task[2]: entry for task, entry in zip(tasks, mapper(_encode, tasks))}
+    for key, digest in queued.items():
+        images[key] = {"hash": digest, **encoded[digest]}
+
+    # Without Pillow nothing could be rewritten, so nothing is pruned either.
+    if Image is not None:
+        keep = {"manifest.json"} | {
+            derived_name(e["hash"], w, fmt) for e in images.values() for w in e["widths"] for fmt in e["formats"]
+        }
+        for p in out_dir.iterdir():
+            if p.is_file() and p.name not in keep:
+                p.unlink()
+
+    content = json.dumps({"version": MANIFEST_VERSION, "images": images}, separators=(",", ":"), sort_keys=True)
+    manifest_path = out_dir / "manifest.json"
+    if not manifest_path.exists() or manifest_path.read_text(encoding="utf-8") != content:
+        manifest_path.write_text(content, encoding="utf-8")
+    print(f"{name}: {len(sources)} sources, {len(tasks)} encoded -> {out_dir}")
+    if stale:
+        print(f"{name}: {stale} changed source(s) keep their old derivatives until a run with Pillow")
+    return len(sources), len(tasks)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Write resized and WebP/AVIF derivatives of people and widget images.")
+    parser.add_argument(
+        "--docs-root",
+        default=str(DOCS_ROOT),
+        help="Site root the collections are relative to (default: <repo>/docs)",
+    )
+    parser.add_argument(
+        "--collections",
+        default=",".join(COLLECTIONS),
+        help=f"Comma-separated collections to build (default: {','.join(COLLECTIONS)})",
+    )
+    parser.add_argument("--force", action="store_true", help="Re-encode every source")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for encoding (default: 1; 0 = one per CPU)",
+    )
+    args = parser.parse_args(argv)
+
+    names = [n.strip() for n in args.collections.split(",") if n.strip()]
+    unknown = [n for n in names if n not in COLLECTIONS]
+    if unknown:
+        print(f"Unknown collection(s): {', '.join(unknown)}. Allowed: {', '.join(COLLECTIONS)}")
+        return 2
+    if Image is None and args.force:
+        print("--force needs Pillow to re-encode (run with `uv run --extra images`); nothing was changed.")
+        return 2
+    if Image is None:
+        print("Pillow is not installed: recording image sizes only (run with `uv run --extra images` to encode).")
+    else:
+        print(f"Encoding {', '.join([*available_formats(), 'jpg/png'])}")
+
+    docs_root = Path(args.docs_root)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if jobs == 1:
+        for name in names:
+            build_collection(name, COLLECTIONS[name], docs_root, force=args.force)
+        return 0
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for name in names:
+            build_collection(name, COLLECTIONS[name], docs_root, force=args.force, mapper=pool.map)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
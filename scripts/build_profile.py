@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Per-step profiling for `bomex.py build --profile`.
+
+Each step records wall time, CPU time, peak RSS, files opened for
+reading/writing, bytes read/written and the hottest functions, then the whole run is written as a
+JSON report plus a short table on stdout. Reports include the git commit so runs can be compared.
+
+Peak RSS is reported two ways:
+
+- `peak_rss_mb`: the main process's high-water mark during the step alone (Linux: `VmHWM` after
+  resetting it through `/proc/self/clear_refs`; None where that isn't available);
+- `cumulative_peak_rss_mb`: the largest RSS of the main process or any finished worker since the
+  build started (`getrusage`), i.e. never lower than an earlier step's figure.
+
+CPU time and the cumulative peak include process-pool workers; file and byte counts and the per-step
+peak cover the main process.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import datetime
+import json
+import platform
+import pstats
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # optional (not on Windows)
+    resource = None
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+_OPEN_COUNTS = {"read": 0, "write": 0}
+_HOOK_INSTALLED = False
+
+
+def _audit_hook(event: str, args: tuple) -> None:
+    if event != "open":
+        return
+    mode = args[1] if len(args) > 1 else None
+    if isinstance(mode, str):
+        if "r" in mode or "+" in mode:
+            _OPEN_COUNTS["read"] += 1
+        if any(c in mode for c in "wax+"):
+            _OPEN_COUNTS["write"] += 1
+    elif len(args) > 2 and isinstance(args[2], int):
+        # os.open(): classify by access flags.
+        acc = args[2] & 3
+        if acc in (0, 2):
+            _OPEN_COUNTS["read"] += 1
+        if acc in (1, 2):
+            _OPEN_COUNTS["write"] += 1
+
+
+def _proc_io() -> Optional[Dict[str, int]]:
+    """Bytes read/written by this process so far (Linux /proc/self/io), or None elsewhere."""
+    try:
+        text = Path("/proc/self/io").read_text()
+    except OSError:
+        return None
+    values = dict(line.split(": ", 1) for line in text.splitlines() if ": " in line)
+    return {"read": int(values.get("rchar", 0)), "write": int(values.get("wchar", 0))}
+
+
+def _reset_peak_rss() -> bool:
+    """Reset this process's RSS high-water mark (Linux 4.0+); False where that isn't possible."""
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        return False
+    return True
+
+
+def _step_peak_rss_mb() -> Optional[float]:
+    """This process's RSS high-water mark since `_reset_peak_rss()` (Linux /proc/self/status)."""
+    try:
+        text = Path("/proc/self/status").read_text()
+    except OSError:
+        return None
+    for line in text.splitlines():
+        if line.startswith("VmHWM:"):
+            return round(int(line.split()[1]) / 1024, 1)
+    return None
+
+
+def _rusage_peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    # Resetting VmHWM also lowers RUSAGE_SELF's ru_maxrss, so BuildProfiler keeps its own running maximum.
+    # ru_maxrss is KiB on Linux and bytes on macOS; children covers process-pool workers.
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return round(peak / scale, 1)
+
+
+def _cpu_seconds() -> float:
+    if resource is None:
+        return time.process_time()
+    total = 0.0
+    for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN):
+        ru = resource.getrusage(who)
+        total += ru.ru_utime + ru.ru_stime
+    return total
+
+
+@dataclass
+class StepReport:
+    name: str
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    peak_rss_mb: Optional[float] = None  # main process, this step only
+    cumulative_peak_rss_mb: Optional[float] = None  # main process and workers, whole build so far
+    files_read: int = 0
+    files_written: int = 0
+    bytes_read: Optional[int] = None
+    bytes_written: Optional[int] = None
+    rc: int = 0
+    hot_spots: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class BuildProfiler:
+    """Context-manager based step profiler; a disabled profiler adds no overhead."""
+
+    def __init__(self, enabled: bool, *, pstats_dir: Optional[Path] = None, top: int = 15) -> None:
+        global _HOOK_INSTALLED
+        self.enabled = enabled
+        self.pstats_dir = pstats_dir
+        self.top = top
+        self.steps: List[StepReport] = []
+        self._peak_rss_mb: Optional[float] = None
+        if enabled and not _HOOK_INSTALLED:
+            # Audit hooks cannot be removed, so install at most once per process.
+            sys.addaudithook(_audit_hook)
+            _HOOK_INSTALLED = True
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[StepReport]:
+        report = StepReport(name=name)
+        if not self.enabled:
+            yield report
+            return
+
+        hwm_reset = _reset_peak_rss()
+        opens_before = dict(_OPEN_COUNTS)
+        io_before = _proc_io()
+        cpu_before = _cpu_seconds()
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            yield report
+        finally:
+            profiler.disable()
+            report.wall_s = round(time.perf_counter() - started, 4)
+            report.cpu_s = round(_cpu_seconds() - cpu_before, 4)
+            report.files_read = _OPEN_COUNTS["read"] - opens_before["read"]
+            report.files_written = _OPEN_COUNTS["write"] - opens_before["write"]
+            report.peak_rss_mb = _step_peak_rss_mb() if hwm_reset else None
+            peaks = [p for p in (self._peak_rss_mb, report.peak_rss_mb, _rusage_peak_rss_mb()) if p is not None]
+            report.cumulative_peak_rss_mb = self._peak_rss_mb = max(peaks) if peaks else None
+            io_after = _proc_io()
+            if io_before is not None and io_after is not None:
+                report.bytes_read = io_after["read"] - io_before["read"]
+                report.bytes_written = io_after["write"] - io_before["write"]
+            report.hot_spots = self._hot_spots(profiler)
+            if self.pstats_dir is not None:
+                self.pstats_dir.mkdir(parents=True, exist_ok=True)
+                profiler.dump_stats(str(self.pstats_dir / f"{name}.pstats"))
+            self.steps.append(report)
+
+    def _hot_spots(self, profiler: cProfile.Profile) -> List[Dict[str, Any]]:
+        stats = pstats.Stats(profiler)
+        rows = []
+        for (filename, line, func), (_, ncalls, tottime, cumtime, _) in stats.stats.items():  # type: ignore[attr-defined]
+            try:
+                filename = str(Path(filename).resolve().relative_to(REPO_ROOT))
+            except ValueError:
+                pass
+            rows.append(
+                {
+                    "function": f"{filename}:{line}({func})",
+                    "calls": ncalls,
+                    "self_s": round(tottime, 4),
+                    "cumulative_s": round(cumtime, 4),
+                }
+            )
+        rows.sort(key=lambda r: r["self_s"], reverse=True)
+        return rows[: self.top]
+
+    def report(self, argv: List[str]) -> Dict[str, Any]:
+        return {
+            "generated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "argv": argv,
+            "total_wall_s": round(sum(s.wall_s for s in self.steps), 4),
+            "steps": [asdict(s) for s in self.steps],
+        }
+
+    def write(self, path: Path, argv: List[str]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(argv), indent=2) + "\n", encoding="utf-8")
+
+    def print_summary(self) -> None:
+        print("\nProfile:")
+        print(
+            f"  {'step':<10} {'wall s':>8} {'cpu s':>8} {'rss MB':>8} {'max MB':>8} "
+            f"{'reads':>7} {'writes':>7} {'MB in':>8} {'MB out':>8}"
+        )
+        for s in self.steps:
+            mb_in = f"{s.bytes_read / 1e6:.1f}" if s.bytes_read is not None else "-"
+            mb_out = f"{s.bytes_written / 1e6:.1f}" if s.bytes_written is not None else "-"
+            rss = f"{s.peak_rss_mb:.1f}" if s.peak_rss_mb is not None else "-"
+            max_rss = f"{s.cumulative_peak_rss_mb:.1f}" if s.cumulative_peak_rss_mb is not None else "-"
+            print(
+                f"  {s.name:<10} {s.wall_s:>8.3f} {s.cpu_s:>8.3f} {rss:>8} {max_rss:>8} "
+                f"{s.files_read:>7} {s.files_written:>7} {mb_in:>8} {mb_out:>8}"
+            )
+            if s.hot_spots:
+                top = s.hot_spots[0]
+                print(f"  {'':<10} hottest: {top['function']} ({top['self_s']:.3f}s self)")
+        print("  rss MB: this step's own peak (main process); max MB: peak of the build so far, workers included")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True, timeout=10
+        )
+    except Exception:
+        return None
+    return out.stdout.strip() or None
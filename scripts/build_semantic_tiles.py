@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Build level-of-detail tiles for the Book of Mormon semantic map.
+
+`SemanticMaps/BOMSemanticMap/bom_scatter.json` is one 3.5 MB array in which every point repeats its
+verse text, book, colour and a full `<a href=...>` link. This step splits it into:
+
+    tiles/index.json          extent, books (name, colour, id range, ref/link prefixes) and the root tile
+    tiles/<z>/<x>-<y>.json    quadtree tiles below the root
+    tiles/verses/<book>.json  per-book side table: ref, text and link for each verse id
+
+Point ids are positions in the scatter array (and in `bomVerses.js`). Each tile holds at most
+`--capacity` points as packed integer arrays:
+
+    {"children": 0b1011, "id": [delta-coded ids], "xy": [x0, y0, x1, y1, ...]}
+
+`xy` is relative to the tile's lower corner and `children` flags which quadrants (bit 0: low x/low y,
+1: high x/low y, 2: low x/high y, 3: high x/high y) have tiles. Tiles are progressive: a tile keeps an
+evenly spread sample of its points and passes the rest to its children, so a client that has loaded
+the tiles covering a view down to level z has every point those levels hold.
+
+Usage:
+    uv run scripts/bomex.py tiles
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MAP_ROOT = REPO_ROOT / "docs" / "widgets" / "Widgets" / "SemanticMaps" / "BOMSemanticMap"
+
+TILES_VERSION = 1
+_HREF_RE = re.compile(r'^<a href="([^"]*)"')
+
+
+@dataclass(frozen=True)
+class Point:
+    id: int
+    x: int
+    y: int
+
+
+def _sample(points: List[Point], x0: int, y0: int, size: int, capacity: int) -> Tuple[List[Point], List[Point]]:
+    """Split points into (kept, rest), keeping `capacity` points spread over a 16x16 grid of the tile."""
+    grid = 16
+    cell = max(1, -(-size // grid))
+    buckets: Dict[Tuple[int, int], List[Point]] = {}
+    for p in points:
+        buckets.setdefault(((p.x - x0) // cell, (p.y - y0) // cell), []).append(p)
+
+    kept: List[Point] = []
+    queues = [buckets[k] for k in sorted(buckets)]
+    depth = 0
+    while len(kept) < capacity:
+        took = False
+        for queue in queues:
+            if depth < len(queue):
+                kept.append(queue[depth])
+                took = True
+                if len(kept) == capacity:
+                    break
+        if not took:
+            break
+        depth += 1
+
+    kept_ids = {p.id for p in kept}
+    return kept, [p for p in points if p.id not in kept_ids]
+
+
+def build_tiles(
+    points: List[Point], origin: Tuple[int, int], size: int, *, capacity: int, max_level: int
+) -> Dict[Tuple[int, int, int], Dict[str, Any]]:
+    """Return {(z, x, y): tile} for the quadtree over the square `origin`..`origin + size`."""
+    tiles: Dict[Tuple[int, int, int], Dict[str, Any]] = {}
+
+    def build(z: int, tx: int, ty: int, pts: List[Point]) -> None:
+        tile_size = size >> z
+        x0 = origin[0] + tx * tile_size
+        y0 = origin[1] + ty * tile_size
+        if len(pts) <= capacity or z == max_level:
+            kept, rest = pts, []
+        else:
+            kept, rest = _sample(pts, x0, y0, tile_size, capacity)
+
+        half = tile_size // 2
+        quadrants: List[List[Point]] = [[], [], [], []]
+        for p in rest:
+            quadrants[(p.x - x0 >= half) + 2 * (p.y - y0 >= half)].append(p)
+
+        kept.sort(key=lambda p: p.id)
+        ids: List[int] = []
+        previous = 0
+        for p in kept:
+            ids.append(p.id - previous)
+            previous = p.id
+        tiles[(z, tx, ty)] = {
+            "children": sum(1 << i for i, q in enumerate(quadrants) if q),
+            "id": ids,
+            "xy": [v for p in kept for v in (p.x - x0, p.y - y0)],
+        }
+        for i, q in enumerate(quadrants):
+            if q:
+                build(z + 1, 2 * tx + (i & 1), 2 * ty + (i >> 1), q)
+
+    build(0, 0, 0, points)
+    return tiles
+
+
+def _book_slug(book: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", book.lower()).strip("-")
+
+
+def build_side_tables(scatter: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Return (books metadata, {book slug: side table}); books must be contiguous in the scatter."""
+    books: List[Dict[str, Any]] = []
+    tables: Dict[str, Dict[str, Any]] = {}
+    for i, e in enumerate(scatter):
+        if not books or books[-1]["name"] != e["book"]:
+            if any(b["name"] == e["book"] for b in books):
+                raise ValueError(f"verses of {e['book']} are not contiguous (id {i})")
+            books.append({"name": e["book"], "slug": _book_slug(e["book"]), "color": e["color"], "start": i, "count": 0})
+            tables[books[-1]["slug"]] = {"start": i, "ref": [], "text": [], "url": [], "xy": []}
+        books[-1]["count"] += 1
+        table = tables[books[-1]["slug"]]
+        m = _HREF_RE.match(e.get("href") or "")
+        table["ref"].append(e["ref"])
+        table["text"].append(e["text"])
+        table["url"].append(m.group(1) if m else "")
+        table["xy"].extend((int(e["x"]), int(e["y"])))
+
+    # Links share a per-book prefix; store it once and keep only the tails.
+    for book in books:
+        table = tables[book["slug"]]
+        # Short refs are "<abbreviation> <chapter>:<verse>"; with one abbreviation per book the client
+        # can label points (e.g. hover tooltips) without fetching the side table.
+        prefixes = {ref.rsplit(" ", 1)[0] for ref in table["ref"]}
+        if len(prefixes) == 1:
+            book["refPrefix"] = prefixes.pop()
+        base = os.path.commonprefix([u for u in table["url"] if u])
+        base = base[: base.rfind("/") + 1]
+        book["urlBase"] = base
+        table["url"] = [u[len(base) :] if u.startswith(base) and u else u for u in table["url"]]
+    return books, tables
+
+
+def _write_json(path: Path, data: Any) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    content = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    path.write_text(content, encoding="utf-8")
+    return len(content.encode("utf-8"))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Split bom_scatter.json into quadtree tiles plus per-book verse tables.")
+    parser.add_argument(
+        "--scatter",
+        default=str(MAP_ROOT / "bom_scatter.json"),
+        help="Scatter data (default: <repo>/docs/widgets/Widgets/SemanticMaps/BOMSemanticMap/bom_scatter.json)",
+    )
+    parser.add_argument(
+        "--out",
+        default=str(MAP_ROOT / "tiles"),
+        help="Output directory (default: <repo>/docs/widgets/Widgets/SemanticMaps/BOMSemanticMap/tiles)",
+    )
+    parser.add_argument("--capacity", type=int, default=512, help="Points per tile (default: 512)")
+    parser.add_argument("--max-level", type=int, default=6, help="Deepest quadtree level (default: 6)")
+    args = parser.parse_args(argv)
+
+    scatter = json.loads(Path(args.scatter).read_text(encoding="utf-8"))
+    points = [Point(i, int(e["x"]), int(e["y"])) for i, e in enumerate(scatter)]
+    if not points:
+        print(f"No points in {args.scatter}")
+        return 2
+
+    try:
+        books, side_tables = build_side_tables(scatter)
+    except ValueError as exc:
+        print(f"{args.scatter}: {exc}")
+        return 2
+
+    origin = (min(p.x for p in points), min(p.y for p in points))
+    span = max(max(p.x for p in points) - origin[0], max(p.y for p in points) - origin[1]) + 1
+    size = 1 << max(span - 1, 1).bit_length()
+    tiles = build_tiles(points, origin, size, capacity=args.capacity, max_level=args.max_level)
+
+    out = Path(args.out)
+    if out.exists():
+        shutil.rmtree(out)
+
+    index_bytes = _write_json(
+        out / "index.json",
+        {
+            "version": TILES_VERSION,
+            "origin": list(origin),
+            "size": size,
+            "count": len(points),
+            "extent": [origin[0], origin[1], max(p.x for p in points), max(p.y for p in points)],
+            "books": books,
+            "root": tiles.pop((0, 0, 0)),
+        },
+    )
+    tile_bytes = sum(_write_json(out / str(z) / f"{x}-{y}.json", tile) for (z, x, y), tile in sorted(tiles.items()))
+    side_bytes = sum(_write_json(out / "verses" / f"{slug}.json", table) for slug, table in side_tables.items())
+
+    depth = max((z for z, _, _ in tiles), default=0)
+    print(
+        f"Wrote {len(tiles) + 1} tiles over {depth + 1} levels ({index_bytes / 1024:.1f} KiB index, "
+        f"{tile_bytes / 1024:.0f} KiB tiles) and {len(side_tables)} verse tables ({side_bytes / 1024:.0f} KiB)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Build the sharded similar-verse index used by docs/js/similar-verse-finder.js.
+
+The SimilarVerse widget ships its whole nearest-neighbour table (`utils.js`: `ref2idx`, `idx2ref`,
+`idx2txt`, `neighbors`) and parses it before the first lookup. This step splits that table into one
+small JSON file per Book of Mormon chapter so the finder fetches only the chapter it needs:
+
+    docs/data/similar-verses/<book-slug>/<chapter>.json
+
+Each shard is self-contained:
+
+    {
+      "book": "1 Nephi", "chapter": 1,
+      "verses": [1, 2, ...],           # verse numbers; verse i is table row i
+      "ids": [...], "refs": [...], "texts": [...],   # table rows; ids are the source integer ids
+      "offsets": [0, 10, 20, ...],     # neighbours of verse i are neighbors[offsets[i]:offsets[i + 1]]
+      "neighbors": [...]               # row numbers into the table, flattened
+    }
+
+`docs/data/similar-verses/index.json` lists the shards that exist (`{"version": 1, "chapters":
+{"<book-slug>": [1, 2, ...]}}`); the finder only requests a listed shard and otherwise opens the
+widget straight away. Without a neighbour table (the repo doesn't ship one) the step writes an empty
+index unless one exists, prints a notice and succeeds, so a build carries on with its later steps.
+
+Usage:
+    uv run scripts/bomex.py verses --neighbors path/to/SimilarVerse/utils.js
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+WIDGETS_ROOT = REPO_ROOT / "docs" / "widgets" / "Widgets"
+
+TABLE_NAMES = ("ref2idx", "idx2ref", "idx2txt", "neighbors")
+_JS_ASSIGN_RE = re.compile(r"\b(?:var|let|const)\s+(" + "|".join(TABLE_NAMES) + r")\s*=\s*")
+_VERSE_REF_RE = re.compile(r"^(.+?)\s+(\d+):(\d+)$")
+_QUOTED_RE = re.compile(r"'([^']*)'|\"([^\"]*)\"")
+INDEX_NAME = "index.json"
+INDEX_VERSION = 1
+
+
+@dataclass(frozen=True)
+class VerseTable:
+    ref2idx: Dict[str, int]
+    idx2ref: Dict[int, str]
+    idx2txt: Dict[int, str]
+    neighbors: Dict[int, List[int]]
+
+
+def normalize_ref(ref: str) -> str:
+    """Same normalisation as the widget's `validateInput` (and the finder's `normalize`)."""
+    s = ref.strip().lower().replace(";", ":").replace(".", "")
+    s = re.sub(r"\s*:\s*", ":", s)
+    return re.sub(r"\s\s+", " ", s)
+
+
+def book_slug(book: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", book.lower()).strip("-")
+
+
+def read_verse_list(path: Path) -> List[str]:
+    """Return the references listed in a `var verses = ['1 Nephi 1:1', ...]` file."""
+    text = path.read_text(encoding="utf-8")
+    return [a or b for a, b in _QUOTED_RE.findall(text, text.index("["))]
+
+
+def _int_keyed(value: Any) -> Dict[int, Any]:
+    # The JS tables may be arrays (index = id) or objects keyed by stringified ids.
+    if isinstance(value, list):
+        return dict(enumerate(value))
+    return {int(k): v for k, v in value.items()}
+
+
+def load_verse_table(path: Path) -> VerseTable:
+    """Load the neighbour table from the widget's `utils.js` or from a JSON file with the same keys."""
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".json":
+        raw: Dict[str, Any] = json.loads(text)
+    else:
+        raw = {}
+        decoder = json.JSONDecoder()
+        for m in _JS_ASSIGN_RE.finditer(text):
+            try:
+                raw[m.group(1)], _ = decoder.raw_decode(text, m.end())
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{path}: `{m.group(1)}` is not a JSON literal ({exc.msg})") from exc
+
+    missing = [name for name in ("idx2ref", "idx2txt", "neighbors") if name not in raw]
+    if missing:
+        raise ValueError(f"{path}: missing {', '.join(missing)}")
+
+    idx2ref = {k: str(v) for k, v in _int_keyed(raw["idx2ref"]).items()}
+    ref2idx = {normalize_ref(k): int(v) for k, v in (raw.get("ref2idx") or {}).items()}
+    if not ref2idx:
+        ref2idx = {normalize_ref(ref): idx for idx, ref in idx2ref.items()}
+    return VerseTable(
+        ref2idx=ref2idx,
+        idx2ref=idx2ref,
+        idx2txt={k: str(v) for k, v in _int_keyed(raw["idx2txt"]).items()},
+        neighbors={k: [int(n) for n in v] for k, v in _int_keyed(raw["neighbors"]).items()},
+    )
+
+
+def _shard(book: str, chapter: int, verses: List[Tuple[int, int]], table: VerseTable) -> Dict[str, Any]:
+    rows: Dict[int, int] = {}
+    ids: List[int] = []
+
+    def row(idx: int) -> int:
+        if idx not in rows:
+            rows[idx] = len(ids)
+            ids.append(idx)
+        return rows[idx]
+
+    # Chapter verses take the first rows so the client can index them by position.
+    for _, idx in verses:
+        row(idx)
+    offsets = [0]
+    flat: List[int] = []
+    for _, idx in verses:
+        flat.extend(row(n) for n in table.neighbors.get(idx, ()))
+        offsets.append(len(flat))
+
+    return {
+        "book": book,
+        "chapter": chapter,
+        "verses": [verse for verse, _ in verses],
+        "ids": ids,
+        "refs": [table.idx2ref.get(i, "") for i in ids],
+        "texts": [table.idx2txt.get(i, "") for i in ids],
+        "offsets": offsets,
+        "neighbors": flat,
+    }
+
+
+def build_shards(verse_refs: List[str], table: VerseTable) -> Tuple[Dict[Tuple[str, int], Dict[str, Any]], List[str]]:
+    """Group the verse list by book/chapter; return ({(book, chapter): shard}, refs missing from the table)."""
+    chapters: Dict[Tuple[str, int], List[Tuple[int, int]]] = {}
+    missing: List[str] = []
+    for ref in verse_refs:
+        m = _VERSE_REF_RE.match(ref.strip())
+        idx = table.ref2idx.get(normalize_ref(ref))
+        if m is None or idx is None:
+            missing.append(ref)
+            continue
+        chapters.setdefault((m.group(1), int(m.group(2))), []).append((int(m.group(3)), idx))
+    shards = {key: _shard(key[0], key[1], verses, table) for key, verses in chapters.items()}
+    return shards, missing
+
+
+def write_index(out_dir: Path, chapters: Dict[str, List[int]]) -> None:
+    """Write INDEX_NAME: {book slug: sorted chapters} of the shards under out_dir."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    data = {"version": INDEX_VERSION, "chapters": {slug: sorted(chs) for slug, chs in sorted(chapters.items())}}
+    (out_dir / INDEX_NAME).write_text(json.dumps(data, separators=(",", ":")) + "\n", encoding="utf-8")
+
+
+def write_shards(shards: Dict[Tuple[str, int], Dict[str, Any]], out_dir: Path) -> int:
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    total = 0
+    chapters: Dict[str, List[int]] = {}
+    for (book, chapter), shard in sorted(shards.items()):
+        path = out_dir / book_slug(book) / f"{chapter}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        content = json.dumps(shard, ensure_ascii=False, separators=(",", ":"))
+        path.write_text(content, encoding="utf-8")
+        total += len(content.encode("utf-8"))
+        chapters.setdefault(book_slug(book), []).append(chapter)
+    write_index(out_dir, chapters)
+    return total
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Split the similar-verse neighbour table into per-chapter shards.")
+    parser.add_argument(
+        "--verses",
+        default=str(WIDGETS_ROOT / "SemanticMaps" / "bomVerses.js"),
+        help="Verse list to shard (default: <repo>/docs/widgets/Widgets/SemanticMaps/bomVerses.js)",
+    )
+    parser.add_argument(
+        "--neighbors",
+        default=str(WIDGETS_ROOT / "SimilarVerse" / "utils.js"),
+        help="Neighbour table: the widget's utils.js or an equivalent JSON file "
+        "(default: <repo>/docs/widgets/Widgets/SimilarVerse/utils.js)",
+    )
+    parser.add_argument(
+        "--out",
+        default=str(REPO_ROOT / "docs" / "data" / "similar-verses"),
+        help="Output directory (default: <repo>/docs/data/similar-verses)",
+    )
+    args = parser.parse_args(argv)
+
+    neighbors_path = Path(args.neighbors)
+    out_dir = Path(args.out)
+    if not neighbors_path.exists():
+        print(f"Neighbour table not found: {neighbors_path}; no shards written (the finder opens the widget instead)")
+        if not (out_dir / INDEX_NAME).exists():
+            # Tell the finder there are no shards, so it doesn't request them.
+            write_index(out_dir, {})
+        return 0
+
+    try:
+        table = load_verse_table(neighbors_path)
+    except ValueError as exc:
+        print(exc)
+        return 2
+
+    shards, missing = build_shards(read_verse_list(Path(args.verses)), table)
+    nbytes = write_shards(shards, out_dir)
+    print(f"Wrote {len(shards)} shards ({nbytes / 1024:.0f} KiB) to {args.out}")
+    if missing:
+        print(f"Not in the neighbour table: {len(missing)} verses (e.g. {', '.join(missing[:3])})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
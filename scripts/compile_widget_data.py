@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Compile the per-speaker Bubbles chart JSON into one compact payload per speaker.
+
+`docs/widgets/Widgets/Bubbles/json/json/<Speaker>/{content,function,theme}.json` are pretty-printed
+lists of word objects that repeat the same words, verse texts and URLs across all three charts. Each
+speaker is compiled into `json/compiled/<speaker>.json` (lower-cased, matching the widget's ids):
+
+    {
+      "version": 1,
+      "urlPrefix": "visiblelanguage.net/wordCameos/",
+      "words": [...], "texts": [...], "refs": [...], "pos": [...], "themes": [...],
+      "charts": {
+        "content": {
+          "name": [...], "size": [...], "partOfSpeech": [...], "sourceText": [...],
+          "sourceReference": [...], "theme": [...],   # indexes into the tables above; -1 = absent
+          "url": [[row, url], ...],                    # only rows whose url is not urlPrefix + lower(name)
+          "extra": [[row, {...}], ...]                 # any other keys, verbatim
+        },
+        ...
+      }
+    }
+
+Strings are interned once across the three charts. Columns with no values are left out. Precompressed
+`.gz`/`.br` siblings are the `compress` step's job (compress_site.py), like for every other file.
+
+Usage:
+    uv run scripts/bomex.py widgets
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+BUBBLES_ROOT = REPO_ROOT / "docs" / "widgets" / "Widgets" / "Bubbles"
+
+PAYLOAD_VERSION = 1
+CHART_TYPES = ("content", "function", "theme")
+URL_PREFIX = "visiblelanguage.net/wordCameos/"
+
+# field -> string table it is interned into
+INTERNED_FIELDS = {
+    "name": "words",
+    "partOfSpeech": "pos",
+    "sourceText": "texts",
+    "sourceReference": "refs",
+    "theme": "themes",
+}
+TABLES = ("words", "texts", "refs", "pos", "themes")
+
+
+class _Interner:
+    def __init__(self) -> None:
+        self.tables: Dict[str, List[str]] = {name: [] for name in TABLES}
+        self._index: Dict[str, Dict[str, int]] = {name: {} for name in TABLES}
+
+    def add(self, table: str, value: str) -> int:
+        index = self._index[table]
+        if value not in index:
+            index[value] = len(self.tables[table])
+            self.tables[table].append(value)
+        return index[value]
+
+
+def _compile_chart(children: List[Dict[str, Any]], interner: _Interner) -> Dict[str, Any]:
+    columns: Dict[str, List[Any]] = {field: [] for field in INTERNED_FIELDS}
+    sizes: List[Any] = []
+    urls: List[Tuple[int, str]] = []
+    extra: List[Tuple[int, Dict[str, Any]]] = []
+
+    for row, child in enumerate(children):
+        for field, table in INTERNED_FIELDS.items():
+            value = child.get(field)
+            columns[field].append(interner.add(table, value) if isinstance(value, str) else -1)
+        sizes.append(child.get("size"))
+        url = child.get("url")
+        if url != URL_PREFIX + str(child.get("name", "")).lower():
+            urls.append((row, url))
+        rest = {k: v for k, v in child.items() if k not in INTERNED_FIELDS and k not in ("size", "url")}
+        # Non-string values of interned fields are kept verbatim too.
+        rest.update({k: child[k] for k in INTERNED_FIELDS if k in child and not isinstance(child[k], str)})
+        if rest:
+            extra.append((row, rest))
+
+    chart: Dict[str, Any] = {"name": columns.pop("name"), "size": sizes}
+    for field, values in columns.items():
+        if any(v != -1 for v in values):
+            chart[field] = values
+    if urls:
+        chart["url"] = urls
+    if extra:
+        chart["extra"] = extra
+    return chart
+
+
+def compile_speaker(speaker_dir: Path) -> Dict[str, Any]:
+    interner = _Interner()
+    charts: Dict[str, Any] = {}
+    for chart_type in CHART_TYPES:
+        path = speaker_dir / f"{chart_type}.json"
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            charts[chart_type] = _compile_chart(data.get("children") or [], interner)
+    return {"version": PAYLOAD_VERSION, "urlPrefix": URL_PREFIX, **interner.tables, "charts": charts}
+
+
+def decode_chart(payload: Dict[str, Any], chart_type: str) -> Dict[str, Any]:
+    """Inverse of compile_speaker for one chart; mirrors `decodeChart` in Bubbles/scripts/import_data.js."""
+    chart = payload["charts"][chart_type]
+    urls = dict((row, url) for row, url in chart.get("url", []))
+    extra = dict((row, rest) for row, rest in chart.get("extra", []))
+    children = []
+    for row in range(len(chart["name"])):
+        child: Dict[str, Any] = {}
+        for field, table in INTERNED_FIELDS.items():
+            index = chart[field][row] if field in chart else -1
+            if index != -1:
+                child[field] = payload[table][index]
+        if chart["size"][row] is not None:
+            child["size"] = chart["size"][row]
+        name = child.get("name", "")
+        child["url"] = urls[row] if row in urls else payload["urlPrefix"] + str(name).lower()
+        child.update(extra.get(row, {}))
+        children.append(child)
+    return {"children": children}
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
+
+
+def write_payload(payload: Dict[str, Any], out_path: Path) -> Tuple[int, bool]:
+    """Write the minified payload; return (json bytes, written?)."""
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return len(data), _write_if_changed(out_path, data)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compile the Bubbles widget chart JSON into compact per-speaker payloads.")
+    parser.add_argument(
+        "--src",
+        default=str(BUBBLES_ROOT / "json" / "json"),
+        help="Per-speaker chart folders (default: <repo>/docs/widgets/Widgets/Bubbles/json/json)",
+    )
+    parser.add_argument(
+        "--out",
+        default=str(BUBBLES_ROOT / "json" / "compiled"),
+        help="Output folder (default: <repo>/docs/widgets/Widgets/Bubbles/json/compiled)",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Decode every payload again and check it matches the source charts",
+    )
+    args = parser.parse_args(argv)
+
+    src = Path(args.src)
+    out = Path(args.out)
+    if not src.is_dir():
+        print(f"Source folder not found: {src}")
+        return 2
+    out.mkdir(parents=True, exist_ok=True)
+
+    speakers = sorted(p for p in src.iterdir() if p.is_dir())
+    src_bytes = 0
+    out_bytes = 0
+    written = 0
+    mismatches: List[str] = []
+    for speaker_dir in speakers:
+        payload = compile_speaker(speaker_dir)
+        size, changed = write_payload(payload, out / f"{speaker_dir.name.lower()}.json")
+        out_bytes += size
+        written += int(changed)
+        for chart_type in payload["charts"]:
+            path = speaker_dir / f"{chart_type}.json"
+            src_bytes += path.stat().st_size
+            if args.verify and decode_chart(payload, chart_type) != json.loads(path.read_text(encoding="utf-8")):
+                mismatches.append(str(path))
+
+    print(
+        f"Compiled {len(speakers)} speakers ({written} updated): "
+        f"{src_bytes / 1e6:.1f} MB -> {out_bytes / 1e6:.1f} MB"
+    )
+    if mismatches:
+        print(f"Round-trip mismatches: {len(mismatches)}")
+        for path in mismatches[:10]:
+            print(f"- {path}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
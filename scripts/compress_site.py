@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Write precompressed `.gz`/`.br` siblings for the site's text files, plus a manifest for servers.
+
+Static hosts (and `bomex.py serve`) can send `people/index.html.br` to clients that accept brotli
+instead of compressing on every request. This step walks `docs/`, compresses HTML, CSS, JS and JSON
+files of at least `--min-size` bytes (brotli only when the optional `brotli` package is installed),
+and records every file it would serve in `docs/.static-manifest.json`:
+
+    {
+      "version": 1,
+      "min_size": 1024,
+      "encoders": ["br", "gzip"],
+      "files": {
+        "people/index.html": {
+          "type": "text/html; charset=utf-8", "size": 60412, "hash": "3f1c...", "mtime_ns": ...,
+          "encodings": {"br": 7311, "gzip": 9120}     # Content-Encoding -> compressed size
+        }
+      }
+    }
+
+Files whose size and mtime match the previous manifest are not read again; files whose content hash
+is unchanged are not recompressed. Siblings that save less than 10% are not kept, and siblings of
+files that are gone or no longer compressed are removed. Neither the siblings nor the manifest are
+committed.
+
+Usage:
+    uv run scripts/bomex.py compress --jobs 0
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # optional
+    brotli = None
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DOCS_ROOT = REPO_ROOT / "docs"
+
+MANIFEST_NAME = ".static-manifest.json"
+MANIFEST_VERSION = 1
+COMPRESSIBLE_SUFFIXES = (".html", ".css", ".js", ".json")
+MAX_RATIO = 0.9  # keep a sibling only if it is at most this fraction of the original
+TEXT_TYPES = ("text/", "image/svg+xml")
+
+# Content-Encoding -> sibling suffix, best first.
+SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+# Built-in table only, so the manifest doesn't depend on the machine's /etc/mime.types.
+_MIME = mimetypes.MimeTypes(filenames=())
+
+Entry = Dict[str, Any]
+Task = Tuple[str, Optional[Entry], bool]  # (path, previous entry, compress?)
+
+
+def _encoders() -> Dict[str, Callable[[bytes], bytes]]:
+    encoders: Dict[str, Callable[[bytes], bytes]] = {}
+    if brotli is not None:
+        encoders["br"] = lambda data: brotli.compress(data, quality=11)
+    encoders["gzip"] = lambda data: gzip.compress(data, compresslevel=9, mtime=0)
+    return encoders
+
+
+def content_type(path: Path) -> str:
+    mime = _MIME.guess_type(path.name)[0] or "application/octet-stream"
+    return f"{mime}; charset=utf-8" if mime.startswith(TEXT_TYPES) else mime
+
+
+def sibling(path: Path, encoding: str) -> Path:
+    return path.with_name(path.name + SUFFIXES[encoding])
+
+
+def load_manifest(docs_root: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads((docs_root / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION or not isinstance(data.get("files"), dict):
+        return {}
+    return data
+
+
+def _iter_files(docs_root: Path) -> List[Path]:
+    """Every file a server would send: no dotfiles and no compressed siblings."""
+    found: List[Path] = []
+    for dirpath, dirnames, filenames in os.walk(docs_root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        for name in sorted(filenames):
+            if not name.startswith(".") and not name.endswith(tuple(SUFFIXES.values())):
+                found.append(Path(dirpath) / name)
+    return found
+
+
+def _is_current(entry: Optional[Entry], st: os.stat_result, path: Path) -> bool:
+    if not entry or entry.get("size") != st.st_size or entry.get("mtime_ns") != st.st_mtime_ns:
+        return False
+    return all(sibling(path, enc).exists() for enc in entry.get("encodings", {}))
+
+
+def _process(task: Task) -> Entry:
+    """Hash one file and (re)write its compressed siblings; return its manifest entry."""
+    path_str, previous, compress = task
+    path = Path(path_str)
+    st = path.stat()
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    entry: Entry = {"type": content_type(path), "size": len(data), "hash": digest, "mtime_ns": st.st_mtime_ns}
+
+    encodings: Dict[str, int] = {}
+    if compress:
+        unchanged = previous is not None and previous.get("hash") == digest
+        for enc, encode in _encoders().items():
+            out_path = sibling(path, enc)
+            if unchanged and enc in previous.get("encodings", {}) and out_path.exists():
+                encodings[enc] = previous["encodings"][enc]
+                continue
+            out = encode(data)
+            if len(out) <= len(data) * MAX_RATIO:
+                out_path.write_bytes(out)
+                encodings[enc] = len(out)
+    entry["encodings"] = encodings
+    return entry
+
+
+def compress_site(docs_root: Path, *, min_size: int, force: bool, mapper: Any = map) -> Tuple[int, int, int]:
+    """Bring siblings and manifest up to date; return (files, compressed, processed)."""
+    manifest = load_manifest(docs_root)
+    # A different threshold or encoder set changes which siblings should exist: start over.
+    settings_match = manifest.get("min_size") == min_size and manifest.get("encoders") == list(_encoders())
+    previous: Dict[str, Entry] = manifest.get("files", {}) if settings_match and not force else {}
+
+    files: Dict[str, Entry] = {}
+    pending: List[str] = []
+    tasks: List[Task] = []
+    for path in _iter_files(docs_root):
+        rel = path.relative_to(docs_root).as_posix()
+        st = path.stat()
+        entry = previous.get(rel)
+        if _is_current(entry, st, path):
+            files[rel] = entry
+            continue
+        compress = path.suffix.lower() in COMPRESSIBLE_SUFFIXES and st.st_size >= min_size
+        pending.append(rel)
+        tasks.append((str(path), entry, compress))
+
+    files.update(zip(pending, mapper(_process, tasks)))
+
+    # Siblings the old manifest listed that the new one doesn't (removed, shrunk or incompressible files).
+    for rel, entry in manifest.get("files", {}).items():
+        keep = files.get(rel, {}).get("encodings", {})
+        for enc in entry.get("encodings", {}):
+            if enc not in keep and enc in SUFFIXES:
+                sibling(docs_root / rel, enc).unlink(missing_ok=True)
+
+    content = json.dumps(
+        {
+            "version": MANIFEST_VERSION,
+            "min_size": min_size,
+            "encoders": list(_encoders()),
+            "files": dict(sorted(files.items())),
+        },
+        separators=(",", ":"),
+    )
+    manifest_path = docs_root / MANIFEST_NAME
+    if not manifest_path.exists() or manifest_path.read_text(encoding="utf-8") != content:
+        manifest_path.write_text(content, encoding="utf-8")
+    compressed = sum(1 for e in files.values() if e["encodings"])
+    return len(files), compressed, len(tasks)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Write .gz/.br siblings of docs/ text files and a static-server manifest.")
+    parser.add_argument(
+        "--docs-root",
+        default=str(DOCS_ROOT),
+        help="Site root to compress (default: <repo>/docs)",
+    )
+    parser.add_argument(
+        "--min-size",
+        type=int,
+        default=1024,
+        help="Smallest file (bytes) worth compressing (default: 1024)",
+    )
+    parser.add_argument("--force", action="store_true", help="Ignore the manifest: rehash and recompress everything")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for hashing/compressing (default: 1; 0 = one per CPU)",
+    )
+    args = parser.parse_args(argv)
+
+    docs_root = Path(args.docs_root)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if jobs == 1:
+        total, compressed, processed = compress_site(docs_root, min_size=args.min_size, force=args.force)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            total, compressed, processed = compress_site(
+                docs_root,
+                min_size=args.min_size,
+                force=args.force,
+                mapper=lambda fn, tasks: pool.map(fn, tasks, chunksize=max(1, len(tasks) // (jobs * 4))),
+            )
+    print(
+        f"Compressed: files={total} compressed={compressed} processed={processed} -> {docs_root / MANIFEST_NAME}"
+        + ("" if brotli is not None else " (brotli not installed; .gz only)")
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
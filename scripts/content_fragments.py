@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""Parse-once model of the content HTML fragments the page generator embeds.
+
+Each fragment (`docs/content/<kind>/<id>/*.html`) is parsed once with `html.parser` into a
+`Fragment` that carries everything the generator's transforms need:
+
+- `html`: the fragment with every `<table>` carrying the `content-table` class;
+- `chronology`: whether a paragraph, line or bold run starts with a year (`200 B.C.`, `circa A.D. 34`);
+- `text`: plain text, with a space at each tag boundary (search indexing);
+- `words`: word count of `text`;
+- `links`: outbound `<a href>` targets, in document order.
+
+Fragments are memoised in memory and under `.cache/fragments/` by content hash, so a build parses
+each distinct fragment at most once, and not at all when it is unchanged since the previous build.
+The disk cache holds one small JSON file per fragment, read and written as fragments are requested,
+so no process loads all of it. It stores the table edits rather than the rewritten markup.
+
+Usage (as a module):
+    from content_fragments import FragmentCache
+    fragments = FragmentCache(REPO_ROOT / ".cache" / "fragments")
+    fragment = fragments.get(path)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import html
+import json
+import os
+import re
+import shutil
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Bump when the model or its rules change so cached entries are re-parsed.
+FRAGMENT_CACHE_VERSION = 1
+CONTENT_TABLE_CLASS = "content-table"
+
+_TABLE_TAG_RE = re.compile(r"<table([^>]*)>", re.IGNORECASE)
+_CLASS_ATTR_RE = re.compile(r"\bclass\s*=\s*(['\"])(.*?)\1", re.IGNORECASE)
+_HAS_TABLE_CLASS_RE = re.compile(r"(?:^|\s)content-table(?:\s|$)")
+# Text a chronology line starts with: an optional "circa", then a year with its era on either side.
+_YEAR_START_RE = re.compile(
+    r"\s*(?:circa\s+)?(?:\d{1,4}\s*(?:B\.?C\.?|A\.?D\.?)|(?:B\.?C\.?|A\.?D\.?)\s*\d{1,4})", re.IGNORECASE
+)
+# Start tags a chronology line may follow: any <p...>, and bare <br>, <strong> and <b>.
+_LINE_START_TAG_RE = re.compile(r"<p|<br\s*/?>$|<strong>$|<b>$", re.IGNORECASE)
+
+Edit = Tuple[int, int, str]  # (offset, length, replacement) in the source text
+
+
+@dataclass(frozen=True)
+class Fragment:
+    html: str
+    chronology: bool
+    text: str
+    words: int
+    links: Tuple[str, ...]
+
+
+EMPTY = Fragment(html="", chronology=False, text="", words=0, links=())
+
+
+def _table_with_class(tag: str) -> str:
+    """`tag` (a raw `<table ...>` start tag) with `content-table` added to its class list."""
+
+    def _repl(match: re.Match[str]) -> str:
+        attrs = match.group(1) or ""
+        class_match = _CLASS_ATTR_RE.search(attrs)
+        if class_match:
+            existing = class_match.group(2)
+            if _HAS_TABLE_CLASS_RE.search(existing):
+                return f"<table{attrs}>"
+            new_classes = f"{existing} {CONTENT_TABLE_CLASS}"
+            new_attrs = attrs[: class_match.start()] + f' class="{new_classes}"' + attrs[class_match.end() :]
+            return f"<table{new_attrs}>"
+        return f"<table class=\"{CONTENT_TABLE_CLASS}\"{attrs}>"
+
+    return _TABLE_TAG_RE.sub(_repl, tag)
+
+
+class _FragmentParser(HTMLParser):
+    def __init__(self, source: str) -> None:
+        super().__init__(convert_charrefs=False)
+        # getpos() counts "\n"-separated lines only.
+        self._line_offsets = [0, *(m.end() for m in re.finditer("\n", source))]
+        self.edits: List[Edit] = []
+        self.links: List[str] = []
+        self.chronology = False
+        self._parts: List[str] = []
+        # Whether the next data run starts a line (fragment start, or right after a line-start tag).
+        self._line_start = True
+
+    def _offset(self) -> int:
+        line, col = self.getpos()
+        return self._line_offsets[line - 1] + col
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        raw = self.get_starttag_text() or ""
+        if raw[:6].lower() == "<table":
+            replacement = _table_with_class(raw)
+            if replacement != raw:
+                self.edits.append((self._offset(), len(raw), replacement))
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href:
+                self.links.append(href)
+        self._parts.append(" ")
+        self._line_start = bool(_LINE_START_TAG_RE.match(raw))
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._parts.append(" ")
+        self._line_start = False
+
+    def handle_comment(self, data: str) -> None:
+        self._parts.append(" ")
+        self._line_start = False
+
+    handle_decl = handle_pi = unknown_decl = handle_comment
+
+    def handle_data(self, data: str) -> None:
+        if self._line_start and not self.chronology and _YEAR_START_RE.match(data):
+            self.chronology = True
+        self._parts.append(data)
+        self._line_start = False
+
+    def handle_entityref(self, name: str) -> None:
+        self._parts.append(html.unescape(f"&{name};"))
+        self._line_start = False
+
+    def handle_charref(self, name: str) -> None:
+        self._parts.append(html.unescape(f"&#{name};"))
+        self._line_start = False
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+
+def _apply(source: str, edits: List[Edit]) -> str:
+    if not edits:
+        return source
+    out: List[str] = []
+    pos = 0
+    for offset, length, replacement in edits:
+        out.append(source[pos:offset])
+        out.append(replacement)
+        pos = offset + length
+    out.append(source[pos:])
+    return "".join(out)
+
+
+def _entry(source: str) -> Dict[str, Any]:
+    parser = _FragmentParser(source)
+    parser.feed(source)
+    parser.close()
+    text = parser.text
+    return {
+        "edits": parser.edits,
+        "chronology": parser.chronology,
+        "text": text,
+        "words": len(text.split()),
+        "links": parser.links,
+    }
+
+
+def parse_fragment(source: str) -> Fragment:
+    """Parse one fragment's HTML (no caching)."""
+    return _fragment(source, _entry(source))
+
+
+def _fragment(source: str, entry: Dict[str, Any]) -> Fragment:
+    return Fragment(
+        html=_apply(source, [tuple(e) for e in entry["edits"]]),
+        chronology=entry["chronology"],
+        text=entry["text"],
+        words=entry["words"],
+        links=tuple(entry["links"]),
+    )
+
+
+class FragmentCache:
+    """Fragments by content hash: in memory until `release()`, and on disk between builds.
+
+    Entries live at `<path>/v<FRAGMENT_CACHE_VERSION>/<hash[:2]>/<hash>.json` and are written as soon
+    as they are parsed, so workers share them without handing them to the parent.
+    """
+
+    def __init__(self, path: Optional[Path] = None, *, read: bool = True) -> None:
+        self.path = path
+        self.root = path / f"v{FRAGMENT_CACHE_VERSION}" if path is not None else None
+        self.read = read
+        self._fragments: Dict[str, Fragment] = {}
+        self._seen: Set[str] = set()
+        self._released = 0  # len(_order) at the last release()
+        self._order: List[str] = []  # _seen, in first-request order
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.json"
+
+    def _load(self, digest: str) -> Optional[Dict[str, Any]]:
+        if self.root is None or not self.read:
+            return None
+        try:
+            entry = json.loads(self._entry_path(digest).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) else None
+
+    def _store(self, digest: str, entry: Dict[str, Any]) -> None:
+        if self.root is None:
+            return
+        path = self._entry_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def get(self, path: Path) -> Fragment:
+        """The parsed fragment at `path`, or an empty one if it is missing."""
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return EMPTY
+        digest = hashlib.sha256(data).hexdigest()
+        if digest not in self._seen:
+            self._seen.add(digest)
+            self._order.append(digest)
+        fragment = self._fragments.get(digest)
+        if fragment is not None:
+            self.hits += 1
+            return fragment
+        # Same newline translation as Path.read_text().
+        source = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        entry = self._load(digest)
+        if entry is None:
+            self.misses += 1
+            entry = _entry(source)
+            self._store(digest, entry)
+        else:
+            self.hits += 1
+        fragment = self._fragments[digest] = _fragment(source, entry)
+        return fragment
+
+    def prune(self, keep: Set[str]) -> int:
+        """Remove disk entries (and older cache versions) for fragments not in `keep`; return how many."""
+        if self.path is None or not self.path.is_dir():
+            return 0
+        removed = 0
+        for child in self.path.iterdir():
+            if child != self.root and child.name[:1] == "v" and child.name[1:].isdigit() and child.is_dir():
+                shutil.rmtree(child, ignore_errors=True)
+        for shard in self.root.iterdir() if self.root.is_dir() else ():
+            for entry in shard.iterdir() if shard.is_dir() else ():
+                if entry.stem not in keep:
+                    entry.unlink(missing_ok=True)
+                    removed += 1
+        return removed
+
+    def seen(self) -> Set[str]:
+        """Content hashes requested from this cache so far."""
+        return set(self._seen)
+
+    def release(self) -> List[str]:
+        """Drop the in-memory fragments; return the hashes first requested since the last call.
+
+        A worker process hands the result to the parent's `merge()`, so the parent knows which disk
+        entries are still in use.
+        """
+        seen, self._released = self._order[self._released :], len(self._order)
+        self._fragments.clear()
+        return seen
+
+    def merge(self, seen: List[str]) -> None:
+        """Record another process's `release()`."""
+        for digest in seen:
+            if digest not in self._seen:
+                self._seen.add(digest)
+                self._order.append(digest)
@@ -19,6 +19,8 @@ By default this script is non-destructive: it writes to `docs/content/`.
 Usage:
   python3 scripts/convert_people_to_static.py
     python3 scripts/convert_people_to_static.py --in "old/bomex-webstructure/cameo jsons" --out docs/people
+  python3 scripts/convert_people_to_static.py --jobs 0   # one worker process per CPU
+  python3 scripts/convert_people_to_static.py --verify-rewriter   # also runs without the legacy tree
 
 Notes:
 - The generated HTML files are fragments (no <html>/<head>), suitable for injecting.
@@ -28,14 +30,21 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import re
-import shutil
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+from asset_store import place
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+# Hand-written *-analysis.js blocks covering every rewrite rule; `--verify-rewriter` always checks them.
+REWRITER_CORPUS = REPO_ROOT / "scripts" / "fixtures" / "rewriter"
 
 REPLACEMENT_CHAR = "\ufffd"  # U+FFFD replacement char; should not appear in output.
 
@@ -97,7 +106,10 @@ def _read_text(path: Path) -> str:
     2) Fall back to Windows-1252
     """
 
-    data = path.read_bytes()
+    return _decode_legacy(path.read_bytes())
+
+
+def _decode_legacy(data: bytes) -> str:
     try:
         return data.decode("utf-8")
     except UnicodeDecodeError:
@@ -114,8 +126,8 @@ def _materialize_local_image(*, item_id: str, image_value: str, out_dir: Path, i
     """Copy a legacy referenced image into out_dir and rewrite to a slug-based filename.
 
     Legacy JSON uses values like './Images/Gideon.jpg'. Those images live in
-    old/bomex-webstructure/public/Images. We copy them into the generated folder
-    and rename to '<item_id>.<ext>' so generated static paths are stable.
+    old/bomex-webstructure/public/Images. We link (or copy) them into the generated folder
+    as '<item_id>.<ext>' so generated static paths are stable; an existing main.jpg is renamed.
     """
 
     ref = (image_value or "").strip()
@@ -129,11 +141,7 @@ def _materialize_local_image(*, item_id: str, image_value: str, out_dir: Path, i
         main = out_dir / "main.jpg"
         if main.exists():
             dst = out_dir / f"{item_id}.jpg"
-            shutil.copy2(main, dst)
-            try:
-                main.unlink()
-            except Exception:
-                pass
+            place(main, dst, move=True)
             return f"./{dst.name}"
         return ref
 
@@ -146,8 +154,7 @@ def _materialize_local_image(*, item_id: str, image_value: str, out_dir: Path, i
     dst = out_dir / f"{item_id}{ext}"
 
     if src.exists():
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src, dst)
+        place(src, dst)
 
         # Remove old default name if present to reduce confusion.
         main = out_dir / "main.jpg"
@@ -162,12 +169,7 @@ def _materialize_local_image(*, item_id: str, image_value: str, out_dir: Path, i
     # If the legacy source isn't present, fall back to any existing main.jpg.
     main = out_dir / "main.jpg"
     if main.exists():
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(main, dst)
-        try:
-            main.unlink()
-        except Exception:
-            pass
+        place(main, dst, move=True)
         return f"./{dst.name}"
 
     return ref
@@ -233,7 +235,10 @@ def _convert_style_object(style_obj: str) -> str:
 
 
 def _jsx_to_html(fragment: str) -> str:
-    """Best-effort JSX->HTML conversion for this repo's analysis blocks."""
+    """Best-effort JSX->HTML conversion for this repo's analysis blocks.
+
+    Reference implementation; conversion uses `_rewrite_fragment` (see `--verify-rewriter`).
+    """
 
     out = _normalize_text(fragment)
 
@@ -341,7 +346,143 @@ def _postprocess_analysis_html(html_str: str) -> str:
     )
 
     s = _strip_did_you_know_blocks(s)
+    return _finish_paragraphs(s)
+
+
+# A JSX comment that cannot grow past its own `*/}` when a surrounding match backtracks.
+_JSX_COMMENT = r"(?s:\{/\*(?:(?!\*/\}).)*\*/\})"
+# Whitespace as the legacy pipeline sees it once JSX comments and `{' '}` spacers are resolved.
+_JSX_WS = rf"(?:\s|\{{' '\}}|{_JSX_COMMENT})"
+
+# Every token-level JSX/legacy rewrite as one alternation, so a fragment is scanned once.
+# Key Insights is anchored on `<b>`; the whitespace before it is trimmed from emitted output instead
+# of being matched, so the scanner doesn't try that branch at every space. The leading lookahead lists
+# every branch's first characters so the engine can skip plain text without trying each branch.
+_FRAGMENT_TOKEN_RE = re.compile(
+    r"(?=<[bBpPdDsS]|s[tr]|cl|\{[/']|\ufffd)(?:"
+    + "|".join(
+        [
+            rf"(?P<insights>(?i:<b>{_JSX_WS}*Key{_JSX_WS}+Insights{_JSX_WS}*</b>{_JSX_WS}*"
+            rf"(?:(?:<br>|(?-i:<br/>)){_JSX_WS}*){{1,4}}))",
+            r"(?P<margin>(?i:<(?P<mtag>p|div|span)\s+(?P<mkey>margin-left|left-margin|marginLeft|marginleft)\s*:\s*)"
+            r"(?P<mval>[^>]+?)>)",
+            r"(?P<marginattr>(?i:<(?P<atag>p|div|span)\s+(?:marginLeft|marginleft)=(?P<aq>['\"])(?P<aval>[^'\"]+)(?P=aq)>))",
+            r"(?P<style>style=\{\{(?P<sobj>[^}]*)\}\})",
+            r"(?P<require>src=\{require\((?P<rq>['\"])(?P<rpath>.*?)(?P=rq)\)\})",
+            rf"(?P<comment>{_JSX_COMMENT})",
+            r"(?P<spacer>\{' '\})",
+            r"(?P<br><br/>)",
+            r"(?P<classname>\bclassName=)",
+            r"(?P<fffd>(?<=\w)\ufffd(?=\w))",
+            r"(?P<p>(?i:<p\b))",
+        ]
+    )
+    + ")"
+)
+
+_KEY_INSIGHTS_HTML = "</p><h4 class=\"analysis-heading\">Practical application</h4><p>"
+
+
+def _trim_trailing_ws(out: List[str], kinds: List[str]) -> None:
+    """Drop whitespace (incl. resolved spacers/comments) at the end of the emitted pieces."""
+    while out:
+        if kinds[-1] in ("spacer", "comment"):
+            out.pop()
+            kinds.pop()
+        elif kinds[-1] == "text":
+            stripped = out[-1].rstrip()
+            if stripped:
+                out[-1] = stripped
+                return
+            out.pop()
+            kinds.pop()
+        else:
+            return
+
+
+def _rewrite_tokens(fragment: str) -> Tuple[str, int]:
+    """Apply all token-level rewrites in one pass. Returns (html, number of original `<p` tags)."""
 
+    paragraphs = 0
+
+    def _repl(m: re.Match[str]) -> str:
+        nonlocal paragraphs
+        kind = m.lastgroup
+        if kind == "p":
+            paragraphs += 1
+            return m.group(0)
+        if kind == "classname":
+            return "class="
+        if kind == "fffd":
+            return "’"
+        if kind == "br":
+            return "<br>"
+        if kind == "spacer":
+            return " "
+        if kind == "comment":
+            return ""
+        if kind == "insights":
+            return _KEY_INSIGHTS_HTML
+        if kind == "style":
+            return f'style="{_convert_style_object(_normalize_text(m.group("sobj")))}"'
+        if kind == "require":
+            return f'src="{_normalize_text(m.group("rpath"))}"'
+        if kind == "marginattr":
+            tag = m.group("atag")
+            paragraphs += tag.lower() == "p"
+            val = _FRAGMENT_TOKEN_RE.sub(_repl, m.group("aval")).strip().rstrip(";")
+            return f"<{tag} style=\"margin-left: {val};\">"
+        # margin: `<p margin-left: 5%>` and friends; only left-indent keys are rewritten.
+        tag = m.group("mtag")
+        paragraphs += tag.lower() == "p"
+        val = _FRAGMENT_TOKEN_RE.sub(_repl, m.group("mval"))
+        if m.group("mkey") in ("margin-left", "left-margin", "marginleft", "marginLeft"):
+            return f"<{tag} style=\"margin-left: {val.strip().rstrip(';')};\">"
+        return m.group(0)[: m.start("mval") - m.start()] + val + ">"
+
+    out: List[str] = []
+    kinds: List[str] = []
+    pos = 0
+    for m in _FRAGMENT_TOKEN_RE.finditer(fragment):
+        if m.start() > pos:
+            out.append(fragment[pos : m.start()])
+            kinds.append("text")
+        if m.lastgroup == "insights":
+            _trim_trailing_ws(out, kinds)
+        out.append(_repl(m))
+        kinds.append(m.lastgroup or "")
+        pos = m.end()
+    out.append(fragment[pos:])
+    return "".join(out).strip(), paragraphs
+
+
+_OUTER_P_RE = re.compile(
+    r"^(\s*<div\s+class=\"analysis\"\s*>)(\s*<p[^>]*>)(.*?)(</p>\s*)(</div>\s*)$",
+    flags=re.DOTALL | re.IGNORECASE,
+)
+_P_TAG_RE = re.compile(r"\s*<p\b", flags=re.IGNORECASE)
+
+
+def _rewrite_fragment(fragment: str) -> str:
+    """Single-scan equivalent of `_postprocess_analysis_html(_jsx_to_html(fragment))`.
+
+    All token rewrites (mojibake, className, style/require, comments, margins, Key Insights) happen in
+    one pass; only the block-level cleanups that depend on each other's output run afterwards.
+    """
+
+    s, paragraphs = _rewrite_tokens(fragment)
+
+    # Unwrap a single outer <p> when other paragraphs sit inside it (see `_unwrap_single_outer_p`);
+    # counted from the original tags so injected Key Insights paragraphs don't count.
+    m = _OUTER_P_RE.match(s)
+    if m and paragraphs - (1 if _P_TAG_RE.match(m.group(2)) else 0) > 0:
+        s = m.group(1) + m.group(3) + m.group(5)
+
+    s = _strip_did_you_know_blocks(s)
+    return _finish_paragraphs(s)
+
+
+def _finish_paragraphs(s: str) -> str:
     # If we inserted paragraph boundaries but the fragment has no paragraph tags at all,
     # wrap the content in a single <p>..</p> to keep the HTML valid.
     if "<p" not in s.lower():
@@ -364,15 +505,16 @@ def _postprocess_analysis_html(html_str: str) -> str:
     return s.strip()
 
 
-def _extract_returned_div(htmlish: str) -> str:
-    """Given content starting at `return <div...`, return the full <div>...</div> block.
+def _extract_returned_div(htmlish: str, pos: int = 0) -> Tuple[int, int]:
+    """Given content at `pos` starting at `return <div...`, return the (start, end) of the full <div>...</div> block.
 
-    Uses a <div> nesting counter; good enough for this codebase.
+    Uses a <div> nesting counter; good enough for this codebase. Works on offsets so callers never
+    copy the remainder of the file.
     """
 
-    start = htmlish.find("<div")
+    start = htmlish.find("<div", pos)
     if start == -1:
-        return htmlish.strip()
+        return pos, len(htmlish)
 
     tag_re = re.compile(r"</?div\b", re.IGNORECASE)
     count = 0
@@ -393,15 +535,15 @@ def _extract_returned_div(htmlish: str) -> str:
             count += 1
 
     if end is None:
-        return htmlish[start:].strip()
+        return start, len(htmlish)
 
-    return htmlish[start:end].strip()
+    return start, end
 
 
-def parse_analysis_file(path: Path) -> List[AnalysisBlock]:
-    text = _read_text(path)
-    blocks: List[AnalysisBlock] = []
+def index_analysis_blocks(text: str) -> List[Tuple[str, int, int]]:
+    """One linear scan of an analysis file: (analysis_id, start, end) offsets of each returned <div> block."""
 
+    index: List[Tuple[str, int, int]] = []
     occurrences: Dict[str, int] = {}
 
     # Find `if (id === "...") {` and `else if (id === "...") {` occurrences.
@@ -410,17 +552,121 @@ def parse_analysis_file(path: Path) -> List[AnalysisBlock]:
         base_id = m.group(2)
         occurrences[base_id] = occurrences.get(base_id, 0) + 1
         analysis_id = base_id if occurrences[base_id] == 1 else f"{base_id}{occurrences[base_id]}"
-        after = text[m.end() :]
-        ret_pos = after.find("return")
+        ret_pos = text.find("return", m.end())
         if ret_pos == -1:
             continue
-        after_return = after[ret_pos:]
         # Capture from first '<div' through balanced '</div>'
-        div_block = _extract_returned_div(after_return)
-        html = _postprocess_analysis_html(_jsx_to_html(div_block))
-        blocks.append(AnalysisBlock(analysis_id=analysis_id, html=html, source_path=str(path)))
+        start, end = _extract_returned_div(text, ret_pos)
+        index.append((analysis_id, start, end))
+
+    return index
+
+
+def _iter_returned_divs(text: str) -> Iterable[Tuple[str, str]]:
+    """Yield (analysis_id, raw JSX <div> block) for each `id === "..."` branch in an analysis file."""
+
+    for analysis_id, start, end in index_analysis_blocks(text):
+        yield analysis_id, text[start:end].strip()
+
 
-    return blocks
+def _parse_analysis_text(text: str, source_path: str) -> List[AnalysisBlock]:
+    return [
+        AnalysisBlock(analysis_id=analysis_id, html=_rewrite_fragment(div_block), source_path=source_path)
+        for analysis_id, div_block in _iter_returned_divs(text)
+    ]
+
+
+def parse_analysis_file(path: Path) -> List[AnalysisBlock]:
+    return _parse_analysis_text(_read_text(path), str(path))
+
+
+def _analysis_entry(path: Path) -> Dict[str, Any]:
+    """Parse one `*-analysis.js` into an AnalysisCache entry (stat key, content hash, blocks)."""
+    st = path.stat()
+    data = path.read_bytes()
+    blocks = _parse_analysis_text(_decode_legacy(data), str(path))
+    return {
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "blocks": [[b.analysis_id, b.html] for b in blocks],
+    }
+
+
+# Bump when parsing or fragment rewriting changes so cached blocks are re-extracted.
+ANALYSIS_CACHE_VERSION = "1"
+
+
+class AnalysisCache:
+    """On-disk cache of extracted blocks per `*-analysis.js`, keyed by mtime/size and content hash."""
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        if path is None or not path.exists():
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        if isinstance(data, dict) and data.get("version") == ANALYSIS_CACHE_VERSION:
+            files = data.get("files")
+            if isinstance(files, dict):
+                self.entries = files
+
+    def parse(self, path: Path) -> List[AnalysisBlock]:
+        blocks = self.get(path)
+        return blocks if blocks is not None else self.add(path, _analysis_entry(path))
+
+    def get(self, path: Path) -> Optional[List[AnalysisBlock]]:
+        """The cached blocks of `path` if it is unchanged, else None (parse it and `add()` the entry)."""
+        key = str(path)
+        st = path.stat()
+        entry = self.entries.get(key)
+        if entry and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            self.hits += 1
+            return self._blocks(entry, key)
+        if entry and entry.get("sha256") == hashlib.sha256(path.read_bytes()).hexdigest():
+            # Touched but unchanged: refresh the stat key and reuse the blocks.
+            entry.update(mtime_ns=st.st_mtime_ns, size=st.st_size)
+            self.hits += 1
+            return self._blocks(entry, key)
+        return None
+
+    def add(self, path: Path, entry: Dict[str, Any]) -> List[AnalysisBlock]:
+        """Store an `_analysis_entry()` for `path`; return its blocks."""
+        key = str(path)
+        self.misses += 1
+        self.entries[key] = entry
+        return self._blocks(entry, key)
+
+    @staticmethod
+    def _blocks(entry: Dict[str, Any], key: str) -> List[AnalysisBlock]:
+        return [AnalysisBlock(analysis_id=aid, html=html, source_path=key) for aid, html in entry["blocks"]]
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        files = {k: v for k, v in sorted(self.entries.items()) if Path(k).exists()}
+        _write_text(self.path, json.dumps({"version": ANALYSIS_CACHE_VERSION, "files": files}, ensure_ascii=False) + "\n")
+
+
+def verify_rewriter(roots: Iterable[Path]) -> Tuple[int, List[str]]:
+    """Compare `_rewrite_fragment` against the original multi-pass pipeline; return (blocks, mismatching ids)."""
+
+    checked = 0
+    mismatches: List[str] = []
+    for root in roots:
+        if not root.exists():
+            continue
+        for js_path in sorted(root.rglob("*-analysis.js")):
+            for analysis_id, div_block in _iter_returned_divs(_read_text(js_path)):
+                checked += 1
+                if _rewrite_fragment(div_block) != _postprocess_analysis_html(_jsx_to_html(div_block)):
+                    mismatches.append(f"{js_path}:{analysis_id}")
+    return checked, mismatches
 
 
 def _load_json_speaker(path: Path) -> Dict[str, Any]:
@@ -452,6 +698,13 @@ def _analysis_keys(speaker: Dict[str, Any]) -> List[Tuple[int, str, str]]:
     return pairs
 
 
+def _load_json_speaker_or_none(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return _load_json_speaker(path)
+    except Exception:
+        return None
+
+
 def _pick_person_id(entries: List[Dict[str, Any]]) -> str:
     # Prefer the entry that looks like the actual person bio:
     # highest word_count, and has a year or description.
@@ -630,6 +883,82 @@ def build_item_details(
     }
 
 
+DETAILS_FILENAMES = {
+    "people": "person-details.json",
+    "concepts": "concept-details.json",
+    "influences": "influence-details.json",
+}
+
+# (category, tier ("" for concepts/influences), group anchor, item id, json entries, the analysis blocks
+# they reference, output root, legacy images root or None)
+GroupTask = Tuple[
+    str, str, str, str, List[Tuple[Path, Dict[str, Any]]], Dict[str, AnalysisBlock], Path, Optional[Path]
+]
+
+# A `map`-compatible callable: the builtin for serial runs, or a process pool's `map`.
+Mapper = Callable[..., Iterable[Any]]
+
+
+def _referenced_blocks(
+    entries: List[Tuple[Path, Dict[str, Any]]], analysis_map: Dict[str, AnalysisBlock]
+) -> Dict[str, AnalysisBlock]:
+    # Only these go to a worker with the group, not the whole map.
+    return {aid: analysis_map[aid] for _, sp in entries for _, _, aid in _analysis_keys(sp) if aid in analysis_map}
+
+
+def convert_group(task: GroupTask) -> List[str]:
+    """Write one person/concept/influence folder; return its missing-HTML warnings (`<item>:<analysis id>`)."""
+    category, tier, anchor, item_id, entries, analysis_map, out_root, images_root = task
+    out_dir = out_root / category / item_id
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    if category == "people":
+        details = build_person_details(
+            person_id=item_id,
+            tier=tier,
+            group_label=anchor,
+            json_entries=entries,
+            analysis_map=analysis_map,
+            out_dir=out_dir,
+        )
+        label = item_id
+    else:
+        details = build_item_details(
+            item_id=item_id,
+            category=category,
+            group_label=anchor,
+            json_entries=entries,
+            analysis_map=analysis_map,
+            out_dir=out_dir,
+        )
+        label = f"{category}/{item_id}"
+
+    if images_root is not None:
+        _materialize_images_in_details(details, item_id=item_id, out_dir=out_dir, images_root=images_root)
+
+    if category == "concepts" and anchor.lower().startswith("lamanite kings/"):
+        title = str(details.get("display_name") or "")
+        details["display_name"] = f"Lamanite kings: {title}".strip()
+
+    # Track missing HTML for analysis ids referenced by JSON but not found in parsed JSX.
+    missing = [
+        f"{label}:{section['analysis_id']}"
+        for page in details["pages"]
+        for section in page["sections"]
+        if section["analysis_id"] not in analysis_map
+    ]
+
+    details_filename = DETAILS_FILENAMES.get(category, "details.json")
+    _write_text(out_dir / details_filename, json.dumps(details, indent=2, ensure_ascii=False) + "\n")
+    return missing
+
+
+def _convert_groups(tasks: List[GroupTask]) -> List[str]:
+    # Groups that share an output folder run in order in one task, so later groups overwrite earlier ones
+    # exactly as in a serial run.
+    return [warning for task in tasks for warning in convert_group(task)]
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(description="Convert people JSX+JSON into static per-person folders")
     parser.add_argument(
@@ -650,9 +979,54 @@ def main(argv: Optional[List[str]] = None) -> int:
         default="all",
         help="What to convert (default: all: speakers+concepts+influences)",
     )
+    parser.add_argument(
+        "--cache",
+        default=str(REPO_ROOT / ".cache" / "analysis-index.json"),
+        help="Parsed *-analysis.js cache; only changed files are re-parsed (default: <repo>/.cache/analysis-index.json)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every *-analysis.js and leave the cache untouched",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for analysis parsing and per-item conversion (default: 1; 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--verify-rewriter",
+        action="store_true",
+        help="Check the single-pass fragment rewriter against the multi-pass pipeline on the committed corpus "
+        "(scripts/fixtures/rewriter) and every input block; write nothing",
+    )
 
     args = parser.parse_args(argv)
 
+    if args.verify_rewriter:
+        checked, mismatches = verify_rewriter([REWRITER_CORPUS, *_parse_roots(args)])
+        for item in mismatches:
+            print(f"  mismatch: {item}")
+        print(f"Rewriter mismatches: {len(mismatches)} of {checked} blocks")
+        return 1 if mismatches else 0
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if jobs == 1:
+        return _convert(args, map)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return _convert(args, lambda fn, tasks: pool.map(fn, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+
+
+def _parse_roots(args: argparse.Namespace) -> List[Path]:
+    in_dir = Path(args.in_dir).resolve()
+    roots = [in_dir / "Major speakers", in_dir / "Minor speakers"]
+    if args.include == "all":
+        roots += [in_dir / "Concepts", in_dir / "Influences"]
+    return roots
+
+
+def _convert(args: argparse.Namespace, mapper: Mapper) -> int:
     in_dir = Path(args.in_dir).resolve()
     out_root = Path(args.out_dir).resolve()
     images_root = Path(args.images_root).resolve()
@@ -660,133 +1034,84 @@ def main(argv: Optional[List[str]] = None) -> int:
     speaker_roots = [in_dir / "Major speakers", in_dir / "Minor speakers"]
     concept_root = in_dir / "Concepts"
     influence_root = in_dir / "Influences"
-
-    parse_roots = list(speaker_roots)
-    if args.include == "all":
-        parse_roots += [concept_root, influence_root]
-
-    # Parse all analysis blocks first (id -> html fragment)
+    parse_roots = _parse_roots(args)
+
+    # Parse all analysis blocks first (id -> html fragment); unchanged files come from the cache.
+    cache = AnalysisCache(None if args.no_cache else Path(args.cache).resolve())
+    js_paths = [p for root in parse_roots if root.exists() for p in root.rglob("*-analysis.js")]
+    parsed = {p: cache.get(p) for p in js_paths}
+    stale = [p for p, blocks in parsed.items() if blocks is None]
+    for js_path, entry in zip(stale, mapper(_analysis_entry, stale)):
+        parsed[js_path] = cache.add(js_path, entry)
     analysis_map: Dict[str, AnalysisBlock] = {}
-    for root in parse_roots:
-        if not root.exists():
-            continue
-        for js_path in root.rglob("*-analysis.js"):
-            for block in parse_analysis_file(js_path):
-                # Keep first occurrence; ids should be unique.
-                analysis_map.setdefault(block.analysis_id, block)
+    for js_path in js_paths:
+        for block in parsed[js_path]:
+            # Keep first occurrence; ids should be unique.
+            analysis_map.setdefault(block.analysis_id, block)
+    cache.save()
 
     # Group speaker json entries by "person" anchor.
     # Anchor = first folder component under Major/Minor speakers.
     people_groups: Dict[Tuple[str, str], List[Tuple[Path, Dict[str, Any]]]] = {}
-    for root in speaker_roots[:2]:  # only Major/Minor for grouping
-        if not root.exists():
+    people_json = [(root, p) for root in speaker_roots[:2] if root.exists() for p in root.rglob("*.json")]
+    for (root, json_path), sp in zip(people_json, mapper(_load_json_speaker_or_none, [p for _, p in people_json])):
+        if sp is None:
             continue
         tier = "major" if root.name.lower().startswith("major") else "minor"
-        for json_path in root.rglob("*.json"):
-            try:
-                sp = _load_json_speaker(json_path)
-            except Exception:
-                continue
-
-            rel = json_path.relative_to(root)
-            anchor = rel.parts[0] if len(rel.parts) > 1 else json_path.stem
-            people_groups.setdefault((tier, anchor), []).append((json_path, sp))
+        rel = json_path.relative_to(root)
+        anchor = rel.parts[0] if len(rel.parts) > 1 else json_path.stem
+        people_groups.setdefault((tier, anchor), []).append((json_path, sp))
 
     # Group concept and influence json entries. Influences are one-page-per-JSON.
     # Concepts are grouped by folder, except "Lamanite kings" which is one-page-per-JSON.
     item_groups: Dict[Tuple[str, str], List[Tuple[Path, Dict[str, Any]]]] = {}
     if args.include == "all":
-        for root, category in [(concept_root, "concepts"), (influence_root, "influences")]:
-            if not root.exists():
+        item_json = [
+            (root, category, p)
+            for root, category in [(concept_root, "concepts"), (influence_root, "influences")]
+            if root.exists()
+            for p in root.rglob("*.json")
+        ]
+        for (root, category, json_path), sp in zip(
+            item_json, mapper(_load_json_speaker_or_none, [p for _, _, p in item_json])
+        ):
+            if sp is None:
                 continue
-            for json_path in root.rglob("*.json"):
-                try:
-                    sp = _load_json_speaker(json_path)
-                except Exception:
-                    continue
-                rel = json_path.relative_to(root)
-                rel_anchor = rel.with_suffix("").as_posix()
-                if category == "influences":
-                    anchor = rel_anchor
-                elif rel.parts and rel.parts[0].lower() == "lamanite kings":
-                    anchor = rel_anchor
-                else:
-                    anchor = rel.parts[0] if len(rel.parts) > 1 else json_path.stem
-                item_groups.setdefault((category, anchor), []).append((json_path, sp))
-
-    written_people = 0
-    missing_html: List[str] = []
-
-    # Write speakers under <out>/people
-    people_root_out = out_root / "people"
+            rel = json_path.relative_to(root)
+            rel_anchor = rel.with_suffix("").as_posix()
+            if category == "influences":
+                anchor = rel_anchor
+            elif rel.parts and rel.parts[0].lower() == "lamanite kings":
+                anchor = rel_anchor
+            else:
+                anchor = rel.parts[0] if len(rel.parts) > 1 else json_path.stem
+            item_groups.setdefault((category, anchor), []).append((json_path, sp))
+
+    # Speakers go under <out>/people, concepts and influences under <out>/<category>; each item id is
+    # picked from its most bio-like entry.
+    images = images_root if images_root.exists() else None
+    folders: Dict[Tuple[str, str], List[GroupTask]] = {}
     for (tier, anchor), entries in sorted(people_groups.items(), key=lambda kv: kv[0]):
-        # Determine person id by picking the most bio-like entry.
         person_id = _pick_person_id([sp for _, sp in entries])
-        out_dir = people_root_out / person_id
-        out_dir.mkdir(parents=True, exist_ok=True)
-
-        details = build_person_details(
-            person_id=person_id,
-            tier=tier,
-            group_label=anchor,
-            json_entries=entries,
-            analysis_map=analysis_map,
-            out_dir=out_dir,
+        blocks = _referenced_blocks(entries, analysis_map)
+        folders.setdefault(("people", person_id), []).append(
+            ("people", tier, anchor, person_id, entries, blocks, out_root, images)
         )
-
-        if images_root.exists():
-            _materialize_images_in_details(details, item_id=person_id, out_dir=out_dir, images_root=images_root)
-
-        # Track missing HTML for analysis ids referenced by JSON but not found in parsed JSX.
-        for page in details["pages"]:
-            for section in page["sections"]:
-                aid = section["analysis_id"]
-                if aid not in analysis_map:
-                    missing_html.append(f"{person_id}:{aid}")
-
-        _write_text(out_dir / "person-details.json", json.dumps(details, indent=2, ensure_ascii=False) + "\n")
-        written_people += 1
-
-    written_items = 0
-    if args.include == "all":
-        for (category, anchor), entries in sorted(item_groups.items(), key=lambda kv: kv[0]):
-            item_id = _pick_person_id([sp for _, sp in entries])
-            out_dir = out_root / category / item_id
-            out_dir.mkdir(parents=True, exist_ok=True)
-
-            details = build_item_details(
-                item_id=item_id,
-                category=category,
-                group_label=anchor,
-                json_entries=entries,
-                analysis_map=analysis_map,
-                out_dir=out_dir,
-            )
-
-            if images_root.exists():
-                _materialize_images_in_details(details, item_id=item_id, out_dir=out_dir, images_root=images_root)
-
-            if category == "concepts" and anchor.lower().startswith("lamanite kings/"):
-                title = str(details.get("display_name") or "")
-                details["display_name"] = f"Lamanite kings: {title}".strip()
-
-            for page in details["pages"]:
-                for section in page["sections"]:
-                    aid = section["analysis_id"]
-                    if aid not in analysis_map:
-                        missing_html.append(f"{category}/{item_id}:{aid}")
-
-            details_filename = {
-                "concepts": "concept-details.json",
-                "influences": "influence-details.json",
-            }.get(category, "details.json")
-            _write_text(out_dir / details_filename, json.dumps(details, indent=2, ensure_ascii=False) + "\n")
-            written_items += 1
+    for (category, anchor), entries in sorted(item_groups.items(), key=lambda kv: kv[0]):
+        item_id = _pick_person_id([sp for _, sp in entries])
+        blocks = _referenced_blocks(entries, analysis_map)
+        folders.setdefault((category, item_id), []).append(
+            (category, "", anchor, item_id, entries, blocks, out_root, images)
+        )
+    missing_html = [warning for found in mapper(_convert_groups, list(folders.values())) for warning in found]
+    written_people = len(people_groups)
+    written_items = len(item_groups)
 
     if args.include == "all":
         print(f"Wrote {written_people} people and {written_items} items to: {out_root}")
     else:
         print(f"Wrote {written_people} people to: {out_root}")
+    print(f"Analysis files: parsed={cache.misses} cached={cache.hits}")
     if missing_html:
         # De-dupe and show a small sample to avoid noisy output.
         missing_unique = sorted(set(missing_html))
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import argparse
+import mmap
+import os
 import re
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -49,8 +54,62 @@ REPLACEMENT_QUOTE_RULES: Sequence[Tuple[re.Pattern[str], str]] = [
 ]
 
 
+def _chained_fixes(fixes: Sequence[Fix]) -> List[Tuple[str, str, Tuple[str, ...]]]:
+    """Sequences that only match after an earlier fix's output completes a later pattern.
+
+    Applying the fixes in turn lets e.g. "â€â€œ" become "â€“" (via the left double quote fix) and then
+    "–". Returns (sequence, final replacement, descriptions counted) for each such pair.
+    """
+    chained = []
+    for i, first in enumerate(fixes):
+        if not first.replacement:
+            continue
+        for later in fixes[i + 1 :]:
+            k = later.pattern.find(first.replacement)
+            while k != -1:
+                sequence = later.pattern[:k] + first.pattern + later.pattern[k + len(first.replacement) :]
+                chained.append((sequence, later.replacement, (first.description, later.description)))
+                k = later.pattern.find(first.replacement, k + 1)
+    return chained
+
+
+_CHAINED_FIXES = _chained_fixes(MOJIBAKE_FIXES)
+
+# All MOJIBAKE_FIXES as one alternation: chained sequences first, then the fixes in list order so
+# longer sequences ("Â\u00a0") win over their prefixes ("Â") at the same position. One scan gives the
+# same result and counts as replacing them in turn.
+MOJIBAKE_RE = re.compile(
+    "|".join(re.escape(seq) for seq, _, _ in _CHAINED_FIXES)
+    + ("|" if _CHAINED_FIXES else "")
+    + "|".join(re.escape(fx.pattern) for fx in MOJIBAKE_FIXES)
+)
+_MOJIBAKE_BY_MATCH: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    **{fx.pattern: (fx.replacement, (fx.description,)) for fx in MOJIBAKE_FIXES},
+    **{seq: (repl, descs) for seq, repl, descs in _CHAINED_FIXES},
+}
+# Every fix starts with one of these; text without any of them needs no regex scan at all.
+_MOJIBAKE_TRIGGERS = sorted({fx.pattern[0] for fx in MOJIBAKE_FIXES})
+
+# The apostrophe rules never overlap (letter-after vs. non-letter-after), so they can run as one pass.
+REPLACEMENT_APOSTROPHE_RE = re.compile("|".join(f"(?:{rx.pattern})" for rx, _ in REPLACEMENT_APOSTROPHE_RULES))
+
+
 TEXT_FILE_EXTS = {".html", ".htm", ".json", ".js", ".css", ".md", ".txt"}
 
+# UTF-8 bytes of every character a fix can start with; files containing none of them cannot change
+# and are skipped without being decoded.
+CANDIDATE_BYTES: Sequence[bytes] = [ch.encode("utf-8") for ch in (*_MOJIBAKE_TRIGGERS, "\ufffd")]
+# Grouped by lead byte: a single-byte find is a memchr, several times faster than a multi-byte one,
+# and most files contain no lead byte at all.
+_CANDIDATES_BY_LEAD: Dict[bytes, List[bytes]] = {}
+for _needle in CANDIDATE_BYTES:
+    _CANDIDATES_BY_LEAD.setdefault(_needle[:1], []).append(_needle)
+
+# Files above this size are fixed in newline-aligned chunks instead of being loaded whole. No fix
+# matches or looks across a newline, so chunking gives the same result as one pass.
+CHUNK_THRESHOLD = 1024 * 1024
+CHUNK_CHARS = 1024 * 1024
+
 
 def _iter_files(root: Path) -> Iterable[Path]:
     for p in root.rglob("*"):
@@ -67,17 +126,19 @@ def _iter_files(root: Path) -> Iterable[Path]:
 def fix_text(s: str) -> Tuple[str, Dict[str, int]]:
     counts: Dict[str, int] = {}
 
-    for fx in MOJIBAKE_FIXES:
-        if fx.pattern in s:
-            counts[fx.description] = counts.get(fx.description, 0) + s.count(fx.pattern)
-            s = s.replace(fx.pattern, fx.replacement)
+    def _mojibake_repl(m: re.Match[str]) -> str:
+        replacement, descriptions = _MOJIBAKE_BY_MATCH[m.group(0)]
+        for description in descriptions:
+            counts[description] = counts.get(description, 0) + 1
+        return replacement
+
+    if any(ch in s for ch in _MOJIBAKE_TRIGGERS):
+        s = MOJIBAKE_RE.sub(_mojibake_repl, s)
 
     if "\ufffd" in s:
-        before = s
-        for rx, repl in REPLACEMENT_APOSTROPHE_RULES:
-            s = rx.sub(repl, s)
-        if s != before:
-            counts["replacement-char->apostrophe"] = counts.get("replacement-char->apostrophe", 0) + (before.count("\ufffd") - s.count("\ufffd"))
+        s, n = REPLACEMENT_APOSTROPHE_RE.subn("’", s)
+        if n:
+            counts["replacement-char->apostrophe"] = counts.get("replacement-char->apostrophe", 0) + n
 
     if "\ufffd" in s:
         before = s
@@ -89,27 +150,120 @@ def fix_text(s: str) -> Tuple[str, Dict[str, int]]:
     return s, counts
 
 
-def run(root: Path, apply: bool) -> int:
-    touched = 0
-    total_replacements: Dict[str, int] = {}
-
-    for path in _iter_files(root):
+def _has_candidate(path: Path) -> bool:
+    with path.open("rb") as fh:
         try:
-            original = path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            # If a file is not valid UTF-8, leave it alone rather than risking corruption.
-            continue
-
-        fixed, counts = fix_text(original)
-        if fixed == original:
-            continue
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped (and need no fixing).
+            return False
+        with mm:
+            for lead, needles in _CANDIDATES_BY_LEAD.items():
+                start = mm.find(lead)
+                if start != -1 and any(mm.find(needle, start) != -1 for needle in needles):
+                    return True
+            return False
+
+
+def _add_counts(total: Dict[str, int], counts: Dict[str, int]) -> None:
+    for k, v in counts.items():
+        total[k] = total.get(k, 0) + v
+
+
+def _fix_whole(path: Path, apply: bool) -> Optional[Dict[str, int]]:
+    try:
+        original = path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        # If a file is not valid UTF-8, leave it alone rather than risking corruption.
+        return None
+
+    fixed, counts = fix_text(original)
+    if fixed == original:
+        return None
+    if apply:
+        path.write_text(fixed, encoding="utf-8")
+    return counts
+
+
+def _fix_chunked(path: Path, apply: bool) -> Optional[Dict[str, int]]:
+    """Fix a large file a block of whole lines at a time, writing through a temp file when applying."""
+    total: Dict[str, int] = {}
+    changed = False
+    tmp: Optional[Path] = None
+    try:
+        with path.open("r", encoding="utf-8") as src:
+            out = None
+            if apply:
+                fd, name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+                tmp = Path(name)
+                out = os.fdopen(fd, "w", encoding="utf-8")
+            try:
+                pending = ""
+                while True:
+                    block = src.read(CHUNK_CHARS)
+                    pending += block
+                    if block:
+                        cut = pending.rfind("\n") + 1
+                        if not cut:
+                            continue
+                        head, pending = pending[:cut], pending[cut:]
+                    else:
+                        head, pending = pending, ""
+
+                    fixed, counts = fix_text(head)
+                    if fixed != head:
+                        changed = True
+                        _add_counts(total, counts)
+                    if out is not None:
+                        out.write(fixed)
+                    if not block:
+                        break
+            finally:
+                if out is not None:
+                    out.close()
+    except UnicodeDecodeError:
+        if tmp is not None:
+            tmp.unlink()
+        return None
+
+    if tmp is not None:
+        if changed:
+            shutil.copymode(path, tmp)
+            os.replace(tmp, path)
+        else:
+            tmp.unlink()
+    return total if changed else None
+
+
+def _fix_file(task: Tuple[Path, bool]) -> Optional[Dict[str, int]]:
+    """Return the replacement counts for one file, or None if it needs no change."""
+    path, apply = task
+    if not _has_candidate(path):
+        return None
+    if path.stat().st_size > CHUNK_THRESHOLD:
+        return _fix_chunked(path, apply)
+    return _fix_whole(path, apply)
+
+
+Mapper = Callable[..., Iterable[Optional[Dict[str, int]]]]
+
+
+def run(root: Path, apply: bool, jobs: int = 1) -> int:
+    tasks = [(path, apply) for path in _iter_files(root)]
+
+    if jobs == 1:
+        results = _collect(tasks, map)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = _collect(
+                tasks, lambda fn, items: pool.map(fn, items, chunksize=max(1, len(items) // (jobs * 4)))
+            )
 
+    touched = 0
+    total_replacements: Dict[str, int] = {}
+    for counts in results:
         touched += 1
-        for k, v in counts.items():
-            total_replacements[k] = total_replacements.get(k, 0) + v
-
-        if apply:
-            path.write_text(fixed, encoding="utf-8")
+        _add_counts(total_replacements, counts)
 
     print(f"Files changed: {touched}")
     if total_replacements:
@@ -120,6 +274,10 @@ def run(root: Path, apply: bool) -> int:
     return 0
 
 
+def _collect(tasks: List[Tuple[Path, bool]], mapper: Mapper) -> List[Dict[str, int]]:
+    return [counts for counts in mapper(_fix_file, tasks) if counts is not None]
+
+
 def main(argv: List[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description=(
@@ -137,6 +295,12 @@ def main(argv: List[str] | None = None) -> int:
         action="store_true",
         help="Report changes without modifying files",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes (default: 1; 0 = one per CPU)",
+    )
 
     args = parser.parse_args(argv)
     root = (REPO_ROOT / args.root).resolve()
@@ -144,7 +308,8 @@ def main(argv: List[str] | None = None) -> int:
         print(f"Root not found: {root}")
         return 2
 
-    return run(root=root, apply=not args.check)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    return run(root=root, apply=not args.check, jobs=jobs)
 
 
 if __name__ == "__main__":
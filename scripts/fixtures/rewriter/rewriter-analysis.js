@@ -0,0 +1,116 @@
+// Regression corpus for convert_people_to_static.py --verify-rewriter: every block must convert
+// identically through _rewrite_fragment and the multi-pass _jsx_to_html + _postprocess_analysis_html.
+export default function Analysis({id}) {
+  if (id === "rewriter-class-and-style") {
+    return (
+      <div className="analysis"><p className="quote" style={{marginLeft: "5%", fontStyle: 'italic', lineHeight: 1.4}}>Alma taught the people.</p></div>
+    );
+  }
+  if (id === "rewriter-require-src") {
+    return (
+      <div className="analysis"><p>Text <img src={require("./Images/alma.jpg")} alt="Alma"/> and <img src={require('./Images/nephi.jpg')}/></p></div>
+    );
+  }
+  if (id === "rewriter-comments-and-spacers") {
+    return (
+      <div className="analysis"><p>One{' '}two{' '}  spaced{/* a comment */}three{/* multi
+   line */} four<br/>five</p></div>
+    );
+  }
+  if (id === "rewriter-mojibake") {
+    return (
+      <div className="analysis"><p>Benjamin�s people said �Amen� to the king�s words.</p></div>
+    );
+  }
+  if (id === "rewriter-mojibake-in-attrs") {
+    return (
+      <div className="analysis"><p style={{fontFamily: "Nephi�s"}}>x<img src={require("./Images/king�s.jpg")}/></p><p marginLeft='5�x'>y</p></div>
+    );
+  }
+  if (id === "rewriter-margin-colon") {
+    return (
+      <div className="analysis"><p>Intro</p><p margin-left: 5%>Quoted</p><div left-margin: 2em;>Block</div><span marginLeft : 3px>s</span></div>
+    );
+  }
+  if (id === "rewriter-margin-attr") {
+    return (
+      <div className="analysis"><p marginLeft='5%'>a</p><div marginleft="2em">b</div><P MARGINLEFT="1em;">c</P></div>
+    );
+  }
+  if (id === "rewriter-margin-other-side") {
+    return (
+      <div className="analysis"><p margin-right: 5%>not indented</p><p>z</p></div>
+    );
+  }
+  if (id === "rewriter-key-insights") {
+    return (
+      <div className="analysis"><p>Story text. <b>Key Insights</b><br><br>Apply it daily.</p></div>
+    );
+  }
+  if (id === "rewriter-key-insights-variants") {
+    return (
+      <div className="analysis"><p>A  <b> key   insights </b> <br/> <br/>B</p><p>C <B>KEY INSIGHTS</B><br><br><br><br><br>D</p></div>
+    );
+  }
+  if (id === "rewriter-key-insights-comments") {
+    return (
+      <div className="analysis"><p>A {/* x */} <b>Key{' '}Insights</b>{/* y */}<br>{' '}<br>B</p></div>
+    );
+  }
+  if (id === "rewriter-key-insights-first") {
+    return (
+      <div className="analysis"><b>Key Insights</b><br><br>Only the application.</div>
+    );
+  }
+  if (id === "rewriter-key-insights-no-br") {
+    return (
+      <div className="analysis"><p>A <b>Key Insights</b> B</p></div>
+    );
+  }
+  if (id === "rewriter-did-you-know") {
+    return (
+      <div className="analysis"><p>Keep this.</p><p>Did you know that Nephi built a ship?</p><h4 class="x">Did you know?</h4><p><i>Did you know</i> this too</p><p>Did you knowledge</p></div>
+    );
+  }
+  if (id === "rewriter-did-you-know-after-insights") {
+    return (
+      <div className="analysis"><p>Intro <b>Key Insights</b><br><br>Did you know the end?</p></div>
+    );
+  }
+  if (id === "rewriter-outer-p-unwrap") {
+    return (
+      <div className="analysis"><p>Outer text<p style={{marginLeft: "5%"}}>Inner quote</p>more</p></div>
+    );
+  }
+  if (id === "rewriter-outer-p-kept") {
+    return (
+      <div className="analysis"><p>Just one paragraph with <b>bold</b>.</p></div>
+    );
+  }
+  if (id === "rewriter-no-paragraphs") {
+    return (
+      <div className="analysis">Plain text only<br/>with a break</div>
+    );
+  }
+  if (id === "rewriter-empty-paragraphs") {
+    return (
+      <div className="analysis"><p> </p><p><p>Text</p></p><p>
+</p></div>
+    );
+  }
+  if (id === "rewriter-nested-braces") {
+    return (
+      <div className="analysis"><p style={{}}>e</p><p>{'{'} literal {'}'}</p></div>
+    );
+  }
+  if (id === "rewriter-chronology") {
+    return (
+      <div className="analysis"><p><strong>600 B.C.</strong> Lehi leaves Jerusalem.<br/>circa A.D. 34 Christ appears.</p></div>
+    );
+  }
+  if (id === "rewriter-table") {
+    return (
+      <div className="analysis"><table className="t"><tbody><tr><td style={{textAlign: "center"}}>1</td></tr></tbody></table></div>
+    );
+  }
+}
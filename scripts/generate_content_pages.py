@@ -3,18 +3,81 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import html
 import json
 import os
+import posixpath
 import re
+import shutil
+import tempfile
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from asset_store import load_aliases
+from build_image_derivatives import COLLECTIONS, derived_name, image_size, load_manifest, mime_type
+from content_fragments import Fragment, FragmentCache
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SRC_ROOT = REPO_ROOT / "docs"
 
+# Bump whenever the emitted markup changes so incremental builds re-render every page.
+TEMPLATE_VERSION = "4"
+MANIFEST_NAME = ".pages-manifest.json"
+
+# --fingerprint: content-hashed copies of the site's static assets, mapped in <src-root>/manifest.json.
+ASSET_MANIFEST_NAME = "manifest.json"
+ASSET_GLOBS = ("favicon.ico", "css/*.css", "js/*.js", "img/*", "content/**/*")
+IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp", ".avif", ".ico")
+_FINGERPRINTED_RE = re.compile(r"\.[0-9a-f]{10}\.[^./]+$")
+_CSS_URL_RE = re.compile(r"url\((['\"]?)([^'\")]+)\1\)")
+
+# Client-side search (js/search.js): item list + name index, and a full-text index loaded on demand.
+SEARCH_INDEX_NAME = "search-index.json"
+SEARCH_TEXT_NAME = "search-text.json"
+SEARCH_KINDS = ("people", "concepts", "influences")
+SEARCH_MIN_TEXT_TOKEN = 3
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Explore by Person (js/explore-by-person.js): one small JSON per person with the avatar, bio and the
+# widgets that have data for them, instead of the whole details JSON plus image/widget probing.
+PERSON_DATA_DIR = "data/people"
+PERSON_WIDGETS_SOURCE = "content/person-widgets.json"  # person slug -> widget speaker ids
+EXPLORE_WIDGETS = ("bubbles", "topic", "timeline", "conversation", "connections")
+WIDGETS_DIR = "widgets/Widgets"
+AVATAR_WIDTH = 160  # .explore-person-avatar is 44px square
+
+# Parsed fragments, by content hash (content_fragments.py); _generate points this at the disk cache.
+FRAGMENT_CACHE = REPO_ROOT / ".cache" / "fragments"
+_fragments = FragmentCache()
+_CHRONOLOGY_HEADING_RE = re.compile(r"\bchronology\b", re.IGNORECASE)
+
+# Shared chrome inlined into every page (main.js only fetches it for pages that were not built).
+CHROME_FILES = ("header.html", "footer.html")
+HAND_AUTHORED_GLOBS = ("*.html", "explore-by-person/*.html", "explore-by-tool/*.html", "similar-verse-finder/*.html")
+_ROOT_LINK_RE = re.compile(r"<a\b[^>]*\bdata-root-href=\"([^\"]*)\"[^>]*>")
+_HREF_ATTR_RE = re.compile(r"(?<![-\w])href=\"[^\"]*\"")
+_DATA_ROOT_RE = re.compile(r"<html\b[^>]*\bdata-root=\"([^\"]*)\"")
+
+# Critical CSS: the rules of these stylesheets that match a page's markup are inlined into its <head>,
+# and the stylesheets themselves load without blocking the first paint.
+STYLESHEETS = ("css/main.css", "css/icons.css")
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_SELECTOR_NOISE_RE = re.compile(r"\[[^\]]*\]|::?[\w-]+(?:\([^)]*\))?")
+_SELECTOR_NAME_RE = re.compile(r"([.#])([\w-]+)")
+_SELECTOR_TAG_RE = re.compile(r"(?:^|[\s>+~])([a-zA-Z][\w-]*)")
+_MARKUP_TAG_RE = re.compile(r"<([a-zA-Z][\w-]*)")
+_MARKUP_ATTR_RE = re.compile(r"\s(class|id)=\"([^\"]*)\"")
+
+# People grid: three columns of a 62rem page (two below 340px).
+THUMB_SIZES = "(min-width: 62rem) 19rem, (max-width: 340px) 45vw, 30vw"
+THUMB_MAX_WIDTH = 480
+
 
 @dataclass(frozen=True)
 class Section:
@@ -46,6 +109,89 @@ class Item:
     details_path: Path
 
 
+@dataclass(frozen=True, slots=True)
+class IndexEntry:
+    """What the index pages, search indexes and person data need of an item once its page is written."""
+
+    kind: str
+    item_id: str
+    display_name: str
+    year: str
+    description: str
+    image: str
+    details_path: Path
+    order: int = 0  # position in _iter_details order; breaks ties between equal names
+
+    @classmethod
+    def of(cls, item: Item, order: int = 0) -> IndexEntry:
+        return cls(
+            kind=item.kind,
+            item_id=item.item_id,
+            display_name=item.display_name,
+            year=item.year,
+            description=item.description,
+            image=item.image,
+            details_path=item.details_path,
+            order=order,
+        )
+
+
+class TermSpill:
+    """Items' full-text search tokens, kept in a temporary file until the search indexes are written.
+
+    They are the bulk of what the index phase needs of an item, so the parent holds only offsets.
+    """
+
+    def __init__(self) -> None:
+        self._file = tempfile.TemporaryFile()
+        self._offsets: Dict[Tuple[str, int], int] = {}
+
+    def add(self, entry: IndexEntry, terms: Tuple[str, ...]) -> None:
+        self._file.seek(0, os.SEEK_END)
+        self._offsets[(entry.kind, entry.order)] = self._file.tell()
+        self._file.write(json.dumps(terms, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    def get(self, entry: IndexEntry) -> List[str]:
+        self._file.seek(self._offsets[(entry.kind, entry.order)])
+        return json.loads(self._file.readline())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+@dataclass(frozen=True)
+class Chrome:
+    header: str  # contents of docs/header.html
+    footer: str  # contents of docs/footer.html
+
+
+@dataclass(frozen=True)
+class CssRule:
+    media: str  # enclosing @media prelude, or ""
+    selectors: Tuple[str, ...]  # empty for at-rules, which are always kept
+    body: str  # minified declarations (the whole block for at-rules)
+
+
+@dataclass(frozen=True)
+class Stylesheets:
+    rules: Tuple[CssRule, ...]  # every rule of STYLESHEETS, in cascade order, url()s relative to the site root
+    digest: str
+
+
+@dataclass(frozen=True)
+class ExploreWidgets:
+    ids: Dict[str, Dict[str, str]]  # person slug -> {widget key or "avatar": speaker id}
+    speakers: Dict[str, FrozenSet[str]]  # widget key -> speaker ids the widget has data for
+
+
+@dataclass(frozen=True)
+class Picture:
+    src: str
+    width: int  # 0 = unknown
+    height: int
+    srcsets: Tuple[Tuple[str, str], ...]  # (MIME type, srcset) per derived format, fallback format last
+
+
 def _read_json(path: Path) -> Dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
@@ -54,6 +200,11 @@ def _write_text(path: Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
 
+def _write_parts(path: Path, parts: Iterable[str]) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        f.writelines(parts)
+
+
 def _safe_filename(s: str) -> str:
     # ids in this repo are already slug-like, but keep it defensive.
     s = s.strip().lower()
@@ -62,62 +213,197 @@ def _safe_filename(s: str) -> str:
     return s or "item"
 
 
-def _doc(title: str, body_html: str, scripts_html: str = "", *, asset_prefix: str, root_prefix: str) -> str:
-    return (
+def load_chrome(src_root: Path) -> Optional[Chrome]:
+    try:
+        header, footer = ((src_root / name).read_text(encoding="utf-8") for name in CHROME_FILES)
+    except OSError:
+        return None
+    return Chrome(header=header, footer=footer)
+
+
+def _chrome_element(tag: str, fragment: str, root_prefix: str, indent: str) -> str:
+    """`<tag>fragment</tag>` with `data-root-href` links resolved the way main.js would."""
+
+    def _repl(match: re.Match[str]) -> str:
+        href = f"href=\"{html.escape(root_prefix + match.group(1))}\""
+        return _HREF_ATTR_RE.sub(lambda _: href, match.group(0), count=1)
+
+    lines = _ROOT_LINK_RE.sub(_repl, fragment).rstrip("\n").split("\n")
+    body = "\n".join(f"{indent}  {line}" if line.strip() else "" for line in lines)
+    return f"<{tag}>\n{body}\n{indent}</{tag}>"
+
+
+def _inline_chrome(page: str, chrome: Chrome) -> str:
+    """Replace the contents of a page's first <header> and <footer> with the shared chrome."""
+    m = _DATA_ROOT_RE.search(page)
+    root_prefix = html.unescape(m.group(1)) if m else ""
+    for tag, fragment in (("header", chrome.header), ("footer", chrome.footer)):
+        pattern = re.compile(rf"^([ \t]*)<{tag}\b[^>]*>.*?</{tag}>", re.DOTALL | re.MULTILINE)
+        page = pattern.sub(
+            lambda mm: mm.group(1) + _chrome_element(tag, fragment, root_prefix, mm.group(1)), page, count=1
+        )
+    return page
+
+
+def _minify_declarations(block: str) -> str:
+    decls = (d.partition(":") for d in block.split(";") if d.strip())
+    return ";".join(f"{prop.strip()}:{' '.join(value.split())}" for prop, _, value in decls)
+
+
+def _parse_css(css: str, media: str = "") -> List[CssRule]:
+    css = _CSS_COMMENT_RE.sub("", css)
+    rules: List[CssRule] = []
+    pos = 0
+    while (start := css.find("{", pos)) != -1:
+        prelude = " ".join(css[pos:start].split())
+        depth, end = 1, start + 1
+        while depth and end < len(css):
+            depth += {"{": 1, "}": -1}.get(css[end], 0)
+            end += 1
+        block = css[start + 1 : end - 1]
+        pos = end
+        if prelude.startswith("@media"):
+            rules.extend(_parse_css(block, prelude))
+        elif prelude.startswith("@"):
+            rules.append(CssRule(media, (), f"{prelude}{{{' '.join(block.split())}}}"))
+        else:
+            selectors = tuple(s.strip() for s in prelude.split(","))
+            rules.append(CssRule(media, selectors, _minify_declarations(block)))
+    return rules
+
+
+def load_stylesheets(src_root: Path) -> Optional[Stylesheets]:
+    try:
+        texts = [(src_root / rel).read_text(encoding="utf-8") for rel in STYLESHEETS]
+    except OSError:
+        return None
+    rules = tuple(
+        rule
+        for rel, text in zip(STYLESHEETS, texts)
+        for rule in _parse_css(_map_css_urls(text, posixpath.dirname(rel), lambda target: target))
+    )
+    return Stylesheets(rules=rules, digest=_content_hash("\0".join(texts)))
+
+
+def _selector_used(selector: str, tags: Set[str], classes: Set[str], ids: Set[str]) -> bool:
+    """Whether every tag, class and id in `selector` occurs in the page (states and attributes are ignored)."""
+    s = _SELECTOR_NOISE_RE.sub("", selector)
+    for prefix, name in _SELECTOR_NAME_RE.findall(s):
+        if name not in (classes if prefix == "." else ids):
+            return False
+    return all(tag.lower() in tags for tag in _SELECTOR_TAG_RE.findall(s))
+
+
+def _critical_css(markup: List[str], styles: Stylesheets) -> str:
+    """The rules of `styles` that can apply to `markup` (a page split at tag boundaries), minified, in order."""
+    tags = {"html"}
+    classes: Set[str] = set()
+    ids: Set[str] = set()
+    for part in markup:
+        tags.update(t.lower() for t in _MARKUP_TAG_RE.findall(part))
+        for attr, value in _MARKUP_ATTR_RE.findall(part):
+            (classes if attr == "class" else ids).update(value.split())
+
+    out: List[str] = []
+    media = ""
+    for rule in styles.rules:
+        if rule.selectors:
+            selectors = [s for s in rule.selectors if _selector_used(s, tags, classes, ids)]
+            if not selectors:
+                continue
+            text = f"{','.join(selectors)}{{{rule.body}}}"
+        else:
+            text = rule.body
+        if rule.media != media:
+            if media:
+                out.append("}")
+            if rule.media:
+                out.append(f"{rule.media}{{")
+            media = rule.media
+        out.append(text)
+    if media:
+        out.append("}")
+    return "".join(out)
+
+
+def _doc(title: str, body_html: str, scripts_html: str = "", **kwargs: Any) -> str:
+    return "".join(_doc_parts(title, body_html, scripts_html, **kwargs))
+
+
+def _doc_parts(
+    title: str,
+    body_html: str,
+    scripts_html: str = "",
+    *,
+    asset_prefix: str,
+    root_prefix: str,
+    assets: Optional[Dict[str, str]] = None,
+    chrome: Optional[Chrome] = None,
+    styles: Optional[Stylesheets] = None,
+) -> List[str]:
+    """The page as consecutive strings; `body_html` is one of them, so large bodies are never copied."""
+    assets_map = assets or {}
+
+    def href(rel: str) -> str:
+        return html.escape(asset_prefix + assets_map.get(rel, rel))
+
+    header_html, footer_html = "<header></header>", "<footer></footer>"
+    if chrome is not None:
+        header_html = _chrome_element("header", chrome.header, root_prefix, "  ")
+        footer_html = _chrome_element("footer", chrome.footer, root_prefix, "  ")
+
+    body = [
+        "<body>\n"
+        "  <!-- GENERATED FILE: re-run scripts/generate_content_pages.py -->\n"
+        f"  {header_html}\n"
+        "  ",
+        body_html,
+        "\n"
+        f"  {footer_html}\n"
+        f"  <script src=\"{href('js/main.js')}\"></script>\n"
+        f"  {scripts_html}\n"
+        "</body>\n",
+    ]
+
+    links = [f"<link rel=\"stylesheet\" href=\"{href(rel)}\">" for rel in STYLESHEETS]
+    if styles is None:
+        stylesheets_html = "".join(f"  {link}\n" for link in links)
+    else:
+        # Paint from the inlined rules; the full stylesheets apply once loaded (print media doesn't block).
+        deferred = "".join(f"  {link[:-1]} media=\"print\" onload=\"this.media='all'\">\n" for link in links)
+        critical = _critical_css(body, styles)
+        critical = _map_css_urls(critical, "", lambda target: asset_prefix + assets_map.get(target, target))
+        stylesheets_html = (
+            f"  <style>{critical}</style>\n{deferred}  <noscript>{''.join(links)}</noscript>\n"
+        )
+
+    head = (
         "<!DOCTYPE html>\n"
         f"<html lang=\"en\" data-root=\"{html.escape(root_prefix)}\">\n"
         "<head>\n"
         "  <meta charset=\"UTF-8\">\n"
         "  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">\n"
         f"  <title>{html.escape(title)}</title>\n"
-        f"  <link rel=\"icon\" href=\"{html.escape(asset_prefix)}favicon.ico\">\n"
-        f"  <link rel=\"stylesheet\" href=\"{html.escape(asset_prefix)}css/main.css\">\n"
-        "  <link rel=\"stylesheet\" href=\"https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css\">\n"
+        f"  <link rel=\"icon\" href=\"{href('favicon.ico')}\">\n"
+        f"{stylesheets_html}"
         "</head>\n"
-        "<body>\n"
-        "  <!-- GENERATED FILE: re-run scripts/generate_content_pages.py -->\n"
-        "  <header></header>\n"
-        f"  {body_html}\n"
-        "  <footer></footer>\n"
-        f"  <script src=\"{html.escape(asset_prefix)}js/main.js\"></script>\n"
-        f"  {scripts_html}\n"
-        "</body>\n"
-        "</html>\n"
     )
+    return [head, *body, "</html>\n"]
 
 
-def _load_fragment(path: Path) -> str:
-    if not path.exists():
-        return ""
-    fragment = path.read_text(encoding="utf-8")
-    return _ensure_content_table_class(fragment)
-
-
-def _ensure_content_table_class(fragment: str) -> str:
-    if not fragment:
-        return fragment
-
-    def _repl(match: re.Match[str]) -> str:
-        attrs = match.group(1) or ""
-        class_match = re.search(r"\bclass\s*=\s*(['\"])(.*?)\1", attrs, flags=re.IGNORECASE)
-        if class_match:
-            existing = class_match.group(2)
-            if re.search(r"(?:^|\s)content-table(?:\s|$)", existing):
-                return f"<table{attrs}>"
-            new_classes = f"{existing} content-table"
-            new_attrs = attrs[: class_match.start()] + f' class="{new_classes}"' + attrs[class_match.end() :]
-            return f"<table{new_attrs}>"
-        return f"<table class=\"content-table\"{attrs}>"
-
-    return re.sub(r"<table([^>]*)>", _repl, fragment, flags=re.IGNORECASE)
+def _fragment(path: Path) -> Fragment:
+    """The parsed fragment at `path` (see content_fragments.py); empty if it is missing."""
+    return _fragments.get(path)
 
 
-def _resolve_asset_ref(details_path: Path, output_dir: Path, ref: str) -> str:
+def _resolve_asset_ref(
+    details_path: Path, output_dir: Path, ref: str, assets: Optional[Dict[str, str]] = None
+) -> str:
     """Resolve an asset path stored in details JSON into a link relative to the output HTML.
 
     Details JSONs store local assets as './main.jpg' (relative to the details folder).
     Generated HTML pages live in docs/{people,concepts,influences}/, so we must rewrite these to e.g.
-    '../content/people/<id>/main.jpg'.
+    '../content/people/<id>/main.jpg'. Paths found in `assets` link to their fingerprinted or canonical copy.
     """
 
     ref = (ref or "").strip()
@@ -127,21 +413,87 @@ def _resolve_asset_ref(details_path: Path, output_dir: Path, ref: str) -> str:
         return ref
 
     # If already rooted at docs/ (e.g., 'img/...', 'content/...'), translate to a relative path.
-    for prefix in ("content/", "img/", "css/", "js/"):
-        if ref.startswith(prefix):
-            # output_dir is typically docs/{people,concepts,influences}/
-            abs_target = (output_dir.parent / ref).resolve()
-            rel = os.path.relpath(abs_target, output_dir.resolve())
-            return rel.replace(os.sep, "/")
-
-    # Treat as relative to details folder.
-    if ref.startswith("./"):
-        ref = ref[2:]
-    abs_target = (details_path.parent / ref).resolve()
+    if ref.startswith(("content/", "img/", "css/", "js/")):
+        # output_dir is typically docs/{people,concepts,influences}/
+        abs_target = (output_dir.parent / ref).resolve()
+    else:
+        # Treat as relative to details folder.
+        if ref.startswith("./"):
+            ref = ref[2:]
+        abs_target = (details_path.parent / ref).resolve()
+
+    if assets:
+        site_rel = os.path.relpath(abs_target, output_dir.parent.resolve()).replace(os.sep, "/")
+        if site_rel in assets:
+            abs_target = output_dir.parent.resolve() / assets[site_rel]
     rel = os.path.relpath(abs_target, output_dir.resolve())
     return rel.replace(os.sep, "/")
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_derived_manifest(out_dir: Path, mtime_ns: int) -> Dict[str, Dict[str, Any]]:
+    return load_manifest(out_dir)
+
+
+def _derived_manifest(out_dir: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        mtime_ns = (out_dir / "manifest.json").stat().st_mtime_ns
+    except OSError:
+        return {}
+    return _cached_derived_manifest(out_dir, mtime_ns)
+
+
+def _person_picture(
+    details_path: Path, output_dir: Path, ref: str, *, max_width: int = 0, assets: Optional[Dict[str, str]] = None
+) -> Optional[Picture]:
+    """Resolve a person's image plus its size and derived srcsets (see build_image_derivatives.py).
+
+    Derivatives are looked up in <src-root>/img/derived/people/manifest.json by the image's path
+    relative to the people data root; images without an entry keep their original file only.
+    `max_width` (if set) leaves wider derivatives out of the srcsets.
+    """
+    original = _resolve_asset_ref(details_path, output_dir, ref)
+    if not original:
+        return None
+    src = _resolve_asset_ref(details_path, output_dir, ref, assets)
+    if src.startswith("http://") or src.startswith("https://"):
+        return Picture(src=src, width=0, height=0, srcsets=())
+
+    image_path = (output_dir / original).resolve()
+    out_dir = output_dir.parent / COLLECTIONS["people"].out
+    key = os.path.relpath(image_path, details_path.parent.parent.resolve()).replace(os.sep, "/")
+    entry = _derived_manifest(out_dir).get(key)
+    if entry is None:
+        width, height = image_size(image_path) or (0, 0)
+        return Picture(src=src, width=width, height=height, srcsets=())
+
+    base = os.path.relpath(out_dir, output_dir).replace(os.sep, "/")
+    widths = [w for w in entry["widths"] if not max_width or w <= max_width] or entry["widths"][:1]
+    srcsets = tuple(
+        (mime_type(fmt), ", ".join(f"{base}/{derived_name(entry['hash'], w, fmt)} {w}w" for w in widths))
+        for fmt in entry["formats"]
+    )
+    return Picture(src=src, width=entry["width"], height=entry["height"], srcsets=srcsets)
+
+
+def _picture_html(pic: Picture, *, attrs: str, sizes: str) -> str:
+    """`<img>` with width/height and a srcset, wrapped in `<picture>` when modern formats exist.
+
+    `attrs` is the rest of the img's attributes, e.g. class, alt and loading.
+    """
+    size_attrs = f" width=\"{pic.width}\" height=\"{pic.height}\"" if pic.width and pic.height else ""
+    if not pic.srcsets:
+        return f"<img src=\"{html.escape(pic.src)}\"{size_attrs} {attrs}>"
+    *modern, (_, fallback) = pic.srcsets
+    sources = "".join(
+        f"<source type=\"{mime}\" srcset=\"{html.escape(srcset)}\" sizes=\"{sizes}\">" for mime, srcset in modern
+    )
+    img = (
+        f"<img src=\"{html.escape(pic.src)}\" srcset=\"{html.escape(fallback)}\" sizes=\"{sizes}\"{size_attrs} {attrs}>"
+    )
+    return f"<picture>{sources}{img}</picture>" if sources else img
+
+
 def _iter_details(kind: str, root: Path) -> Iterable[Path]:
     if kind == "people":
         yield from sorted(root.glob("*/person-details.json"))
@@ -222,16 +574,8 @@ def _starts_with_did_you_know(text: str) -> bool:
     return bool(re.match(r"^\s*Did you know\b", text.strip(), flags=re.IGNORECASE))
 
 
-def _is_chronology_section(heading: str, fragment: str) -> bool:
-    if re.search(r"\bchronology\b", heading or "", flags=re.IGNORECASE):
-        return True
-
-    chrono_re = re.compile(
-        r"(?:^|<p[^>]*>\s*|<br\s*/?>\s*|<strong>\s*|<b>\s*)\s*(?:circa\s+)?"
-        r"(?:\d{1,4}\s*(?:B\.?C\.?|A\.?D\.?)|(?:B\.?C\.?|A\.?D\.?)\s*\d{1,4})",
-        flags=re.IGNORECASE,
-    )
-    return bool(chrono_re.search(fragment or ""))
+def _is_chronology_section(heading: str, fragment: Fragment) -> bool:
+    return bool(_CHRONOLOGY_HEADING_RE.search(heading or "")) or fragment.chronology
 
 
 def _format_year_line(year: str) -> str:
@@ -260,11 +604,10 @@ def _hero(kind: str, title: str, subtitle: str) -> str:
     )
 
 
-def _people_index(items: List[Item], *, output_dir: Path) -> str:
+def _people_index(items: List[IndexEntry], *, output_dir: Path, assets: Optional[Dict[str, str]] = None) -> str:
     cards = []
     for it in items:
-        img_src_raw = _resolve_asset_ref(it.details_path, output_dir, it.image)
-        img_src = html.escape(img_src_raw) if img_src_raw else ""
+        pic = _person_picture(it.details_path, output_dir, it.image, max_width=THUMB_MAX_WIDTH, assets=assets)
         name = html.escape(it.display_name)
         name_key = (it.display_name or "").lower()
         href = _internal_href(f"{_safe_filename(it.item_id)}.html")
@@ -272,7 +615,15 @@ def _people_index(items: List[Item], *, output_dir: Path) -> str:
             "<a class=\"person-card\" href=\""
             + href
             + f"\" data-name=\"{html.escape(name_key)}\">"
-            + (f"<img class=\"person-thumb\" src=\"{img_src}\" alt=\"{name}\">" if img_src else "<div class=\"person-thumb person-thumb--empty\"></div>")
+            + (
+                _picture_html(
+                    pic,
+                    attrs=f"class=\"person-thumb\" alt=\"{name}\" loading=\"lazy\" decoding=\"async\"",
+                    sizes=THUMB_SIZES,
+                )
+                if pic
+                else "<div class=\"person-thumb person-thumb--empty\"></div>"
+            )
             + f"<div class=\"person-name\">{name}</div>"
             + "</a>"
         )
@@ -295,7 +646,7 @@ def _people_index(items: List[Item], *, output_dir: Path) -> str:
     )
 
 
-def _list_index(kind: str, title: str, subtitle: str, items: List[Item], *, enable_search: bool = False) -> str:
+def _list_index(kind: str, title: str, subtitle: str, items: List[IndexEntry], *, enable_search: bool = False) -> str:
     rows = []
     for it in items:
         href = _internal_href(f"{_safe_filename(it.item_id)}.html")
@@ -330,13 +681,16 @@ def _list_index(kind: str, title: str, subtitle: str, items: List[Item], *, enab
     )
 
 
-def _person_detail(item: Item, *, output_dir: Path) -> str:
+def _person_detail(item: Item, *, output_dir: Path, assets: Optional[Dict[str, str]] = None) -> str:
     name = html.escape(item.display_name)
-    hero_style = ""
+    hero_img = ""
     # People detail pages live in docs/people/
-    img_ref = _resolve_asset_ref(item.details_path, output_dir, item.image)
-    if img_ref:
-        hero_style = f" style=\"background-image: url('{html.escape(img_ref)}')\""
+    pic = _person_picture(item.details_path, output_dir, item.image, assets=assets)
+    if pic:
+        # The banner is the largest paint on the page: fetch it early, but decode off the main thread.
+        hero_img = _picture_html(
+            pic, attrs="class=\"detail-hero-img\" alt=\"\" decoding=\"async\" fetchpriority=\"high\"", sizes="100vw"
+        )
 
     chronology_blocks: List[str] = []
     panels: List[Tuple[str, str]] = []
@@ -350,19 +704,19 @@ def _person_detail(item: Item, *, output_dir: Path) -> str:
         ):
             inner.append(f"<p>{html.escape(page_desc)}</p>")
         for sec in page.sections:
-            fragment = _load_fragment(sec.html_fragment_path)
+            fragment = _fragment(sec.html_fragment_path)
 
             if _is_chronology_section(sec.heading, fragment):
-                if fragment:
-                    chronology_blocks.append(fragment)
+                if fragment.html:
+                    chronology_blocks.append(fragment.html)
                 continue
 
             if sec.heading.strip() and not _starts_with_did_you_know(sec.heading):
                 inner.append(
                     f"<p class=\"analysis-intro\"><em>{html.escape(sec.heading.strip())}</em></p>"
                 )
-            if fragment:
-                inner.append(fragment)
+            if fragment.html:
+                inner.append(fragment.html)
 
         page_title = (page.title or "Details").strip() or "Details"
         if page_title.strip().lower() == str(item.display_name or "").strip().lower():
@@ -399,7 +753,7 @@ def _person_detail(item: Item, *, output_dir: Path) -> str:
         )
 
     return (
-        f"<section class=\"detail-hero\"{hero_style}><div class=\"detail-hero-title\"><h1>{name}</h1></div></section>\n"
+        f"<section class=\"detail-hero\">{hero_img}<div class=\"detail-hero-title\"><h1>{name}</h1></div></section>\n"
         "<section class=\"page-content\">\n"
         "  <div class=\"detail-actions\"><a class=\"back-link\" href=\"index.html\" aria-label=\"Back to people\" title=\"Back to people\"><i class=\"fas fa-arrow-left\"></i></a></div>\n"
         + brief_html
@@ -429,7 +783,7 @@ def _concept_or_influence_detail(kind: str, item: Item) -> str:
         for sec in page.sections:
             if sec.heading.strip():
                 inner.append(f"<h3 class=\"subheading\">{html.escape(sec.heading.strip())}</h3>")
-            inner.append(_load_fragment(sec.html_fragment_path))
+            inner.append(_fragment(sec.html_fragment_path).html)
         panels.append((page.title or "Details", "".join(inner)))
 
     if len(panels) == 1:
@@ -450,16 +804,17 @@ def _concept_or_influence_detail(kind: str, item: Item) -> str:
     return "\n".join(body) + "\n"
 
 
-def _collect_items(kind: str, root: Path) -> List[Item]:
-    items: List[Item] = []
-    for details_path in _iter_details(kind, root):
-        try:
-            items.append(_parse_item(kind, details_path))
-        except Exception:
-            # Keep generator resilient: skip malformed entries.
-            continue
-    items.sort(key=lambda x: x.display_name.lower())
-    return items
+# A `map`-compatible callable: the builtin for serial runs, or a process pool's `map`.
+Mapper = Callable[..., Iterable[Any]]
+
+
+def _parse_item_or_none(task: Tuple[str, Path]) -> Optional[Item]:
+    kind, details_path = task
+    try:
+        return _parse_item(kind, details_path)
+    except Exception:
+        # Keep generator resilient: skip malformed entries.
+        return None
 
 
 def _remove_generated(src_root: Path) -> None:
@@ -479,11 +834,399 @@ def _remove_generated(src_root: Path) -> None:
                 pass
 
 
+def _load_manifest(src_root: Path) -> Optional[Dict[str, str]]:
+    """Return the previous build's {output path: input hash} map, or None if a full rebuild is needed."""
+    path = src_root / MANIFEST_NAME
+    try:
+        data = _read_json(path)
+    except Exception:
+        return None
+    if not isinstance(data, dict) or data.get("template_version") != TEMPLATE_VERSION:
+        return None
+    pages = data.get("pages")
+    if not isinstance(pages, dict):
+        return None
+    return {str(k): str(v) for k, v in pages.items()}
+
+
+def _save_manifest(src_root: Path, pages: Dict[str, str]) -> None:
+    data = {"template_version": TEMPLATE_VERSION, "pages": dict(sorted(pages.items()))}
+    _write_text(src_root / MANIFEST_NAME, json.dumps(data, indent=2) + "\n")
+
+
+def _hash_file(h: "hashlib._Hash", path: Path) -> None:
+    try:
+        data = path.read_bytes()
+    except OSError:
+        h.update(b"\0missing")
+        return
+    h.update(len(data).to_bytes(8, "little"))
+    h.update(data)
+
+
+def _item_inputs_hash(
+    item: Item,
+    output_path: Path,
+    assets: Optional[Dict[str, str]] = None,
+    chrome: Optional[Chrome] = None,
+    styles: Optional[Stylesheets] = None,
+) -> str:
+    """Hash everything a detail page depends on: details JSON, fragments, assets, chrome, stylesheets, template version and location."""
+    h = hashlib.sha256()
+    h.update(f"{TEMPLATE_VERSION}\0{item.kind}\0".encode("utf-8"))
+    h.update(json.dumps(assets or {}, sort_keys=True).encode("utf-8"))
+    h.update(repr(chrome).encode("utf-8"))
+    h.update(styles.digest.encode("utf-8") if styles is not None else b"\0")
+    # Asset refs are resolved relative to the output page, so moving either side invalidates it.
+    h.update(os.path.relpath(item.details_path.parent, output_path.parent).encode("utf-8"))
+    _hash_file(h, item.details_path)
+    if item.kind == "people":
+        # Image size and derivatives come from the image header and the derived-image manifest.
+        h.update(repr(_person_picture(item.details_path, output_path.parent, item.image, assets=assets)).encode("utf-8"))
+    for page in item.pages:
+        for sec in page.sections:
+            h.update(b"\0" + str(sec.html_fragment_path).encode("utf-8"))
+            _hash_file(h, sec.html_fragment_path)
+    return h.hexdigest()
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _tokenize(text: str) -> List[str]:
+    """Lower-case, accent-stripped alphanumeric runs; `tokenize` in js/search.js must match."""
+    text = unicodedata.normalize("NFKD", text.lower())
+    return _TOKEN_RE.findall("".join(c for c in text if not unicodedata.combining(c)))
+
+
+def _inverted_index(docs: Iterable[Iterable[str]]) -> Dict[str, Any]:
+    """{"terms": sorted terms, "postings": ascending item numbers per term} for per-item token lists."""
+    postings: Dict[str, List[int]] = {}
+    for i, tokens in enumerate(docs):
+        for term in set(tokens):
+            postings.setdefault(term, []).append(i)
+    terms = sorted(postings)
+    return {"terms": terms, "postings": [postings[t] for t in terms]}
+
+
+def _search_terms(item: Item) -> Tuple[str, ...]:
+    """Full-text tokens of an item (at least SEARCH_MIN_TEXT_TOKEN characters), for search-text.json."""
+    tokens = _tokenize(item.description)
+    for page in item.pages:
+        tokens.extend(_tokenize(page.description))
+        for sec in page.sections:
+            tokens.extend(_tokenize(sec.heading))
+            tokens.extend(_tokenize(_fragment(sec.html_fragment_path).text))
+    return tuple(sorted({t for t in tokens if len(t) >= SEARCH_MIN_TEXT_TOKEN}))
+
+
+def _search_indexes(
+    groups: List[Tuple[str, List[IndexEntry]]], terms: Callable[[IndexEntry], Iterable[str]]
+) -> Tuple[str, str]:
+    """Return (search-index.json, search-text.json) for the index pages' items; `terms` gives an item's tokens.
+
+    The first is small enough for the home page picker: item kind/slug/name/year plus an inverted
+    index of name tokens. The second maps description and fragment tokens (at least
+    SEARCH_MIN_TEXT_TOKEN characters) to the same item numbers and carries the descriptions.
+    Clients look terms up by prefix with a binary search over the sorted terms.
+    """
+    entries: List[Tuple[str, str, IndexEntry]] = []
+    for kind, items in groups:
+        entries.extend((kind, fname[: -len(".html")], it) for fname, it in _unique_outputs(items))
+
+    index = {
+        "version": 1,
+        "kinds": list(SEARCH_KINDS),
+        "items": {
+            "kind": [SEARCH_KINDS.index(kind) for kind, _, _ in entries],
+            "slug": [slug for _, slug, _ in entries],
+            "name": [it.display_name for _, _, it in entries],
+            "year": [it.year for _, _, it in entries],
+        },
+        "names": _inverted_index([_tokenize(it.display_name) for _, _, it in entries]),
+    }
+    text = {
+        "version": 1,
+        "description": [it.description for _, _, it in entries],
+        **_inverted_index(terms(it) for _, _, it in entries),
+    }
+    return tuple(json.dumps(data, ensure_ascii=False, separators=(",", ":")) for data in (index, text))
+
+
+def _read_json_or_empty(path: Path) -> Any:
+    try:
+        return _read_json(path)
+    except (OSError, ValueError):
+        return {}
+
+
+def load_explore_widgets(src_root: Path) -> Optional[ExploreWidgets]:
+    """Read PERSON_WIDGETS_SOURCE and the speakers each Explore widget has data for.
+
+    A widget has data for a speaker id (in the form its `?speaker=` parameter takes) when:
+    bubbles - a compiled payload or `json/json/<Speaker>/` folder exists (ids start lower-case);
+    timeline/connections - the speaker has events/relations in content/speakers.json;
+    conversation/topic - SocialNetwork/SpeakersNetwork `unpruned.json` has a node for them.
+    """
+    source = _read_json_or_empty(src_root / PERSON_WIDGETS_SOURCE)
+    if not isinstance(source, dict) or not isinstance(source.get("people"), dict):
+        return None
+    widgets = src_root / WIDGETS_DIR
+    bubbles = {p.stem for p in (widgets / "Bubbles" / "json" / "compiled").glob("*.json")}
+    bubbles.update(p.name[:1].lower() + p.name[1:] for p in (widgets / "Bubbles" / "json" / "json").glob("*/"))
+    speakers = _read_json_or_empty(src_root / "content" / "speakers.json").get("speakers", [])
+    social = _read_json_or_empty(widgets / "SocialNetwork" / "unpruned.json").get("nodes", [])
+    topic = _read_json_or_empty(widgets / "SpeakersNetwork" / "unpruned.json").get("nodes", [])
+    return ExploreWidgets(
+        ids=source["people"],
+        speakers={
+            "bubbles": frozenset(bubbles),
+            "topic": frozenset(n.get("Speaker") for n in topic),
+            "timeline": frozenset(s["name"] for s in speakers if "events" in s),
+            "conversation": frozenset(n.get("Name") for n in social),
+            "connections": frozenset(s["name"] for s in speakers if "relations" in s),
+        },
+    )
+
+
+def _person_avatar(
+    item: IndexEntry, src_root: Path, widget_avatar: str, assets: Optional[Dict[str, str]] = None
+) -> str:
+    """Site-relative URL of the smallest derivative of the person's image, else their widget portrait."""
+    people_dir = src_root / "people"
+    pic = _person_picture(item.details_path, people_dir, item.image, max_width=AVATAR_WIDTH, assets=assets)
+    if pic is not None and (pic.srcsets or pic.src.startswith(("http://", "https://"))):
+        url = pic.srcsets[-1][1].split(" ", 1)[0] if pic.srcsets else pic.src
+    elif pic is not None and (people_dir / pic.src).is_file():
+        url = pic.src
+    elif widget_avatar and (src_root / "widgets" / "Images" / f"{widget_avatar}.jpg").is_file():
+        return f"widgets/Images/{widget_avatar}.jpg"
+    else:
+        return ""
+    if url.startswith(("http://", "https://")):
+        return url
+    return posixpath.normpath(posixpath.join("people", url))
+
+
+def _person_data(
+    item: IndexEntry, slug: str, *, src_root: Path, explore: Optional[ExploreWidgets], assets: Optional[Dict[str, str]] = None
+) -> str:
+    """PERSON_DATA_DIR/<slug>.json: name, avatar URL, bio and {widget key: speaker id} for widgets with data."""
+    ids = explore.ids.get(slug, {}) if explore is not None else {}
+    widgets = {
+        key: ids[key] for key in EXPLORE_WIDGETS if key in ids and ids[key] in explore.speakers.get(key, frozenset())
+    }
+    data = {
+        "name": item.display_name,
+        "avatar": _person_avatar(item, src_root, ids.get("avatar", ""), assets),
+        "bio": item.description,
+        "widgets": widgets,
+    }
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def inline_hand_authored_chrome(src_root: Path, chrome: Chrome) -> int:
+    """Inline the chrome into the hand-authored pages (index, about, explore pages...); return pages rewritten."""
+    written = 0
+    for pattern in HAND_AUTHORED_GLOBS:
+        for path in sorted(src_root.glob(pattern)):
+            if path.name in CHROME_FILES:
+                continue
+            page = path.read_text(encoding="utf-8")
+            updated = _inline_chrome(page, chrome)
+            if updated != page:
+                _write_text(path, updated)
+                written += 1
+    return written
+
+
+def _fingerprinted_name(rel: str, digest: str) -> str:
+    stem, ext = posixpath.splitext(rel)
+    return f"{stem}.{digest}{ext}"
+
+
+def _iter_asset_sources(src_root: Path) -> List[str]:
+    rels = set()
+    for pattern in ASSET_GLOBS:
+        for p in src_root.glob(pattern):
+            if not p.is_file() or _FINGERPRINTED_RE.search(p.name):
+                continue
+            if p.suffix.lower() in IMAGE_SUFFIXES or p.suffix in (".css", ".js"):
+                rels.add(p.relative_to(src_root).as_posix())
+    return sorted(rels)
+
+
+def _map_css_urls(css: str, base: str, fn: Callable[[str], Optional[str]]) -> str:
+    """Replace each relative `url()` of a stylesheet in `base` with `fn(<path from the site root>)`, unless None."""
+
+    def _repl(match: re.Match[str]) -> str:
+        quote, url = match.group(1), match.group(2).strip()
+        if url.startswith(("data:", "http:", "https:", "/")) or "?" in url or "#" in url:
+            return match.group(0)
+        new = fn(posixpath.normpath(posixpath.join(base, url)))
+        return match.group(0) if new is None else f"url({quote}{new}{quote})"
+
+    return _CSS_URL_RE.sub(_repl, css)
+
+
+def _rewrite_css_urls(css: str, css_rel: str, assets: Dict[str, str]) -> str:
+    """Point relative `url()`s at fingerprinted copies (the CSS copy sits next to the original)."""
+    base = posixpath.dirname(css_rel)
+    return _map_css_urls(css, base, lambda t: posixpath.relpath(assets[t], base or ".") if t in assets else None)
+
+
+def build_assets(src_root: Path, *, enabled: bool) -> Dict[str, str]:
+    """Write content-hashed copies of the site's assets; return {path: fingerprinted path} under src_root.
+
+    Copies sit next to their originals as `<name>.<hash>.<ext>`. CSS is hashed after its `url()`s are
+    rewritten, so a changed image also changes every stylesheet that uses it. Copies that are no longer
+    current are removed; when `enabled` is False, all of them and the asset manifest are removed.
+    """
+    manifest_path = src_root / ASSET_MANIFEST_NAME
+    try:
+        previous = dict(_read_json(manifest_path).get("assets") or {})
+    except Exception:
+        previous = {}
+
+    assets: Dict[str, str] = {}
+    if enabled:
+        # Stylesheets last: they reference images.
+        for rel in sorted(_iter_asset_sources(src_root), key=lambda r: r.endswith(".css")):
+            src = src_root / rel
+            if rel.endswith(".css"):
+                data = _rewrite_css_urls(src.read_text(encoding="utf-8"), rel, assets).encode("utf-8")
+                assets[rel] = _fingerprinted_name(rel, hashlib.sha256(data).hexdigest()[:10])
+                if not (src_root / assets[rel]).exists():
+                    (src_root / assets[rel]).write_bytes(data)
+                continue
+            with src.open("rb") as f:
+                assets[rel] = _fingerprinted_name(rel, hashlib.file_digest(f, "sha256").hexdigest()[:10])
+            dst = src_root / assets[rel]
+            if not dst.exists():
+                try:
+                    os.link(src, dst)
+                except OSError:
+                    shutil.copyfile(src, dst)
+        _write_text(manifest_path, json.dumps({"version": 1, "assets": assets}, indent=2, sort_keys=True) + "\n")
+    elif manifest_path.exists():
+        manifest_path.unlink()
+
+    for stale in set(previous.values()) - set(assets.values()):
+        (src_root / stale).unlink(missing_ok=True)
+    return assets
+
+
+def _detail_doc(
+    kind: str,
+    item: Item,
+    *,
+    output_dir: Path,
+    assets: Optional[Dict[str, str]] = None,
+    chrome: Optional[Chrome] = None,
+    styles: Optional[Stylesheets] = None,
+) -> List[str]:
+    if kind == "people":
+        body = _person_detail(item, output_dir=output_dir, assets=assets)
+    else:
+        body = _concept_or_influence_detail(kind, item)
+    return _doc_parts(
+        item.display_name, body, asset_prefix="../", root_prefix="../", assets=assets, chrome=chrome, styles=styles
+    )
+
+
+DetailTask = Tuple[str, Item, Path, Optional[str], Dict[str, str], Optional[Chrome], Optional[Stylesheets]]
+
+
+def _render_detail_task(task: DetailTask) -> Tuple[str, bool]:
+    """Hash, and if needed render and write, one detail page. Returns (input hash, rendered)."""
+    kind, item, output_path, previous_digest, assets, chrome, styles = task
+    digest = _item_inputs_hash(item, output_path, assets, chrome, styles)
+    if previous_digest == digest and output_path.exists():
+        return digest, False
+    page = _detail_doc(kind, item, output_dir=output_path.parent, assets=assets, chrome=chrome, styles=styles)
+    _write_parts(output_path, page)
+    return digest, True
+
+
+def _detail_rel(kind: str, item_id: str) -> str:
+    return f"{kind}/{_safe_filename(item_id)}.html"
+
+
+# (kind, details path, position in _iter_details order, previous input hash of the page named after
+# the item's folder, src root, assets, chrome, stylesheets)
+ItemTask = Tuple[str, Path, int, Optional[str], Path, Dict[str, str], Optional[Chrome], Optional[Stylesheets]]
+ItemResult = Tuple[IndexEntry, Tuple[str, ...], str, bool, List[str]]
+
+
+def _build_item(task: ItemTask) -> Optional[ItemResult]:
+    """Parse one item, write its detail page if its inputs changed, and keep only its index entry.
+
+    Returns (entry, search terms, input hash, rendered, fragment hashes read), or None for malformed details.
+    The item itself and its fragments are dropped before the next task, so memory follows the largest
+    item rather than the corpus.
+    """
+    kind, details_path, order, previous_digest, src_root, assets, chrome, styles = task
+    item = _parse_item_or_none((kind, details_path))
+    if item is None:
+        return None
+    rel = _detail_rel(kind, item.item_id)
+    if rel != _detail_rel(kind, details_path.parent.name):
+        previous_digest = None  # the hash was looked up for another page
+    digest, rendered = _render_detail_task((kind, item, src_root / rel, previous_digest, assets, chrome, styles))
+    return IndexEntry.of(item, order), _search_terms(item), digest, rendered, _fragments.release()
+
+
+def _index_doc(
+    kind: str,
+    items: List[IndexEntry],
+    *,
+    src_root: Path,
+    assets: Optional[Dict[str, str]] = None,
+    chrome: Optional[Chrome] = None,
+    styles: Optional[Stylesheets] = None,
+) -> str:
+    if kind == "people":
+        return _doc(
+            "People",
+            _people_index(items, output_dir=src_root / "people", assets=assets),
+            scripts_html=_search_script("people", "people-grid", ".person-card", assets=assets),
+            asset_prefix="../",
+            root_prefix="../",
+            assets=assets,
+            chrome=chrome,
+            styles=styles,
+        )
+    title, subtitle = {
+        "influences": ("Influences", "Learn how the People in the Book of Mormon Influenced the Messages of Others"),
+        "concepts": ("Concepts", "Explore key concepts and phrases in the Book of Mormon"),
+    }[kind]
+    return _doc(
+        title,
+        _list_index(kind, title, subtitle, items, enable_search=True),
+        scripts_html=_search_script(kind, f"{kind}-list", ".list-row", assets=assets),
+        asset_prefix="../",
+        root_prefix="../",
+        assets=assets,
+        chrome=chrome,
+        styles=styles,
+    )
+
+
+def _unique_outputs(items: List[IndexEntry]) -> List[Tuple[str, IndexEntry]]:
+    # Later items win on filename collisions, matching the order pages used to be overwritten in.
+    by_name: Dict[str, IndexEntry] = {}
+    for it in items:
+        by_name[f"{_safe_filename(it.item_id)}.html"] = it
+    return list(by_name.items())
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(
         description=(
             "Generate People/Influences/Concepts index + detail pages from docs/content. "
-            "Outputs HTML files into docs/people/, docs/concepts/, and docs/influences/."
+            "Outputs HTML files into docs/people/, docs/concepts/, and docs/influences/. "
+            f"Only pages whose inputs changed since the last run (tracked in <src-root>/{MANIFEST_NAME}) are rewritten."
         )
     )
     parser.add_argument(
@@ -496,138 +1239,207 @@ def main(argv: Optional[List[str]] = None) -> int:
         default=str(SRC_ROOT / "content"),
         help="Path to docs/content (default: <repo>/docs/content)",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore the build manifest and regenerate every page",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for parsing/rendering items (default: 1; 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--fingerprint",
+        action="store_true",
+        help=(
+            f"Link CSS/JS/images through content-hashed copies listed in <src-root>/{ASSET_MANIFEST_NAME} "
+            "(for deploys with long-lived cache headers)"
+        ),
+    )
+    parser.add_argument(
+        "--fragment-cache",
+        default=str(FRAGMENT_CACHE),
+        help="Parsed-fragment cache directory, by content hash (default: <repo>/.cache/fragments; not read with --force)",
+    )
+    parser.add_argument("--no-fragment-cache", action="store_true", help="Neither read nor write the fragment cache")
     args = parser.parse_args(argv)
 
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if jobs == 1:
+        return _generate(args, map)
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_use_fragment_cache, initargs=(_fragment_cache_path(args), not args.force)
+    ) as pool:
+        return _generate(args, lambda fn, tasks: pool.map(fn, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+
+
+def _fragment_cache_path(args: argparse.Namespace) -> Optional[Path]:
+    return None if args.no_fragment_cache else Path(args.fragment_cache)
+
+
+def _use_fragment_cache(path: Optional[Path], read: bool) -> None:
+    global _fragments
+    _fragments = FragmentCache(path, read=read)
+
+
+def _generate(args: argparse.Namespace, mapper: Mapper) -> int:
     src_root = Path(args.src_root).resolve()
     data_root = Path(args.data_root).resolve()
+    _use_fragment_cache(_fragment_cache_path(args), not args.force)
 
     people_root = data_root / "people"
     concepts_root = data_root / "concepts"
     influences_root = data_root / "influences"
 
-    _remove_generated(src_root)
-
-    # Clear subdir outputs to avoid stale pages.
-    for out_subdir in ("people", "concepts", "influences"):
-        out_dir = src_root / out_subdir
-        out_dir.mkdir(parents=True, exist_ok=True)
-        for p in out_dir.glob("*.html"):
-            try:
-                p.unlink()
-            except Exception:
-                pass
-
-    people = _collect_items("people", people_root)
-    concepts = _collect_items("concepts", concepts_root)
-    influences = _collect_items("influences", influences_root)
-
-    # Index pages
-    _write_text(
-        src_root / "people" / "index.html",
-        _doc(
-            "People",
-            _people_index(people, output_dir=src_root / "people"),
-            scripts_html=_people_search_script(),
-            asset_prefix="../",
-            root_prefix="../",
-        ),
-    )
-    _write_text(
-        src_root / "influences" / "index.html",
-        _doc(
-            "Influences",
-            _list_index(
-                "influences",
-                "Influences",
-                "Learn how the People in the Book of Mormon Influenced the Messages of Others",
-                influences,
-                enable_search=True,
-            ),
-            scripts_html=_list_search_script("influences"),
-            asset_prefix="../",
-            root_prefix="../",
-        ),
-    )
-    _write_text(
-        src_root / "concepts" / "index.html",
-        _doc(
-            "Concepts",
-            _list_index(
-                "concepts",
-                "Concepts",
-                "Explore key concepts and phrases in the Book of Mormon",
-                concepts,
-                enable_search=True,
-            ),
-            scripts_html=_list_search_script("concepts"),
-            asset_prefix="../",
-            root_prefix="../",
-        ),
+    previous = None if args.force else _load_manifest(src_root)
+
+    if previous is None:
+        # No usable manifest: fall back to a full rebuild and clear stale outputs.
+        _remove_generated(src_root)
+        for out_subdir in ("people", "concepts", "influences"):
+            out_dir = src_root / out_subdir
+            out_dir.mkdir(parents=True, exist_ok=True)
+            for p in out_dir.glob("*.html"):
+                try:
+                    p.unlink()
+                except Exception:
+                    pass
+        for p in (src_root / PERSON_DATA_DIR).glob("*.json"):
+            p.unlink()
+    else:
+        for out_subdir in ("people", "concepts", "influences"):
+            (src_root / out_subdir).mkdir(parents=True, exist_ok=True)
+
+    assets = build_assets(src_root, enabled=args.fingerprint)
+    fingerprinted = len(assets)
+    # Duplicate images (asset_store.py) link their canonical copy, fingerprinted if that is.
+    aliases = load_aliases(src_root)
+    assets = {**assets, **{rel: assets.get(canonical, canonical) for rel, canonical in aliases.items()}}
+    chrome = load_chrome(src_root)
+    styles = load_stylesheets(src_root)
+    explore = load_explore_widgets(src_root)
+
+    # Items stream through _build_item: each is parsed, its detail page written if stale, and only its
+    # IndexEntry kept for the index pages, search indexes and person data below (its search terms wait
+    # in a TermSpill, and fragment cache entries go straight to disk).
+    tasks: List[ItemTask] = []
+    for kind, root in (("people", people_root), ("influences", influences_root), ("concepts", concepts_root)):
+        for order, details_path in enumerate(_iter_details(kind, root)):
+            previous_digest = (previous or {}).get(_detail_rel(kind, details_path.parent.name))
+            tasks.append((kind, details_path, order, previous_digest, src_root, assets, chrome, styles))
+
+    entries: Dict[str, List[IndexEntry]] = {"people": [], "influences": [], "concepts": []}
+    current: Dict[str, str] = {}
+    built: Dict[str, Tuple[IndexEntry, bool]] = {}  # detail page -> (last item written to it, rendered)
+    collided: Set[str] = set()
+    spill = TermSpill()
+    for result in mapper(_build_item, tasks):
+        if result is None:
+            continue
+        entry, terms, digest, wrote, fragments_read = result
+        _fragments.merge(fragments_read)
+        spill.add(entry, terms)
+        entries[entry.kind].append(entry)
+        rel = _detail_rel(entry.kind, entry.item_id)
+        if rel in built:
+            collided.add(rel)
+        built[rel] = (entry, wrote)
+        current[rel] = digest
+
+    for items in entries.values():
+        items.sort(key=lambda x: (x.display_name.lower(), x.order))
+    rendered = sum(wrote for _, wrote in built.values())
+    unchanged = len(built) - rendered
+    # Later items (in index order) win on filename collisions; rewrite those pages from the winner.
+    for kind, items in entries.items():
+        for fname, it in _unique_outputs(items):
+            rel = f"{kind}/{fname}"
+            if rel not in collided:
+                continue
+            item = _parse_item(kind, it.details_path)
+            digest, _ = _render_detail_task((kind, item, src_root / rel, None, assets, chrome, styles))
+            current[rel] = digest
+            if not built[rel][1]:
+                rendered += 1
+                unchanged -= 1
+
+    def _emit(rel: str, content: str) -> None:
+        nonlocal rendered, unchanged
+        digest = _content_hash(content)
+        current[rel] = digest
+        if previous is not None and previous.get(rel) == digest and (src_root / rel).exists():
+            unchanged += 1
+            return
+        _write_text(src_root / rel, content)
+        rendered += 1
+
+    people, concepts, influences = entries["people"], entries["concepts"], entries["influences"]
+    # Index pages are cheap to render; compare their output instead of their inputs.
+    for kind, items in (("people", people), ("influences", influences), ("concepts", concepts)):
+        page = _index_doc(kind, items, src_root=src_root, assets=assets, chrome=chrome, styles=styles)
+        _emit(f"{kind}/index.html", page)
+    search_index, search_text = _search_indexes(
+        [("people", people), ("concepts", concepts), ("influences", influences)], spill.get
     )
+    spill.close()
+    _emit(SEARCH_INDEX_NAME, search_index)
+    _emit(SEARCH_TEXT_NAME, search_text)
+    (src_root / PERSON_DATA_DIR).mkdir(parents=True, exist_ok=True)
+    for fname, it in _unique_outputs(people):
+        slug = fname[: -len(".html")]
+        _emit(f"{PERSON_DATA_DIR}/{slug}.json", _person_data(it, slug, src_root=src_root, explore=explore, assets=assets))
+
+    inlined = inline_hand_authored_chrome(src_root, chrome) if chrome is not None else 0
+
+    removed = 0
+    for rel in sorted(set(previous or {}) - set(current)):
+        try:
+            (src_root / rel).unlink()
+            removed += 1
+        except FileNotFoundError:
+            pass
 
-    # Detail pages
-    for it in people:
-        fname = f"{_safe_filename(it.item_id)}.html"
-        _write_text(
-            src_root / "people" / fname,
-            _doc(it.display_name, _person_detail(it, output_dir=src_root / "people"), asset_prefix="../", root_prefix="../"),
-        )
-
-    for it in influences:
-        fname = f"{_safe_filename(it.item_id)}.html"
-        _write_text(
-            src_root / "influences" / fname,
-            _doc(it.display_name, _concept_or_influence_detail("influences", it), asset_prefix="../", root_prefix="../"),
-        )
-
-    for it in concepts:
-        fname = f"{_safe_filename(it.item_id)}.html"
-        _write_text(
-            src_root / "concepts" / fname,
-            _doc(it.display_name, _concept_or_influence_detail("concepts", it), asset_prefix="../", root_prefix="../"),
-        )
+    _save_manifest(src_root, current)
+    # Every fragment was read for the search indexes, so anything else in the cache is gone.
+    _fragments.prune(keep=_fragments.seen())
 
     print(f"Wrote: people={len(people)} concepts={len(concepts)} influences={len(influences)}")
+    print(f"Pages: rendered={rendered} unchanged={unchanged} removed={removed} chrome-inlined={inlined}")
+    if fingerprinted:
+        print(f"Assets: {fingerprinted} fingerprinted ({ASSET_MANIFEST_NAME})")
     return 0
 
 
-def _people_search_script() -> str:
-    # Minimal client-side filter (no external deps).
+def _search_script(kind: str, container_id: str, row_selector: str, *, assets: Optional[Dict[str, str]] = None) -> str:
+    # Filter rows through js/search.js (names, then full text); plain substring match on data-name if the
+    # index cannot be loaded.
+    src = "../" + (assets or {}).get("js/search.js", "js/search.js")
     return (
+        f"<script src=\"{html.escape(src)}\"></script>\n"
         "<script>\n"
         "(function(){\n"
-        "  var input = document.getElementById('people-search');\n"
-        "  var grid = document.getElementById('people-grid');\n"
-        "  if(!input || !grid) return;\n"
-        "  input.addEventListener('input', function(){\n"
-        "    var q = (input.value || '').toLowerCase().trim();\n"
-        "    var cards = grid.querySelectorAll('.person-card');\n"
-        "    for (var i=0;i<cards.length;i++){\n"
-        "      var name = cards[i].getAttribute('data-name') || '';\n"
-        "      cards[i].style.display = (!q || name.indexOf(q) !== -1) ? '' : 'none';\n"
-        "    }\n"
-        "  });\n"
-        "})();\n"
-        "</script>"
-    )
-
-
-def _list_search_script(kind: str) -> str:
-    input_id = f"{kind}-search"
-    list_id = f"{kind}-list"
-    return (
-        "<script>\n"
-        "(function(){\n"
-        f"  var input = document.getElementById('{input_id}');\n"
-        f"  var list = document.getElementById('{list_id}');\n"
+        f"  var input = document.getElementById('{kind}-search');\n"
+        f"  var list = document.getElementById('{container_id}');\n"
         "  if(!input || !list) return;\n"
-        "  input.addEventListener('input', function(){\n"
-        "    var q = (input.value || '').toLowerCase().trim();\n"
-        "    var rows = list.querySelectorAll('.list-row');\n"
+        "  var latest = 0;\n"
+        "  function apply(show){\n"
+        f"    var rows = list.querySelectorAll('{row_selector}');\n"
         "    for (var i=0;i<rows.length;i++){\n"
-        "      var name = rows[i].getAttribute('data-name') || '';\n"
-        "      rows[i].style.display = (!q || name.indexOf(q) !== -1) ? '' : 'none';\n"
+        "      rows[i].style.display = show(rows[i]) ? '' : 'none';\n"
         "    }\n"
+        "  }\n"
+        "  input.addEventListener('input', function(){\n"
+        "    var q = (input.value || '').toLowerCase().trim();\n"
+        "    var seq = ++latest;\n"
+        f"    BomexSearch.search('../', q, {{ kind: '{kind}', fullText: true }}).then(function(slugs){{\n"
+        "      if (seq !== latest) return;\n"
+        "      apply(function(row){ return !slugs || slugs[row.getAttribute('href').replace(/\\.html$/, '')]; });\n"
+        "    }).catch(function(){\n"
+        "      if (seq !== latest) return;\n"
+        "      apply(function(row){ return !q || (row.getAttribute('data-name') || '').indexOf(q) !== -1; });\n"
+        "    });\n"
         "  });\n"
         "})();\n"
         "</script>"
@@ -2,11 +2,12 @@
 
 import argparse
 import json
-import shutil
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from asset_store import place
+
 
 @dataclass
 class ImageRef:
@@ -142,11 +143,8 @@ def process_person(
     if dry_run:
         return True, "dry-run"
 
-    # Copy first, then optionally delete (move).
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dst)
-    if delete_source:
-        src.unlink()
+    # A rename when moving; a reflink rather than a byte copy when copying, where the filesystem allows.
+    place(src, dst, move=delete_source)
 
     for r in refs:
         if _pick_source_filename(r.value):
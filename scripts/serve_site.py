@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""Serve docs/ locally the way a production static host would.
+
+Unlike `python -m http.server`, this server:
+
+- handles each connection on its own thread, with HTTP/1.1 keep-alive;
+- sends the `.br`/`.gz` sibling written by `bomex.py compress` when the client accepts it (and the
+  manifest lists it, or it is at least as new as the file);
+- sends `ETag` (the content hash from `docs/.static-manifest.json`, or mtime/size for files the
+  manifest doesn't know), `Last-Modified` and `Cache-Control`, and answers conditional requests with
+  304. Fingerprinted copies (`main.<hash>.css`) are cacheable for a year; everything else is revalidated;
+- answers single `Range` requests (and `If-Range`) with 206, for video and large widget data;
+- logs every request with status, bytes sent, encoding and latency.
+
+Usage:
+    uv run scripts/bomex.py serve --port 8008
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from compress_site import COMPRESSIBLE_SUFFIXES, MANIFEST_NAME, SUFFIXES, content_type, load_manifest, sibling
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DOCS_ROOT = REPO_ROOT / "docs"
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+CHUNK_SIZE = 256 * 1024
+_FINGERPRINTED_RE = re.compile(r"\.[0-9a-f]{10}\.[^./]+$")  # generate_content_pages.py --fingerprint
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class _Manifest:
+    """docs/.static-manifest.json, reloaded when the compress step rewrites it."""
+
+    def __init__(self, docs_root: Path) -> None:
+        self.path = docs_root / MANIFEST_NAME
+        self._lock = threading.Lock()
+        self._mtime_ns = -1
+        self._files: Dict[str, Dict[str, Any]] = {}
+
+    def get(self, rel: str) -> Optional[Dict[str, Any]]:
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        with self._lock:
+            if mtime_ns != self._mtime_ns:
+                self._files = load_manifest(self.path.parent).get("files", {}) if mtime_ns else {}
+                self._mtime_ns = mtime_ns
+            return self._files.get(rel)
+
+
+def _accepted(header: str) -> Dict[str, float]:
+    """Accept-Encoding -> {coding: q}."""
+    accepted: Dict[str, float] = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        m = re.search(r"q=([0-9.]+)", params)
+        if m:
+            try:
+                q = float(m.group(1))
+            except ValueError:
+                q = 0.0
+        if coding:
+            accepted[coding.lower()] = q
+    return accepted
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Inclusive (start, end) of a single `bytes=` range; (size, size) if unsatisfiable, None to ignore."""
+    m = _RANGE_RE.match(header.strip())
+    if not m or m.group(1) == m.group(2) == "":
+        return None  # multiple ranges or another unit: send the whole file
+    if m.group(1) == "":
+        length = int(m.group(2))
+        return (max(0, size - length), size - 1) if length and size else (size, size)
+    start = int(m.group(1))
+    end = min(int(m.group(2)), size - 1) if m.group(2) else size - 1
+    return (start, end) if start <= end else (size, size)
+
+
+class StaticHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    manifest: _Manifest
+    quiet = False
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def log_request(self, code: Any = "-", size: Any = "-") -> None:
+        self._status = int(code) if str(code).isdigit() else 0
+
+    def handle_one_request(self) -> None:
+        self._started = time.perf_counter()
+        self._status = 0
+        self._sent = 0
+        self._encoding = ""
+        super().handle_one_request()
+        if self._status and not self.quiet:
+            elapsed_ms = (time.perf_counter() - self._started) * 1000
+            encoding = f" {self._encoding}" if self._encoding else ""
+            print(
+                f"{self.command} {self.path} {self._status} {self._sent}B{encoding} {elapsed_ms:.1f} ms",
+                file=sys.stderr,
+                flush=True,
+            )
+
+    def do_GET(self) -> None:
+        self._serve(head=False)
+
+    def do_HEAD(self) -> None:
+        self._serve(head=True)
+
+    def _serve(self, *, head: bool) -> None:
+        url_path = unquote(urlsplit(self.path).path)
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            if not url_path.endswith("/"):
+                self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+                self.send_header("Location", urlsplit(self.path)._replace(path=url_path + "/").geturl())
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if not (path / "index.html").is_file():
+                # Directory listing
+                if head:
+                    super().do_HEAD()
+                else:
+                    super().do_GET()
+                return
+            path = path / "index.html"
+        try:
+            st = path.stat()
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return
+        if not path.is_file():
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return
+
+        rel = path.relative_to(Path(self.directory).resolve()).as_posix()
+        entry = self.manifest.get(rel)
+        if entry and (entry.get("size"), entry.get("mtime_ns")) != (st.st_size, st.st_mtime_ns):
+            entry = None  # edited since the compress step ran
+        tag = entry["hash"] if entry else f"{st.st_mtime_ns:x}-{st.st_size:x}"
+
+        # Content negotiation: best accepted sibling the manifest lists (or, without an entry, that is not
+        # older than the file). Ranges always address the identity encoding.
+        encoding = ""
+        body_path, body_size = path, st.st_size
+        range_header = self.headers.get("Range")
+        if not range_header:
+            accepted = _accepted(self.headers.get("Accept-Encoding", ""))
+            candidates = entry["encodings"] if entry else SUFFIXES
+            for enc in SUFFIXES:
+                if enc not in candidates or accepted.get(enc, 0) <= 0:
+                    continue
+                try:
+                    sib = sibling(path, enc).stat()
+                except OSError:
+                    continue
+                if entry or sib.st_mtime_ns >= st.st_mtime_ns:
+                    encoding, body_path, body_size = enc, sibling(path, enc), sib.st_size
+                    break
+        etag = f'"{tag}-{encoding}"' if encoding else f'"{tag}"'
+
+        headers: List[Tuple[str, str]] = [
+            ("Content-Type", entry["type"] if entry else content_type(path)),
+            ("ETag", etag),
+            ("Last-Modified", formatdate(st.st_mtime, usegmt=True)),
+            ("Cache-Control", IMMUTABLE if _FINGERPRINTED_RE.search(path.name) else REVALIDATE),
+            ("Accept-Ranges", "bytes"),
+        ]
+        if path.suffix.lower() in COMPRESSIBLE_SUFFIXES:
+            headers.append(("Vary", "Accept-Encoding"))
+
+        if self._not_modified(etag, st.st_mtime):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            for name, value in headers:
+                if name != "Content-Type":
+                    self.send_header(name, value)
+            self.end_headers()
+            return
+
+        start, end = 0, body_size - 1
+        status = HTTPStatus.OK
+        if range_header and self._if_range_matches(etag, st.st_mtime):
+            span = _parse_range(range_header, body_size)
+            if span is not None and span[0] >= body_size:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{body_size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if span is not None:
+                start, end = span
+                status = HTTPStatus.PARTIAL_CONTENT
+                headers.append(("Content-Range", f"bytes {start}-{end}/{body_size}"))
+
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(max(0, end - start + 1)))
+        self.end_headers()
+        self._encoding = encoding
+        if head:
+            return
+        try:
+            with body_path.open("rb") as f:
+                f.seek(start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    chunk = f.read(min(CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+                    self._sent += len(chunk)
+                    remaining -= len(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _not_modified(self, etag: str, mtime: float) -> bool:
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+            return "*" in tags or etag in tags
+        return self._not_modified_since(self.headers.get("If-Modified-Since"), mtime)
+
+    def _if_range_matches(self, etag: str, mtime: float) -> bool:
+        if_range = self.headers.get("If-Range")
+        if if_range is None:
+            return True
+        if if_range.startswith(('"', "W/")):
+            return if_range == etag
+        return self._not_modified_since(if_range, mtime)
+
+    @staticmethod
+    def _not_modified_since(value: Optional[str], mtime: float) -> bool:
+        if not value:
+            return False
+        try:
+            return int(mtime) <= parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError):
+            return False
+
+
+def make_server(docs_root: Path, host: str, port: int, *, quiet: bool = False) -> ThreadingHTTPServer:
+    handler = type("Handler", (StaticHandler,), {"manifest": _Manifest(docs_root), "quiet": quiet})
+    server = ThreadingHTTPServer((host, port), partial(handler, directory=str(docs_root)))
+    server.daemon_threads = True
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Serve docs/ with precompressed siblings, cache validators, Range support and request timing."
+    )
+    parser.add_argument(
+        "--docs-root",
+        default=str(DOCS_ROOT),
+        help="Site root to serve (default: <repo>/docs)",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8008, help="Port (default: 8008)")
+    parser.add_argument("--quiet", action="store_true", help="Don't log requests")
+    args = parser.parse_args(argv)
+
+    docs_root = Path(args.docs_root).resolve()
+    if not docs_root.is_dir():
+        print(f"Not a directory: {docs_root}")
+        return 2
+    server = make_server(docs_root, args.host, args.port, quiet=args.quiet)
+    if not (docs_root / MANIFEST_NAME).exists():
+        print("No static manifest: run `bomex.py compress` first to serve precompressed files and content-hash ETags.")
+    print(f"Serving {docs_root} at http://{args.host}:{args.port}/. Ctrl+C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""Watch docs/content and regenerate only the pages affected by each save.
+
+Keeps a reverse-dependency graph in memory:
+
+    fragment *.html -> owning *-details.json -> docs/<kind>/<id>.html
+    *-details.json  -> docs/<kind>/index.html
+
+Any changed item also rewrites search-index.json and search-text.json (from each item's cached
+search terms), and a changed person their data/people/<id>.json. Like a full build, outputs whose
+inputs or content are unchanged are not rewritten, so a save that changes nothing triggers no reload.
+
+Polling (stdlib only) keeps this dependency-free; a scan of docs/content is a few hundred `stat`
+calls, so the default 100 ms interval rebuilds well within a second of a save.
+
+Usage:
+    uv run scripts/bomex.py watch
+    uv run scripts/bomex.py watch --serve 8008
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import generate_content_pages as gen
+from asset_store import load_aliases
+
+
+KINDS = ("people", "concepts", "influences")
+DETAILS_NAMES = {
+    "person-details.json": "people",
+    "concept-details.json": "concepts",
+    "influence-details.json": "influences",
+}
+
+RELOAD_PATH = "/__reload"
+RELOAD_SCRIPT = (
+    "<script>new EventSource('" + RELOAD_PATH + "').onmessage = function(){ location.reload(); };</script>"
+)
+
+
+def _scan(data_root: Path) -> Dict[Path, Tuple[int, int]]:
+    """Return {path: (mtime_ns, size)} for every details JSON and fragment under data_root."""
+    found: Dict[Path, Tuple[int, int]] = {}
+    stack = [data_root / kind for kind in KINDS]
+    while stack:
+        try:
+            entries = list(os.scandir(stack.pop()))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(Path(entry.path))
+            elif entry.name.endswith((".html", ".json")):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                found[Path(entry.path).resolve()] = (st.st_mtime_ns, st.st_size)
+    return found
+
+
+class ContentGraph:
+    """In-memory item set plus fragment -> details reverse index."""
+
+    def __init__(self, src_root: Path, data_root: Path) -> None:
+        self.src_root = src_root
+        self.data_root = data_root
+        self.items: Dict[Path, gen.Item] = {}
+        self.terms: Dict[Path, Tuple[str, ...]] = {}  # full-text search tokens per item
+        self.fragment_owners: Dict[Path, Set[Path]] = {}
+        self.manifest: Dict[str, str] = gen._load_manifest(src_root) or {}
+        # Duplicate images link their canonical copy (asset_store.py), as in a full build without --fingerprint.
+        self.assets = load_aliases(src_root)
+        self.chrome = gen.load_chrome(src_root)
+        self.styles = gen.load_stylesheets(src_root)
+        self.explore = gen.load_explore_widgets(src_root)
+
+    def load(self) -> None:
+        for kind in KINDS:
+            for details_path in gen._iter_details(kind, self.data_root / kind):
+                self._set_item(details_path.resolve(), kind)
+
+    def _set_item(self, details_path: Path, kind: str) -> Optional[gen.Item]:
+        self._drop_item(details_path)
+        item = gen._parse_item_or_none((kind, details_path))
+        if item is None:
+            return None
+        self.items[details_path] = item
+        self.terms[details_path] = gen._search_terms(item)
+        for page in item.pages:
+            for sec in page.sections:
+                self.fragment_owners.setdefault(sec.html_fragment_path, set()).add(details_path)
+        return item
+
+    def _drop_item(self, details_path: Path) -> Optional[gen.Item]:
+        item = self.items.pop(details_path, None)
+        self.terms.pop(details_path, None)
+        if item is not None:
+            for page in item.pages:
+                for sec in page.sections:
+                    owners = self.fragment_owners.get(sec.html_fragment_path)
+                    if owners is not None:
+                        owners.discard(details_path)
+                        if not owners:
+                            del self.fragment_owners[sec.html_fragment_path]
+        return item
+
+    def _kind_items(self, kind: str) -> List[gen.IndexEntry]:
+        # Same order as _generate: by name, ties in _iter_details (sorted path) order.
+        paths = sorted(p for p, it in self.items.items() if it.kind == kind)
+        items = [gen.IndexEntry.of(self.items[p], order) for order, p in enumerate(paths)]
+        items.sort(key=lambda x: (x.display_name.lower(), x.order))
+        return items
+
+    def _write(self, rel: str, content: str) -> bool:
+        digest = gen._content_hash(content)
+        path = self.src_root / rel
+        if self.manifest.get(rel) == digest and path.exists():
+            return False
+        gen._write_text(path, content)
+        self.manifest[rel] = digest
+        return True
+
+    def _render_detail(self, item: gen.Item) -> Optional[str]:
+        rel = f"{item.kind}/{gen._safe_filename(item.item_id)}.html"
+        output_path = self.src_root / rel
+        task = (item.kind, item, output_path, self.manifest.get(rel), self.assets, self.chrome, self.styles)
+        digest, rendered = gen._render_detail_task(task)
+        self.manifest[rel] = digest
+        return rel if rendered else None
+
+    def _write_person_data(self, item: gen.Item) -> Optional[str]:
+        slug = gen._safe_filename(item.item_id)
+        rel = f"{gen.PERSON_DATA_DIR}/{slug}.json"
+        content = gen._person_data(
+            gen.IndexEntry.of(item), slug, src_root=self.src_root, explore=self.explore, assets=self.assets
+        )
+        return rel if self._write(rel, content) else None
+
+    def _remove_output(self, item: gen.Item) -> str:
+        rel = f"{item.kind}/{gen._safe_filename(item.item_id)}.html"
+        rels = [rel, f"{gen.PERSON_DATA_DIR}/{gen._safe_filename(item.item_id)}.json"] if item.kind == "people" else [rel]
+        for r in rels:
+            try:
+                (self.src_root / r).unlink()
+            except FileNotFoundError:
+                pass
+            self.manifest.pop(r, None)
+        return rel
+
+    def apply(self, changed: Set[Path]) -> List[str]:
+        """Update the graph for the changed paths and regenerate affected outputs."""
+        dirty_details: Dict[Path, Optional[gen.Item]] = {}
+        dirty_kinds: Set[str] = set()
+        outputs: List[str] = []
+
+        for path in changed:
+            kind = DETAILS_NAMES.get(path.name)
+            if kind is not None:
+                # Details feed both the detail page and the index (names, images, ids).
+                dirty_details[path] = self.items.get(path)
+                dirty_kinds.add(kind)
+            else:
+                for owner in self.fragment_owners.get(path, ()):
+                    dirty_details.setdefault(owner, self.items.get(owner))
+
+        for details_path in sorted(dirty_details):
+            old = dirty_details[details_path]
+            if details_path.exists():
+                item = self._set_item(details_path, DETAILS_NAMES[details_path.name])
+            else:
+                self._drop_item(details_path)
+                item = None
+            if old is not None and (item is None or old.item_id != item.item_id):
+                outputs.append(f"removed {self._remove_output(old)}")
+            if item is not None:
+                detail = self._render_detail(item)
+                if detail:
+                    outputs.append(detail)
+                if item.kind == "people":
+                    person_data = self._write_person_data(item)
+                    if person_data:
+                        outputs.append(person_data)
+
+        for kind in sorted(dirty_kinds):
+            rel = f"{kind}/index.html"
+            page = gen._index_doc(
+                kind,
+                self._kind_items(kind),
+                src_root=self.src_root,
+                assets=self.assets,
+                chrome=self.chrome,
+                styles=self.styles,
+            )
+            if self._write(rel, page):
+                outputs.append(rel)
+
+        if dirty_details:
+            # Names feed the name index and fragments the full-text index; both cover every item.
+            groups = [(kind, self._kind_items(kind)) for kind in gen.SEARCH_KINDS]
+            search_index, search_text = gen._search_indexes(groups, lambda it: self.terms[it.details_path])
+            for rel, content in ((gen.SEARCH_INDEX_NAME, search_index), (gen.SEARCH_TEXT_NAME, search_text)):
+                if self._write(rel, content):
+                    outputs.append(rel)
+
+        gen._save_manifest(self.src_root, self.manifest)
+        return outputs
+
+
+class _ReloadBroker:
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self.generation = 0
+
+    def notify(self) -> None:
+        with self._cond:
+            self.generation += 1
+            self._cond.notify_all()
+
+    def wait(self, seen: int, timeout: float) -> int:
+        with self._cond:
+            self._cond.wait_for(lambda: self.generation != seen, timeout=timeout)
+            return self.generation
+
+
+class _DevHandler(SimpleHTTPRequestHandler):
+    broker: _ReloadBroker
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if self.path == RELOAD_PATH:
+            self._stream_reloads()
+            return
+        path = Path(self.translate_path(self.path))
+        if path.is_dir() and self.path.split("?", 1)[0].endswith("/"):
+            path = path / "index.html"
+        if path.suffix == ".html" and path.is_file():
+            body = path.read_bytes().replace(b"</body>", RELOAD_SCRIPT.encode("utf-8") + b"\n</body>", 1)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        super().do_GET()
+
+    def _stream_reloads(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        seen = self.broker.generation
+        try:
+            while True:
+                current = self.broker.wait(seen, timeout=15.0)
+                # Comment lines keep idle connections alive; data lines trigger a reload.
+                self.wfile.write(b"data: reload\n\n" if current != seen else b": ping\n\n")
+                self.wfile.flush()
+                seen = current
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+
+def _start_server(src_root: Path, port: int, broker: _ReloadBroker) -> ThreadingHTTPServer:
+    handler = type("DevHandler", (_DevHandler,), {"broker": broker})
+    server = ThreadingHTTPServer(("127.0.0.1", port), partial(handler, directory=str(src_root)))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Watch docs/content and regenerate only the affected docs pages on each change."
+    )
+    parser.add_argument(
+        "--src-root",
+        default=str(gen.SRC_ROOT),
+        help="Path to docs/ (default: <repo>/docs)",
+    )
+    parser.add_argument(
+        "--data-root",
+        default=str(gen.SRC_ROOT / "content"),
+        help="Path to docs/content (default: <repo>/docs/content)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.1,
+        help="Polling interval in seconds (default: 0.1)",
+    )
+    parser.add_argument(
+        "--serve",
+        type=int,
+        metavar="PORT",
+        default=0,
+        help="Also serve <src-root> on 127.0.0.1:PORT and live-reload open pages after each rebuild",
+    )
+    args = parser.parse_args(argv)
+
+    src_root = Path(args.src_root).resolve()
+    data_root = Path(args.data_root).resolve()
+
+    # Bring outputs up to date once (incremental), then keep everything in memory.
+    rc = gen.main(["--src-root", str(src_root), "--data-root", str(data_root)])
+    if rc != 0:
+        return rc
+
+    graph = ContentGraph(src_root, data_root)
+    graph.load()
+    snapshot = _scan(data_root)
+
+    broker = _ReloadBroker()
+    server = _start_server(src_root, args.serve, broker) if args.serve else None
+    if server is not None:
+        print(f"Serving {src_root} at http://127.0.0.1:{args.serve}/")
+    print(f"Watching {data_root} ({len(graph.items)} items). Ctrl+C to stop.")
+
+    try:
+        while True:
+            time.sleep(args.interval)
+            latest = _scan(data_root)
+            changed = {p for p in snapshot.keys() | latest.keys() if snapshot.get(p) != latest.get(p)}
+            snapshot = latest
+            if not changed:
+                continue
+            started = time.perf_counter()
+            outputs = graph.apply(changed)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if outputs:
+                print(f"Rebuilt in {elapsed_ms:.1f} ms: {', '.join(outputs)}")
+                broker.notify()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server is not None:
+            server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())